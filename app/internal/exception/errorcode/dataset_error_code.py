@@ -0,0 +1,7 @@
+# app/internal/exception/errorcode/dataset_error_code.py
+from app.internal.exception.error_message import ErrorMessage
+
+DATASET_NOT_FOUND = ErrorMessage(404, "등록되지 않은 데이터셋입니다.")
+INVALID_TILE = ErrorMessage(400, "타일 좌표가 올바르지 않습니다.")
+TILE_ZOOM_TOO_LOW = ErrorMessage(400, "타일 줌 레벨이 너무 낮습니다.")
+UNKNOWN_PLACE_KIND = ErrorMessage(400, "장소 검색을 지원하지 않는 데이터셋 종류입니다.")
@@ -0,0 +1,6 @@
+# app/internal/exception/errorcode/route_search_error_code.py
+from app.internal.exception.error_message import ErrorMessage
+
+ROUTE_SEARCH_NOT_FOUND = ErrorMessage(404, "검색 조건에 맞는 경로가 없습니다.")
+INVALID_RANGE = ErrorMessage(404, "검색 범위의 최솟값이 최댓값보다 큽니다.")
+ROUTE_SEARCH_INDEX_NOT_BUILT = ErrorMessage(404, "경로 검색 색인이 아직 생성되지 않았습니다. 색인(index)을 먼저 실행해 주세요.")
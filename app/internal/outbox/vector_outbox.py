@@ -0,0 +1,29 @@
+# app/internal/outbox/vector_outbox.py
+from sqlalchemy import BigInteger, Column, DateTime, Identity, Index, Integer, String, func, text
+
+from config.database.postgres_database import Base
+
+
+class VectorOutbox(Base):
+    """
+    Postgres 변경 사항을 Milvus 색인에 반영하기 위한 outbox 테이블
+
+    서비스의 commit과 같은 트랜잭션에 기록되고, VectorOutboxWorker가 배치로 꺼내 처리한다.
+    """
+    __tablename__ = "vector_outbox"
+
+    outbox_id = Column(BigInteger, Identity(start=1, always=False), primary_key=True)
+    entity_type = Column(String(50), nullable=False)     # 예: "route"
+    entity_id = Column(Integer, nullable=False)
+    operation = Column(String(10), nullable=False)       # "upsert" | "delete"
+
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    last_error = Column(String(1024), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # 미처리 행만 빠르게 꺼내기 위한 부분 인덱스 / 보관 기간이 지난 처리 완료 행을 지우기 위한 부분 인덱스
+    __table_args__ = (
+        Index("ix_vector_outbox_pending", "outbox_id", postgresql_where=text("processed_at IS NULL")),
+        Index("ix_vector_outbox_processed", "processed_at", postgresql_where=text("processed_at IS NOT NULL")),
+    )
@@ -0,0 +1,64 @@
+# app/internal/outbox/vector_outbox_repository.py
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.internal.outbox.vector_outbox import VectorOutbox
+
+# entity_type
+ROUTE = "route"
+
+# operation
+UPSERT = "upsert"
+DELETE = "delete"
+
+
+class VectorOutboxRepository:
+    def __init__(self, database: Session) -> None:
+        # Repository는 DB 접근 전용. 트랜잭션(Commit/Rollback) 모름.
+        self.database = database
+
+    def enqueue(self, entity_type: str, entity_id: int, operation: str) -> None:
+        # 서비스의 변경과 같은 트랜잭션에 기록 → commit은 Service에서.
+        self.database.add(VectorOutbox(entity_type=entity_type, entity_id=entity_id, operation=operation))
+
+    def lock_pending(self, limit: int, max_attempts: int) -> List[VectorOutbox]:
+        # 미처리 행을 오래된 순으로 잠금. SKIP LOCKED로 여러 워커가 겹치지 않게 나눠 가진다.
+        stmt = (
+            select(VectorOutbox)
+            .where(VectorOutbox.processed_at.is_(None), VectorOutbox.attempts < max_attempts)
+            .order_by(VectorOutbox.outbox_id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(self.database.execute(stmt).scalars().all())
+
+    def mark_processed(self, outbox_ids: List[int]) -> None:
+        if outbox_ids:
+            self.database.execute(
+                update(VectorOutbox)
+                .where(VectorOutbox.outbox_id.in_(outbox_ids))
+                .values(processed_at=datetime.now(timezone.utc), last_error=None)
+            )
+
+    def mark_failed(self, outbox_ids: List[int], error: str) -> None:
+        if outbox_ids:
+            self.database.execute(
+                update(VectorOutbox)
+                .where(VectorOutbox.outbox_id.in_(outbox_ids))
+                .values(attempts=VectorOutbox.attempts + 1, last_error=error[:1024])
+            )
+
+    def delete_processed(self, before: datetime, limit: int) -> int:
+        # 처리 완료 후 before 이전인 행을 오래된 순으로 최대 limit건 삭제. 삭제한 행 수 반환.
+        expired = (
+            select(VectorOutbox.outbox_id)
+            .where(VectorOutbox.processed_at.is_not(None), VectorOutbox.processed_at < before)
+            .order_by(VectorOutbox.processed_at.asc())
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = self.database.execute(delete(VectorOutbox).where(VectorOutbox.outbox_id.in_(expired)))
+        return result.rowcount
@@ -0,0 +1,178 @@
+# app/internal/outbox/vector_outbox_worker.py
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.internal.log.log import log
+from app.internal.outbox.vector_outbox_repository import DELETE, ROUTE, UPSERT, VectorOutboxRepository
+from config.database.postgres_database import SessionLocal
+
+# .env 환경 변수 추출
+VECTOR_OUTBOX_WORKER = os.getenv('VECTOR_OUTBOX_WORKER', '0') == '1'                       # 앱 기동 시 워커 실행 여부
+VECTOR_OUTBOX_BATCH_SIZE = int(os.getenv('VECTOR_OUTBOX_BATCH_SIZE', '256'))
+VECTOR_OUTBOX_POLL_SECONDS = float(os.getenv('VECTOR_OUTBOX_POLL_SECONDS', '2'))
+VECTOR_OUTBOX_MAX_ATTEMPTS = int(os.getenv('VECTOR_OUTBOX_MAX_ATTEMPTS', '5'))
+VECTOR_OUTBOX_RETENTION_SECONDS = float(os.getenv('VECTOR_OUTBOX_RETENTION_SECONDS', '86400'))  # 처리 완료 행 보관 기간
+VECTOR_OUTBOX_PURGE_SECONDS = float(os.getenv('VECTOR_OUTBOX_PURGE_SECONDS', '600'))            # 보관 기간이 지난 행을 지우는 주기
+
+"""
+entity_type별 처리 함수: (database, upsert_ids, delete_ids) -> None
+"""
+Handler = Callable[[Session, list[int], list[int]], None]
+
+def _sync_routes(database: Session, upsert_ids: list[int], delete_ids: list[int]) -> None:
+    # Milvus/임베딩 모델은 워커가 처음 처리할 때 불러온다.
+    from app.routers.route_search.route_search_repository import RouteSearchRepository
+    from app.routers.route_search.route_search_service import RouteSearchService
+    from app.routers.routes.routes_repository import RoutesRepository
+    from app.routers.sections.sections_repository import SectionsRepository
+
+    service = RouteSearchService(database, RoutesRepository(database), SectionsRepository(database), RouteSearchRepository())
+    service.sync_routes(upsert_ids, delete_ids)
+
+HANDLERS: dict[str, Handler] = {
+    ROUTE: _sync_routes,
+}
+
+class VectorOutboxWorker:
+    """
+    요약:
+        vector_outbox 테이블을 배치로 꺼내 Milvus 색인에 반영하는 백그라운드 워커
+
+    설명:
+        - 요청 경로에서는 outbox 행만 기록하고, 임베딩/업서트는 이 워커가 비동기로 처리한다.
+        - 같은 엔티티가 배치 안에서 여러 번 바뀌었으면 마지막 연산만 반영한다.
+        - SELECT ... FOR UPDATE SKIP LOCKED로 잠그므로 여러 프로세스에서 동시에 돌려도 안전하다.
+        - 실패한 행은 attempts를 올려 다음 주기에 다시 시도하고, max_attempts에 도달하면 더 꺼내지 않는다.
+          처리 함수는 savepoint 안에서 실행하므로, DB 오류로 실패해도 실패 기록(attempts/last_error)은 commit 된다.
+        - 처리 완료 행은 retention_seconds 동안 보관한 뒤, purge_seconds 주기로 batch_size건씩 삭제한다(purge_processed).
+
+    Attributes:
+        session_factory(sessionmaker): DB 세션 생성기
+        handlers(dict[str, Handler]): entity_type별 처리 함수
+        batch_size(int): 한 번에 꺼낼 outbox 행 수
+        poll_seconds(float): 처리할 행이 없을 때 대기 시간(초)
+        max_attempts(int): 행별 최대 시도 횟수
+        retention_seconds(float): 처리 완료 행 보관 기간(초)
+        purge_seconds(float): 보관 기간이 지난 행을 지우는 주기(초)
+    """
+    def __init__(self, session_factory: sessionmaker = SessionLocal, handlers: dict[str, Handler] | None = None,
+                 batch_size: int = VECTOR_OUTBOX_BATCH_SIZE, poll_seconds: float = VECTOR_OUTBOX_POLL_SECONDS,
+                 max_attempts: int = VECTOR_OUTBOX_MAX_ATTEMPTS, retention_seconds: float = VECTOR_OUTBOX_RETENTION_SECONDS,
+                 purge_seconds: float = VECTOR_OUTBOX_PURGE_SECONDS):
+        self.session_factory = session_factory
+        self.handlers = handlers if handlers is not None else HANDLERS
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self.purge_seconds = purge_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="vector-outbox", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        next_purge = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:
+                log.exception(msg="\n\n[VectorOutboxWorker] 배치 처리 실패\n")
+                processed = 0
+
+            # 밀린 행이 없을 때만, purge_seconds 주기로 보관 기간이 지난 행을 지운다.
+            if not processed and time.monotonic() >= next_purge:
+                try:
+                    self.purge_processed()
+                except Exception:
+                    log.exception(msg="\n\n[VectorOutboxWorker] 처리 완료 행 삭제 실패\n")
+                next_purge = time.monotonic() + self.purge_seconds
+            if not processed:
+                self._stop.wait(self.poll_seconds)
+
+    def purge_processed(self) -> int:
+        """
+        요약:
+            보관 기간(retention_seconds)이 지난 처리 완료 행을 삭제하는 함수
+
+        설명:
+            한 트랜잭션이 오래 잠그지 않도록 batch_size건씩 나누어 삭제한다.
+
+        Returns:
+            삭제한 outbox 행 수
+        """
+        before = datetime.now(timezone.utc) - timedelta(seconds=self.retention_seconds)
+        purged = 0
+        while not self._stop.is_set():
+            with self.session_factory() as database:
+                deleted = VectorOutboxRepository(database).delete_processed(before, self.batch_size)
+                database.commit()
+            purged += deleted
+            if deleted < self.batch_size:
+                break
+
+        if purged:
+            # LOG. 처리 완료 행 삭제
+            log.info(msg=f"\n\n[VectorOutboxWorker] 처리 완료 행 {purged}건 삭제\n")
+        return purged
+
+    def run_once(self) -> int:
+        """
+        요약:
+            outbox 행을 한 배치 처리하는 함수
+
+        Returns:
+            처리(성공/실패 포함)한 outbox 행 수
+        """
+        with self.session_factory() as database:
+            outbox_repository = VectorOutboxRepository(database)
+            rows = outbox_repository.lock_pending(self.batch_size, self.max_attempts)
+            if not rows:
+                database.rollback()
+                return 0
+
+            # entity_type별로 (entity_id → 마지막 연산), outbox_id 묶음
+            latest: dict[str, dict[int, str]] = defaultdict(dict)
+            outbox_ids: dict[str, list[int]] = defaultdict(list)
+            for row in rows:  # outbox_id 오름차순
+                latest[row.entity_type][row.entity_id] = row.operation
+                outbox_ids[row.entity_type].append(row.outbox_id)
+
+            for entity_type, operations in latest.items():
+                handler = self.handlers.get(entity_type)
+                if handler is None:
+                    outbox_repository.mark_failed(outbox_ids[entity_type], f"unknown entity_type: {entity_type}")
+                    continue
+
+                upsert_ids = [entity_id for entity_id, operation in operations.items() if operation == UPSERT]
+                delete_ids = [entity_id for entity_id, operation in operations.items() if operation == DELETE]
+                try:
+                    # 처리 함수의 DB 오류가 배치 트랜잭션(행 잠금, 다른 entity_type의 결과)을 깨지 않도록 savepoint 안에서 실행
+                    with database.begin_nested():
+                        handler(database, upsert_ids, delete_ids)
+                    outbox_repository.mark_processed(outbox_ids[entity_type])
+                except Exception as e:
+                    log.exception(msg=f"\n\n[VectorOutboxWorker] {entity_type} 동기화 실패\n")
+                    outbox_repository.mark_failed(outbox_ids[entity_type], str(e))
+
+            database.commit()
+
+            # LOG. 배치 처리 결과
+            log.info(msg=f"\n\n[VectorOutboxWorker] {len(rows)}건 처리 "
+                         f"({', '.join(f'{t}={len(o)}' for t, o in latest.items())})\n")
+            return len(rows)
@@ -7,8 +7,34 @@ from app.internal.exception.exception_handler import global_exception_handlers
 # NOTE 1. 환경 변수 로딩
 load_dotenv()
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-app = FastAPI(title="runnable-fastapi")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    from app.internal.outbox.vector_outbox_worker import VECTOR_OUTBOX_WORKER, VectorOutboxWorker
+    from app.routers.dataset.dataset_backend import DATASET_BACKEND
+    from app.routers.dataset.dataset_service import DatasetService
+    from app.routers.dataset.dataset_store import DATASET_RELOAD_INTERVAL
+
+    # 정적 데이터셋은 기동 시 한 번만 읽어 메모리에 올리고, 파일이 바뀌면 백그라운드에서 다시 만들어 교체한다.
+    # (DATASET_BACKEND=postgis이면 질의는 DB가 처리하므로 미리 올리지 않는다. 타일 요청 때만 필요한 데이터셋을 로드)
+    dataset_store = DatasetService().store
+    if DATASET_BACKEND != "postgis":
+        dataset_store.load_all()
+        if DATASET_RELOAD_INTERVAL > 0:
+            dataset_store.watch(DATASET_RELOAD_INTERVAL)
+
+    # VECTOR_OUTBOX_WORKER=1이면 검색 색인 동기화 워커를 함께 실행
+    worker = VectorOutboxWorker() if VECTOR_OUTBOX_WORKER else None
+    if worker:
+        worker.start()
+    yield
+    dataset_store.stop(timeout=10)
+    if worker:
+        worker.stop(timeout=10)
+
+app = FastAPI(title="runnable-fastapi", lifespan=lifespan)
 
 # 팔문 개방
 origins = [
@@ -41,6 +67,8 @@ from app.routers.sections import sections_controller
 from app.routers.user_paces import user_paces_controller
 from app.routers.route_geoms import route_geoms_controller
 from app.routers.dataset import dataset_controller
+from app.routers.route_search import route_search_controller
+from app.internal.outbox import vector_outbox  # vector_outbox 테이블 등록
 
 # NOTE 4. 테이블 생성
 ensure_postgis()
@@ -61,6 +89,7 @@ app.include_router(sections_controller.router, prefix="/api/v1", tags=["sections
 app.include_router(user_paces_controller.router, prefix="/api/v1", tags=["user_paces"])
 app.include_router(route_geoms_controller.router, prefix="/api/v1", tags=["route_geoms"])
 app.include_router(dataset_controller.router, prefix="/api/v1", tags=["dataset"])
+app.include_router(route_search_controller.router, prefix="/api/v1", tags=["route_search"])
 
 # NOTE 6. 에러 핸들러 연결
 global_exception_handlers(app)
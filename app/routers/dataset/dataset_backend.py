@@ -0,0 +1,118 @@
+# app/routers/dataset/dataset_backend.py
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.routers.dataset.dataset_store import DatasetStore
+from app.utils.polyline import Polyline
+
+if TYPE_CHECKING:
+    # dataset_features 모델은 Postgres 설정(POSTGRES_*)을 읽으므로, memory 백엔드만 쓸 때는 import하지 않는다.
+    from app.routers.dataset.dataset_features_repository import DatasetFeaturesRepository
+
+# .env 환경 변수 추출
+DATASET_BACKEND = os.getenv('DATASET_BACKEND', 'memory')
+
+"""
+선택 가능한 데이터셋 질의 백엔드
+- memory: 앱 메모리의 DatasetStore(좌표 배열 + 공간 격자)로 질의 (기본)
+- postgis: dataset_features 테이블(GIST 인덱스)로 질의. 데이터셋을 앱 메모리에 올리지 않는다.
+           (먼저 python -m app.routers.dataset.dataset_features_import로 적재 필요)
+"""
+DATASET_BACKENDS = ("memory", "postgis")
+
+
+class MemoryDatasetBackend:
+    """
+    요약:
+        DatasetStore의 메모리 저장소로 반경/kNN/경로 주변 질의를 수행하는 백엔드
+
+    Attributes:
+        store(DatasetStore): 메모리 저장소
+    """
+
+    def __init__(self, store: DatasetStore) -> None:
+        self.store = store
+
+    def all(self, name: str) -> Sequence[Dict[str, Any]]:
+        return self.store.get(name).records
+
+    def radius(self, name: str, lat: float, lon: float, radius_m: float) -> List[Dict[str, Any]]:
+        return self.store.get(name).query_radius(lat, lon, radius_m)
+
+    def nearest(self, name: str, lat: float, lon: float, k: int,
+                max_distance_m: Optional[float] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """[(거리, 레코드), ...] 거리 순"""
+        dataset = self.store.get(name)
+        record_ids, distances = dataset.nearest(lat, lon, k, max_distance_m)
+        return [(distance, dataset.get(record_id)) for record_id, distance in zip(record_ids.tolist(), distances.tolist())]
+
+    def corridor(self, name: str, lines: List[List[List[float]]],
+                 buffer_m: float) -> List[Tuple[float, float, Dict[str, Any]]]:
+        """[(경로상 위치, 거리, 레코드), ...] 경로상 위치 순"""
+        dataset = self.store.get(name)
+        record_ids, distances, alongs = dataset.within_corridor(Polyline(lines), buffer_m)
+        return [(along, distance, dataset.get(record_id))
+                for record_id, distance, along in zip(record_ids.tolist(), distances.tolist(), alongs.tolist())]
+
+
+class PostgisDatasetBackend:
+    """
+    요약:
+        dataset_features(PostGIS) 테이블로 반경/kNN/경로 주변 질의를 수행하는 백엔드
+
+    설명:
+        - 반경: ST_DWithin(geography) / kNN: ORDER BY geog <-> point LIMIT k / 경로 주변: LINESTRING별 ST_DWithin
+        - 전국 규모처럼 앱 메모리에 올리기 큰 데이터셋을 위한 선택지. 결과 형식은 MemoryDatasetBackend와 같다.
+
+    Attributes:
+        repository(DatasetFeaturesRepository): dataset_features 접근 객체
+    """
+
+    def __init__(self, repository: DatasetFeaturesRepository) -> None:
+        self.repository = repository
+
+    def all(self, name: str) -> Sequence[Dict[str, Any]]:
+        return self.repository.find_all(name)
+
+    def radius(self, name: str, lat: float, lon: float, radius_m: float) -> List[Dict[str, Any]]:
+        return self.repository.find_within(name, lat, lon, radius_m)
+
+    def nearest(self, name: str, lat: float, lon: float, k: int,
+                max_distance_m: Optional[float] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        return self.repository.find_nearest(name, lat, lon, k, max_distance_m)
+
+    def corridor(self, name: str, lines: List[List[List[float]]],
+                 buffer_m: float) -> List[Tuple[float, float, Dict[str, Any]]]:
+        # LINESTRING마다 질의한 뒤, 선 안에서의 위치(m)에 앞선 선들의 길이를 더하고 레코드별 최단 거리만 남긴다.
+        best: Dict[int, Tuple[float, float, Dict[str, Any]]] = {}
+        offset = 0.0
+        for line in lines:
+            if len(line) >= 2:
+                for record_id, distance, along, record in self.repository.find_near_line(name, line, buffer_m):
+                    if record_id not in best or distance < best[record_id][1]:
+                        best[record_id] = (offset + along, distance, record)
+            offset += Polyline([line]).length_m
+        return sorted(best.values(), key=lambda row: row[0])
+
+
+def create_dataset_backend(store: DatasetStore, database: Optional[Session] = None, backend: str = DATASET_BACKEND):
+    """
+    요약:
+        DATASET_BACKEND 설정에 맞는 질의 백엔드를 생성하는 함수
+
+    Parameters:
+        store(DatasetStore): memory 백엔드가 쓸 저장소
+        database(Session): postgis 백엔드가 쓸 요청 단위 세션
+        backend(str): DATASET_BACKENDS 중 하나
+    """
+    if backend not in DATASET_BACKENDS:
+        raise ValueError(f"지원하지 않는 데이터셋 백엔드: {backend} (선택 가능: {', '.join(DATASET_BACKENDS)})")
+    if backend == "postgis":
+        from app.routers.dataset.dataset_features_repository import DatasetFeaturesRepository
+
+        return PostgisDatasetBackend(DatasetFeaturesRepository(database))
+    return MemoryDatasetBackend(store)
@@ -3,48 +3,83 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
 
-from config.common.common_response import CommonResponse
+from config.common.common_response import CommonResponse, stream_common_response, stream_ndjson
+from app.routers.dataset.dataset_backend import create_dataset_backend
 from app.routers.dataset.dataset_service import DatasetService
+from app.routers.dataset.dataset_store import DatasetStore
+from app.routers.dataset.dataset_tiles import DATASET_TILE_MAX_AGE
+from app.routers.dataset.places_service import PlacesService
+from app.routers.route_geoms.route_geoms_repository import RouteGeomsRepository
+from config.database.postgres_database import get_database
 from config.external.hospital_api import get_hospitals
 
 router = APIRouter(prefix="/dataset", tags=["dataset"])
 
-# DI 헬퍼: 필요 시 다른 레이어처럼 Depends 주입도 가능하지만,
-# 이 서비스는 외부 상태가 없어 간단히 팩토리로 씁니다.
-def get_dataset_service() -> DatasetService:
-    return DatasetService()
+# DI 헬퍼: 경로 주변 조회(RouteGeoms)와 postgis 백엔드(DATASET_BACKEND)가 요청 단위 Session을 쓴다.
+def get_dataset_service(database: Session = Depends(get_database)) -> DatasetService:
+    store = DatasetStore()
+    return DatasetService(
+        store=store,
+        route_geoms_repository=RouteGeomsRepository(database),
+        backend=create_dataset_backend(store, database),
+    )
+
+# Milvus/임베딩 모델은 무거우므로 첫 장소 검색 요청 때 import(로딩)한다.
+def get_places_service() -> PlacesService:
+    from app.routers.dataset.places_repository import PlacesRepository
+
+    return PlacesService(DatasetService(), PlacesRepository())
+
+# 응답 형식
+# - json: CommonResponse (기본)
+# - stream: CommonResponse와 같은 JSON을 조금씩 직렬화해 스트리밍
+# - ndjson: 한 줄에 레코드 하나 (application/x-ndjson)
+FORMAT_PATTERN = "^(json|stream|ndjson)$"
+
+def _dataset_response(svc: DatasetService, name: str, message: str, lat: Optional[float], lon: Optional[float],
+                      radius_m: float, fields: Optional[str], format: str):
+    records = svc.iter_dataset(name, lat, lon, radius_m, fields)
+    if format == "ndjson":
+        return StreamingResponse(stream_ndjson(records), media_type="application/x-ndjson")
+    if format == "stream":
+        return StreamingResponse(stream_common_response(200, message, records), media_type="application/json")
+    return CommonResponse(code=200, message=message, data=list(records))
 
 @router.get("/drinkingFountains")
 def read_drinking_fountains(
     lat: Optional[float] = Query(37.566406, description="카메라 위도(도)"),
     lon: Optional[float] = Query(126.977822, description="카메라 경도(도)"),
     radius_m: float = Query(500.0, description="반경(미터)"),
+    fields: Optional[str] = Query(None, description="응답 필드(쉼표 구분). 미지정 시 cot_conts_id,cot_conts_name,lat,lng / *는 전체"),
+    format: str = Query("json", pattern=FORMAT_PATTERN, description="json | stream | ndjson"),
+    svc: DatasetService = Depends(get_dataset_service),
 ):
     """
     로컬에 저장된 음수대 JSON을 FastAPI가 중계.
     - 쿼리파라미터(lat, lon)를 주면 반경 필터 적용
     - 파일은 { "DATA": [...] } 형식이라고 가정
     """
-    svc = get_dataset_service()
-    data = svc.read_drinking_fountains(lat, lon, radius_m)
-    return CommonResponse(code=200, message="음수대 조회 성공", data=data)
+    return _dataset_response(svc, "drinkingFountains", "음수대 조회 성공", lat, lon, radius_m, fields, format)
 
 @router.get("/crosswalks")
 def read_crosswalks(
     lat: Optional[float] = Query(37.566406, description="카메라 위도(도)"),
     lon: Optional[float] = Query(126.977822, description="카메라 경도(도)"),
     radius_m: float = Query(500.0, description="반경(미터)"),
+    fields: Optional[str] = Query(None, description="응답 필드(쉼표 구분). 미지정 시 node_type,node_wkt,lnkg_wkt / *는 전체"),
+    format: str = Query("json", pattern=FORMAT_PATTERN, description="json | stream | ndjson"),
+    svc: DatasetService = Depends(get_dataset_service),
 ):
     """
     로컬에 저장된 횡단보도 JSON을 FastAPI가 중계.
     - 쿼리파라미터(lat, lon)를 주면 반경 필터 적용
     - 파일은 { "DATA": [...] } 형식이라고 가정
     """
-    svc = get_dataset_service()
-    data = svc.read_crosswalks(lat, lon, radius_m)
-    return CommonResponse(code=200, message="횡단보도 조회 성공", data=data)
+    return _dataset_response(svc, "crosswalks", "횡단보도 조회 성공", lat, lon, radius_m, fields, format)
 
 @router.get("/hospitals")
 def read_crosswalks(
@@ -53,4 +88,99 @@ def read_crosswalks(
     radius_m: float = Query(500.0, description="반경(미터)"),
 ):
     data = get_hospitals(lon, lat, radius_m)
-    return CommonResponse(code=200, message="병원 조회 성공", data=data["items"])
\ No newline at end of file
+    return CommonResponse(code=200, message="병원 조회 성공", data=data["items"])
+
+@router.get("/places/search")
+def search_places(
+    query: str = Query(..., min_length=1, description="검색어 (예: 카페 같은 쉼터)"),
+    lat: float = Query(37.566406, description="카메라 위도(도)"),
+    lon: float = Query(126.977822, description="카메라 경도(도)"),
+    radius_m: float = Query(1000.0, gt=0, description="반경(미터)"),
+    limit: int = Query(10, ge=1, le=100, description="최대 결과 수"),
+    kind: Optional[str] = Query(None, description="데이터셋 종류 (예: drinkingFountains)"),
+):
+    """
+    반경 안의 장소 중 검색어와 의미가 가까운 순서로 조회.
+    - 위경도 사각형으로 Milvus 안에서 사전 필터 → 벡터 검색 → 하버사인으로 반경 확정
+    - 반경 밖으로 탈락한 만큼 다시 조회해 limit건을 채운다 (반경 안의 장소가 부족하면 그보다 적음)
+    - kind는 색인 대상 데이터셋(PlacesService.KINDS)만 허용
+    - 사전에 POST /dataset/places/index로 색인 필요
+    """
+    data = get_places_service().search(query, lat, lon, radius_m, limit, kind)
+    return CommonResponse(code=200, message="장소 검색 성공", data=data)
+
+@router.post("/places/index")
+def index_places():
+    """데이터셋 전체를 장소 검색 콜렉션에 다시 색인."""
+    data = get_places_service().index_all()
+    return CommonResponse(code=200, message="장소 색인 성공", data=data)
+
+@router.get("/{name}/tiles/{z}/{x}/{y}")
+def read_dataset_tile(
+    name: str,
+    z: int,
+    x: int,
+    y: int,
+    fields: Optional[str] = Query(None, description="응답 필드(쉼표 구분). 미지정 시 레지스트리 기본 필드 / *는 전체"),
+    if_none_match: Optional[str] = Header(None),
+    svc: DatasetService = Depends(get_dataset_service),
+):
+    """
+    XYZ(Web Mercator) 타일 안의 데이터셋 레코드 조회.
+    - 카메라 이동마다 반경 조회 대신, 화면을 덮는 타일만 요청해 재사용한다.
+    - 본문 해시로 만든 ETag와 Cache-Control을 내려주며, If-None-Match가 같으면 304 (본문 없음)
+    """
+    tile = svc.read_tile(name, z, x, y, fields)
+    headers = {"ETag": tile.etag, "Cache-Control": f"public, max-age={DATASET_TILE_MAX_AGE}"}
+    if if_none_match and tile.etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=tile.body, media_type="application/json", headers=headers)
+
+@router.get("/{name}/nearest")
+def read_dataset_nearest(
+    name: str,
+    lat: float = Query(..., description="기준 위도(도)"),
+    lon: float = Query(..., description="기준 경도(도)"),
+    k: int = Query(5, ge=1, le=100, description="최대 결과 수"),
+    max_distance_m: Optional[float] = Query(None, gt=0, description="최대 거리(미터). 미지정 시 제한 없음"),
+    fields: Optional[str] = Query(None, description="응답 필드(쉼표 구분). 미지정 시 레지스트리 기본 필드 / *는 전체"),
+    svc: DatasetService = Depends(get_dataset_service),
+):
+    """
+    기준 좌표에서 가까운 데이터셋 레코드 k개 조회 (예: 가장 가까운 음수대 5곳).
+    - 결과는 거리(distance_m) 순
+    """
+    data = svc.read_nearest(name, lat, lon, k, max_distance_m, fields)
+    return CommonResponse(code=200, message="가까운 데이터셋 조회 성공", data=data)
+
+@router.get("/{name}/corridor")
+def read_dataset_corridor(
+    name: str,
+    route_id: int = Query(..., description="경로 ID (RouteGeoms의 LINESTRING 사용)"),
+    buffer_m: float = Query(30.0, gt=0, le=1000, description="경로로부터의 거리(미터)"),
+    fields: Optional[str] = Query(None, description="응답 필드(쉼표 구분). 미지정 시 레지스트리 기본 필드 / *는 전체"),
+    svc: DatasetService = Depends(get_dataset_service),
+):
+    """
+    경로를 따라 buffer_m 안에 있는 데이터셋 레코드 조회 (예: 코스 위 음수대/횡단보도).
+    - 결과는 경로 시작점부터의 거리(along_m) 순
+    """
+    data = svc.read_route_corridor(name, route_id, buffer_m, fields)
+    return CommonResponse(code=200, message="경로 주변 데이터셋 조회 성공", data=data)
+
+@router.get("/{name}")
+def read_dataset(
+    name: str,
+    lat: Optional[float] = Query(None, description="카메라 위도(도)"),
+    lon: Optional[float] = Query(None, description="카메라 경도(도)"),
+    radius_m: float = Query(500.0, description="반경(미터)"),
+    fields: Optional[str] = Query(None, description="응답 필드(쉼표 구분). 미지정 시 레지스트리 기본 필드 / *는 전체"),
+    format: str = Query("json", pattern=FORMAT_PATTERN, description="json | stream | ndjson"),
+    svc: DatasetService = Depends(get_dataset_service),
+):
+    """
+    레지스트리(res/datasets.json)에 등록된 데이터셋 조회.
+    - 코드 수정 없이 레지스트리에 항목을 추가하면 바로 조회할 수 있다.
+    - 쿼리파라미터(lat, lon)를 주면 반경 필터 적용
+    """
+    return _dataset_response(svc, name, "데이터셋 조회 성공", lat, lon, radius_m, fields, format)
@@ -0,0 +1,29 @@
+# app/routers/dataset/dataset_features.py
+from geoalchemy2 import Geography
+from sqlalchemy import BigInteger, Column, Identity, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from config.database.postgres_database import Base
+
+
+class DatasetFeatures(Base):
+    """
+    정적 데이터셋(레지스트리)의 레코드를 PostGIS에 적재한 테이블 (DATASET_BACKEND=postgis일 때 사용)
+
+    레코드 하나가 행 하나이고, 좌표는 geography(4326)로 둔다.
+    - 점 데이터셋: POINT
+    - WKT 데이터셋: 버텍스들의 MULTIPOINT (메모리 저장소와 같은 "버텍스가 하나라도 반경 안" 기준)
+    geog에는 GIST 인덱스가 만들어지며(geoalchemy2 spatial_index), ST_DWithin / <-> 정렬이 인덱스를 탄다.
+    """
+    __tablename__ = "dataset_features"
+
+    feature_id = Column(BigInteger, Identity(start=1, always=False), primary_key=True)
+    dataset = Column(String(100), nullable=False)
+    record_id = Column(Integer, nullable=False)       # 원본 "DATA" 배열의 인덱스 (응답 순서)
+
+    geog = Column(Geography(geometry_type="GEOMETRY", srid=4326), nullable=True)  # 좌표 없는 레코드는 NULL
+    record = Column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("ux_dataset_features_dataset_record", "dataset", "record_id", unique=True),
+    )
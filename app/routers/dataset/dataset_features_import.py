@@ -0,0 +1,92 @@
+# app/routers/dataset/dataset_features_import.py
+"""
+레지스트리의 데이터셋을 PostGIS(dataset_features 테이블)에 적재하는 스크립트
+
+JSON을 메모리 저장소와 같은 방식으로 파싱한 뒤(좌표 추출/WKT 축 순서 판별), 레코드마다
+POINT(점 데이터셋) 또는 버텍스 MULTIPOINT(WKT 데이터셋)를 geography로 넣는다. 데이터셋 단위로 전체 교체한다.
+적재 후 DATASET_BACKEND=postgis로 실행하면 반경/kNN/경로 주변 질의를 DB가 처리한다.
+
+실행:
+    python -m app.routers.dataset.dataset_features_import
+    python -m app.routers.dataset.dataset_features_import drinkingFountains --registry ./datasets.json
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from app.internal.log.log import log
+from app.routers.dataset.dataset_registry import DATASET_REGISTRY_PATH, load_dataset_configs
+
+
+def feature_rows(dataset) -> Iterator[Dict[str, Any]]:
+    """
+    메모리 저장소(PointDataset/WktDataset) → dataset_features 행 { record_id, geog(EWKT), record }
+    """
+    from app.routers.dataset.dataset_store import WktDataset
+
+    owners = dataset.vertex_ids if isinstance(dataset, WktDataset) else dataset.ids
+    order = np.argsort(owners, kind="stable")
+    owners, lat, lng = owners[order], dataset.lat[order], dataset.lng[order]
+    record_ids, starts = np.unique(owners, return_index=True)
+    bounds = dict(zip(record_ids.tolist(), zip(starts.tolist(), np.append(starts[1:], len(owners)).tolist())))
+
+    for record_id, record in enumerate(dataset.records):
+        geog = None
+        if record_id in bounds:
+            start, end = bounds[record_id]
+            points = [f"{x!r} {y!r}" for x, y in zip(lng[start:end].tolist(), lat[start:end].tolist())]
+            if isinstance(dataset, WktDataset):
+                geog = "SRID=4326;MULTIPOINT(" + ", ".join(f"({point})" for point in points) + ")"
+            else:
+                geog = f"SRID=4326;POINT({points[0]})"
+        yield {"record_id": record_id, "geog": geog, "record": record}
+
+
+def import_datasets(names: Optional[List[str]] = None, registry_path: Path = DATASET_REGISTRY_PATH) -> List[Dict[str, Any]]:
+    """
+    요약:
+        레지스트리의 데이터셋(names가 없으면 전체)을 dataset_features에 적재하는 함수
+
+    Returns:
+        [{ name, records, seconds }, ...]
+    """
+    from app.routers.dataset.dataset_features import DatasetFeatures
+    from app.routers.dataset.dataset_features_repository import DatasetFeaturesRepository
+    from config.database.postgres_database import Base, SessionLocal, engine, ensure_postgis
+
+    ensure_postgis()
+    Base.metadata.create_all(bind=engine, tables=[DatasetFeatures.__table__])
+
+    configs = load_dataset_configs(registry_path)
+    results = []
+    with SessionLocal() as database:
+        repository = DatasetFeaturesRepository(database)
+        for config in configs.values():
+            if names and config.name not in names:
+                continue
+            started = time.perf_counter()
+            count = repository.replace(config.name, feature_rows(config.build(config.read())))
+            database.commit()  # 데이터셋 단위로 확정
+            results.append({"name": config.name, "records": count, "seconds": time.perf_counter() - started})
+            # LOG. 적재 결과
+            log.info(msg=f"\n\n[DatasetFeaturesImport] {config.name}: {count}건 적재\n")
+
+        # 플래너 통계 갱신 (GIST 인덱스 선택)
+        database.execute(text("ANALYZE dataset_features"))
+        database.commit()
+    return results
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*", help="적재할 데이터셋 이름 (생략 시 전체)")
+    parser.add_argument("--registry", type=Path, default=DATASET_REGISTRY_PATH, help="데이터셋 레지스트리 경로")
+    args = parser.parse_args()
+    print(json.dumps(import_datasets(args.names, args.registry), ensure_ascii=False, indent=2))
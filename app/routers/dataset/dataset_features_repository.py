@@ -0,0 +1,86 @@
+# app/routers/dataset/dataset_features_repository.py
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from geoalchemy2 import Geography
+from sqlalchemy import cast, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.routers.dataset.dataset_features import DatasetFeatures
+
+INSERT_CHUNK_SIZE = 5000
+_GEOGRAPHY = Geography(geometry_type="GEOMETRY", srid=4326)
+
+
+def _point(lat: float, lon: float):
+    return cast(func.ST_SetSRID(func.ST_MakePoint(lon, lat), 4326), _GEOGRAPHY)
+
+
+def _linestring_wkt(line: List[List[float]]) -> str:
+    return "LINESTRING(" + ", ".join(f"{lon!r} {lat!r}" for lon, lat in line) + ")"
+
+
+class DatasetFeaturesRepository:
+    def __init__(self, database: Session) -> None:
+        # Repository는 DB 접근 전용. 트랜잭션(Commit/Rollback) 모름.
+        self.database = database
+
+    # 트랜잭션은 호출한 쪽(임포터)이 관리 → 여기선 commit() 하지 않음
+    def replace(self, dataset: str, rows: Iterable[Dict[str, Any]]) -> int:
+        # 데이터셋 전체 교체. rows: { record_id, geog(EWKT 또는 None), record }
+        self.database.execute(delete(DatasetFeatures).where(DatasetFeatures.dataset == dataset))
+        count = 0
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, INSERT_CHUNK_SIZE)):
+            # executemany (insertmanyvalues로 묶여 왕복 수가 적다)
+            self.database.execute(insert(DatasetFeatures), [{"dataset": dataset, **row} for row in chunk])
+            count += len(chunk)
+        return count
+
+    def count(self, dataset: str) -> int:
+        stmt = select(func.count()).select_from(DatasetFeatures).where(DatasetFeatures.dataset == dataset)
+        return int(self.database.scalar(stmt) or 0)
+
+    def find_all(self, dataset: str) -> List[Dict[str, Any]]:
+        stmt = select(DatasetFeatures.record).where(DatasetFeatures.dataset == dataset).order_by(DatasetFeatures.record_id)
+        return list(self.database.execute(stmt).scalars().all())
+
+    def find_within(self, dataset: str, lat: float, lon: float, radius_m: float) -> List[Dict[str, Any]]:
+        # 반경 안 레코드 (원본 순서). ST_DWithin(geography)은 GIST 인덱스 사용.
+        stmt = (
+            select(DatasetFeatures.record)
+            .where(DatasetFeatures.dataset == dataset, func.ST_DWithin(DatasetFeatures.geog, _point(lat, lon), radius_m))
+            .order_by(DatasetFeatures.record_id)
+        )
+        return list(self.database.execute(stmt).scalars().all())
+
+    def find_nearest(self, dataset: str, lat: float, lon: float, k: int,
+                     max_distance_m: Optional[float] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        # 가까운 k개 (거리, 레코드). ORDER BY geog <-> point 는 GIST 인덱스로 k개만 읽는다.
+        point = _point(lat, lon)
+        stmt = (
+            select(func.ST_Distance(DatasetFeatures.geog, point), DatasetFeatures.record)
+            .where(DatasetFeatures.dataset == dataset, DatasetFeatures.geog.isnot(None))
+            .order_by(DatasetFeatures.geog.op("<->")(point))
+            .limit(k)
+        )
+        if max_distance_m is not None:
+            stmt = stmt.where(func.ST_DWithin(DatasetFeatures.geog, point, max_distance_m))
+        return sorted(((float(distance), record) for distance, record in self.database.execute(stmt).all()),
+                      key=lambda row: row[0])
+
+    def find_near_line(self, dataset: str, line: List[List[float]],
+                       buffer_m: float) -> List[Tuple[int, float, float, Dict[str, Any]]]:
+        # LINESTRING([[lon, lat], ...])에서 buffer_m 안 레코드 (record_id, 거리, 선 시작점부터의 위치(m), 레코드)
+        # 선 위 위치 비율(ST_LineLocatePoint)은 평면 기준이므로, 그 지점까지 잘라낸 선의 geography 길이로 m를 구한다.
+        line_geom = func.ST_GeomFromText(_linestring_wkt(line), 4326)
+        line_geog = cast(line_geom, _GEOGRAPHY)
+        fraction = func.ST_LineLocatePoint(line_geom, func.ST_ClosestPoint(line_geom, func.geometry(DatasetFeatures.geog)))
+        along_m = func.ST_Length(cast(func.ST_LineSubstring(line_geom, 0, fraction), _GEOGRAPHY))
+        stmt = (
+            select(DatasetFeatures.record_id, func.ST_Distance(DatasetFeatures.geog, line_geog), along_m,
+                   DatasetFeatures.record)
+            .where(DatasetFeatures.dataset == dataset, func.ST_DWithin(DatasetFeatures.geog, line_geog, buffer_m))
+        )
+        return [(int(record_id), float(distance), float(along), record)
+                for record_id, distance, along, record in self.database.execute(stmt).all()]
@@ -0,0 +1,91 @@
+# app/routers/dataset/dataset_registry.py
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.internal.log.log import log
+
+# .env 환경 변수 추출
+DATASET_REGISTRY_PATH = Path(os.getenv('DATASET_REGISTRY_PATH', str(Path(__file__).resolve().parent / 'res' / 'datasets.json')))
+
+"""
+geometry 종류
+- point: 레코드의 lat_field/lng_field 값이 좌표
+- wkt: 레코드의 WKT 문자열(POINT/LINESTRING/MULTILINESTRING)의 버텍스가 좌표
+"""
+GEOMETRIES = ("point", "wkt")
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    """
+    요약:
+        데이터셋 하나의 등록 정보 (datasets.json의 항목 하나)
+
+    Attributes:
+        name(str): 데이터셋 이름 (API 경로에 쓰임)
+        path(Path): { "DATA": [...] } 형식의 JSON 파일 경로 (상대 경로는 레지스트리 파일 기준)
+        geometry(str): GEOMETRIES 중 하나
+        lat_field(str), lng_field(str): point - 위경도 필드
+        type_field(str), point_type(str): wkt - type_field 값이 point_type인 레코드는 point_wkt_field의 첫 좌표만 사용
+        point_wkt_field(str), line_wkt_field(str): wkt - 점/선 WKT 필드
+        default_fields(tuple[str]): fields 미지정 시 응답 필드 (None이면 전체)
+    """
+    name: str
+    path: Path
+    geometry: str = "point"
+    lat_field: str = "lat"
+    lng_field: str = "lng"
+    type_field: Optional[str] = None
+    point_type: Optional[str] = None
+    point_wkt_field: Optional[str] = None
+    line_wkt_field: Optional[str] = None
+    default_fields: Optional[Tuple[str, ...]] = None
+
+    def read(self) -> List[Dict[str, Any]]:
+        """파일의 "DATA" 레코드 (파일이 배포되지 않은 데이터셋은 빈 목록, DatasetStore는 최초 로드에만 이 대체를 쓴다)"""
+        if not self.path.exists():
+            log.warning(msg=f"\n\n[DatasetStore] {self.name}: {self.path} 파일이 없어 빈 데이터셋으로 로드합니다.\n")
+            return []
+        return json.loads(self.path.read_text(encoding="utf-8")).get("DATA", [])
+
+    def build(self, records: List[Dict[str, Any]]):
+        """레코드 → 메모리 저장소(PointDataset/WktDataset)"""
+        from app.routers.dataset.dataset_store import PointDataset, WktDataset
+
+        if self.geometry == "wkt":
+            return WktDataset(self.name, records, type_field=self.type_field, point_type=self.point_type,
+                              point_wkt_field=self.point_wkt_field, line_wkt_field=self.line_wkt_field)
+        return PointDataset(self.name, records, lat_field=self.lat_field, lng_field=self.lng_field)
+
+    def restore(self, records, meta: Dict[str, Any], arrays: Dict[str, Any]):
+        """스냅샷(dataset_snapshot) 레코드/배열 → 메모리 저장소 (파싱/인덱싱 없음)"""
+        from app.routers.dataset.dataset_store import PointDataset, WktDataset
+
+        dataset_class = WktDataset if self.geometry == "wkt" else PointDataset
+        return dataset_class.from_snapshot(self.name, records, meta, arrays)
+
+
+def load_dataset_configs(registry_path: Path = DATASET_REGISTRY_PATH) -> Dict[str, DatasetConfig]:
+    """
+    레지스트리 파일({ "DATASETS": [...] })을 읽어 이름 → DatasetConfig로 반환
+    """
+    payload = json.loads(registry_path.read_text(encoding="utf-8"))
+    known = {field.name for field in fields(DatasetConfig)}
+
+    configs: Dict[str, DatasetConfig] = {}
+    for entry in payload.get("DATASETS", []):
+        entry = {key: value for key, value in entry.items() if key in known}
+        if entry.get("geometry", "point") not in GEOMETRIES:
+            raise ValueError(f"지원하지 않는 geometry: {entry['geometry']} (선택 가능: {', '.join(GEOMETRIES)})")
+
+        path = Path(entry["path"])
+        entry["path"] = path if path.is_absolute() else registry_path.parent / path
+        if entry.get("default_fields") is not None:
+            entry["default_fields"] = tuple(entry["default_fields"])
+        configs[entry["name"]] = DatasetConfig(**entry)
+    return configs
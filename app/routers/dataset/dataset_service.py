@@ -1,13 +1,15 @@
 # app/routers/dataset/dataset_service.py
 from __future__ import annotations
 
-import json
-import math
-import re
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from app.utils.radius_filter import radius_filter
+from app.internal.exception.controlled_exception import ControlledException
+from app.internal.exception.errorcode import dataset_error_code, route_geoms_error_code
+from app.routers.dataset.dataset_backend import MemoryDatasetBackend
+from app.routers.dataset.dataset_store import DatasetStore
+from app.routers.dataset.dataset_tiles import (DATASET_TILE_MAX_ZOOM, DATASET_TILE_MIN_ZOOM, Tile, TileCache,
+                                               tile_bounds)
+from config.common.common_response import stream_common_response
 
 
 class DatasetService:
@@ -17,133 +19,209 @@ class DatasetService:
         선택적으로 반경 필터링을 수행하는 서비스 레이어.
 
     설명:
-        - 파일 경로는 항상 프로젝트 루트의 기본 경로만 사용한다.
-        - 음수대는 lat/lng 좌표 기반의 일반 반경 필터를 사용한다.
-        - 횡단보도는 WKT(Point/LineString* 포함) 파싱 후,
-          각 좌표쌍을 (lon,lat)과 (lat,lon) 두 방식으로 해석해 반경 판정한다.
+        - 데이터셋(이름, 파일 경로, 좌표 추출 방식, geometry 종류)은 레지스트리(res/datasets.json)로 등록한다.
+        - 음수대는 기동 시 한 번 로드한 DatasetStore의 lat/lng 배열로 반경 필터를 수행한다.
+        - 횡단보도는 로드 시 WKT(Point/LineString* 포함)를 한 번 파싱해 버텍스 배열로 두고,
+          좌표 축 순서((lon,lat)/(lat,lon))도 데이터셋 단위로 한 번만 판별한다.
+        - 반경/kNN/경로 주변 질의는 백엔드(dataset_backend)가 처리한다. 기본은 메모리 저장소이고,
+          DATASET_BACKEND=postgis이면 dataset_features 테이블(GIST 인덱스)에 질의한다. 타일은 메모리 저장소 전용.
     """
 
-    # [경로 상수] 프로젝트 루트 기준 기본 파일 경로 (항상 이 경로만 사용)
-    PROJECT_ROOT = Path(__file__).resolve().parents[2]
-    DEFAULT_DRINKING_PATH = PROJECT_ROOT / "routers" / "dataset" / "res" / "drinkingFountains.json"
-    DEFAULT_CROSSWALKS_PATH = PROJECT_ROOT / "routers" / "dataset" / "res" / "crosswalks.json"
+    # [응답 필드] fields="*"이면 전체 필드 (기본 필드는 레지스트리의 default_fields)
+    ALL_FIELDS = "*"
 
-    # [지오 유틸 상수]
-    EARTH_RADIUS_M = 6_371_000.0
-    DEG2RAD = math.pi / 180.0
+    def __init__(self, store: Optional[DatasetStore] = None, tiles: Optional[TileCache] = None,
+                 route_geoms_repository=None, backend=None) -> None:
+        # 파일은 DatasetStore(프로세스 싱글턴)가 한 번만 읽고, WKT 파싱/좌표 배열화도 그때 한 번만 한다.
+        self.store = store or DatasetStore()
+        self.tiles = tiles or TileCache()
+        # 반경/kNN/경로 주변 질의 백엔드 (create_dataset_backend 참고)
+        self.backend = backend or MemoryDatasetBackend(self.store)
+        # 경로 주변 조회(read_route_corridor)에서만 사용 (DB 세션이 필요하므로 선택)
+        self.route_geoms_repository = route_geoms_repository
 
     # ---------- 내부 유틸 ----------
-    def _read_default_json(self, path: Path) -> Dict[str, Any]:
-        """항상 DEFAULT_* 경로에서만 JSON 로드. 파일 형식은 { "DATA": [...] } 가정."""
-        return json.loads(path.read_text(encoding="utf-8"))
-
-    def _haversine_m(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """두 좌표 간 하버사인 거리(m)."""
-        lat1r, lon1r, lat2r, lon2r = (
-            lat1 * self.DEG2RAD,
-            lon1 * self.DEG2RAD,
-            lat2 * self.DEG2RAD,
-            lon2 * self.DEG2RAD,
-        )
-        dlat = lat2r - lat1r
-        dlon = lon2r - lon1r
-        a = (math.sin(dlat / 2) ** 2) + math.cos(lat1r) * math.cos(lat2r) * (math.sin(dlon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return self.EARTH_RADIUS_M * c
-
-    # ---- WKT 파서(견고 버전): POINT / LINESTRING / MULTILINESTRING, Z/M 옵션 지원 ----
-    _num_re = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
-
-    def _scan_numbers(self, wkt: str) -> List[float]:
-        """WKT 문자열에서 숫자만 추출."""
-        return [float(x) for x in self._num_re.findall(wkt or "")]
-
-    def _point_xy(self, wkt: str) -> Optional[Tuple[float, float]]:
-        """POINT에서 (x,y) 한 쌍만 추출. 실패 시 None."""
-        nums = self._scan_numbers(wkt)
-        if len(nums) >= 2:
-            return nums[0], nums[1]
-        return None
-
-    def _line_xy_list(self, wkt: str) -> List[Tuple[float, float]]:
+    def resolve_fields(self, name: str, fields: Optional[str]) -> Optional[List[str]]:
         """
-        LINESTRING / MULTILINESTRING 등에서 (x,y) 순서로 좌표쌍을 모두 추출.
-        숫자들을 2개씩 끊어 (x,y) 리스트로 만든다.
+        fields 파라미터(쉼표 구분) → 응답 필드 목록. None이면 전체 필드.
+        - 미지정: 데이터셋 기본 필드(레지스트리의 default_fields)
+        - "*": 전체 필드
         """
-        nums = self._scan_numbers(wkt)
-        out: List[Tuple[float, float]] = []
-        for i in range(0, len(nums) - 1, 2):
-            out.append((nums[i], nums[i + 1]))
-        return out
+        if fields is None:
+            default_fields = self.store.config(name).default_fields
+            return list(default_fields) if default_fields is not None else None
+        if fields.strip() == self.ALL_FIELDS:
+            return None
+        return [field.strip() for field in fields.split(",") if field.strip()]
+
+    @staticmethod
+    def project(records: Iterable[Dict[str, Any]], fields: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+        """레코드에서 fields만 남긴 dict를 하나씩 생성 (fields=None이면 원본 그대로)"""
+        if fields is None:
+            yield from records
+            return
+        for record in records:
+            yield {field: record.get(field) for field in fields}
 
-    def _within_any_interpretation(
+    # ---------- 공개 메서드 ----------
+    def get_dataset(self, name: str):
+        """현재 메모리 저장소. 요청 처리 중에는 이 참조만 쓴다(그 사이 교체되어도 영향 없음)."""
+        try:
+            return self.store.get(name)
+        except KeyError as e:
+            raise ControlledException(dataset_error_code.DATASET_NOT_FOUND) from e
+
+    def check_dataset(self, name: str) -> None:
+        """등록된 데이터셋인지 확인 (저장소를 로드하지 않으므로 postgis 백엔드에서도 쓴다)"""
+        try:
+            self.store.config(name)
+        except KeyError as e:
+            raise ControlledException(dataset_error_code.DATASET_NOT_FOUND) from e
+
+    def iter_dataset(
         self,
-        cam_lat: float,
-        cam_lon: float,
-        x: float,
-        y: float,
-        radius_m: float,
-    ) -> bool:
+        name: str,
+        lat: Optional[float],
+        lon: Optional[float],
+        radius_m: float = 500.0,
+        fields: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """데이터셋 레코드(+선택적 반경 필터)를 필드 투영해 하나씩 생성 (스트리밍 응답용)"""
+        self.check_dataset(name)
+        if lat is not None and lon is not None:
+            records = self.backend.radius(name, float(lat), float(lon), radius_m)
+        else:
+            records = self.backend.all(name)
+        return self.project(records, self.resolve_fields(name, fields))
+
+    def read_tile(self, name: str, z: int, x: int, y: int, fields: Optional[str] = None) -> Tile:
         """
-        (x,y)를 (lon,lat)으로 해석하거나 (lat,lon)으로 해석했을 때
-        둘 중 하나라도 반경 내면 True.
+        요약:
+            XYZ 타일 안의 레코드를 CommonResponse JSON으로 직렬화해 반환 (LRU 캐시)
+
+        설명:
+            점은 타일 사각형 안에 있으면, WKT 도형은 버텍스가 하나라도 타일 안에 있으면 포함한다.
+            타일 경계는 min <= 값 < max이므로 점은 같은 줌의 타일 하나에만 들어간다.
+
+        Parameters:
+            name(str): 데이터셋 이름
+            z(int), x(int), y(int): 타일 좌표
+            fields(str): 응답 필드(쉼표 구분, "*"는 전체)
         """
-        # 해석 1: (lon, lat)
-        if self._haversine_m(cam_lat, cam_lon, y, x) <= radius_m:
-            return True
-        # 해석 2: (lat, lon)
-        if self._haversine_m(cam_lat, cam_lon, x, y) <= radius_m:
-            return True
-        return False
-
-    def _crosswalk_within_radius(self, obj: Dict[str, Any], cam_lat: float, cam_lon: float, radius_m: float) -> bool:
+        if not 0 <= z <= DATASET_TILE_MAX_ZOOM or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            raise ControlledException(dataset_error_code.INVALID_TILE)
+        if z < DATASET_TILE_MIN_ZOOM:
+            raise ControlledException(dataset_error_code.TILE_ZOOM_TOO_LOW)
+
+        dataset = self.get_dataset(name)
+        field_list = self.resolve_fields(name, fields)
+
+        def render() -> Tile:
+            records = (dataset.get(record_id) for record_id in dataset.within_box(*tile_bounds(z, x, y)).tolist())
+            body = "".join(stream_common_response(200, "타일 조회 성공", self.project(records, field_list)))
+            return Tile.of(body.encode("utf-8"))
+
+        key = (z, x, y, tuple(field_list) if field_list is not None else None)
+        return self.tiles.get(dataset, key, render)
+
+    def read_nearest(
+        self,
+        name: str,
+        lat: float,
+        lon: float,
+        k: int = 5,
+        max_distance_m: Optional[float] = None,
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        횡단보도 오브젝트가 반경 내인지 판별.
-        - NODE: node_wkt(POINT)의 좌표를 (lon,lat)·(lat,lon) 모두 시도
-        - LINK: lnkg_wkt(LINESTRING*/MULTI*)의 모든 버텍스에 대해 위 전략 적용
+        요약:
+            (lat, lon)에서 가까운 레코드 k개를 거리 순으로 조회
+
+        설명:
+            반경 조회는 한적한 곳에서는 비고 붐비는 곳에서는 수백 건이 되므로, 개수(k)로 자른다.
+            공간 격자에서 반경을 두 배씩 늘리며 찾으므로 전체 스캔/클라이언트 정렬이 필요 없다.
+
+        Parameters:
+            name(str): 데이터셋 이름
+            lat(float), lon(float): 기준 위경도(도)
+            k(int): 최대 결과 수
+            max_distance_m(float): 최대 거리(m), None이면 제한 없음
+            fields(str): 응답 필드(쉼표 구분, "*"는 전체)
+
+        Returns:
+            [{ distance_m: 거리, record: 레코드 }, ...]
         """
-        node_type = str(obj.get("node_type", "")).upper()
-
-        # NODE → POINT
-        if node_type == "NODE":
-            xy = self._point_xy(obj.get("node_wkt", ""))
-            if xy is not None:
-                x, y = xy
-                return self._within_any_interpretation(cam_lat, cam_lon, x, y, radius_m)
-            # 좌표가 없으면 아래 라인 검사로 폴백
-
-        # LINK/기타 → (멀티)라인의 모든 버텍스 검사
-        for x, y in self._line_xy_list(obj.get("lnkg_wkt", "")):
-            if self._within_any_interpretation(cam_lat, cam_lon, x, y, radius_m):
-                return True
-        return False
+        self.check_dataset(name)
+        rows = self.backend.nearest(name, float(lat), float(lon), k, max_distance_m)
+        records = self.project((record for _, record in rows), self.resolve_fields(name, fields))
+        return [{"distance_m": distance, "record": record} for (distance, _), record in zip(rows, records)]
+
+    def read_corridor(
+        self,
+        name: str,
+        lines: List[List[List[float]]],
+        buffer_m: float = 30.0,
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        요약:
+            경로(LINESTRING 좌표들)에서 buffer_m 안인 레코드를 경로상 위치 순으로 조회
+
+        설명:
+            경로를 따라 반경 조회를 여러 번 하는 대신, 경로 선분들을 덮는 격자 후보만 골라
+            점-선분 거리를 한 번에(벡터 연산) 계산한다.
+
+        Parameters:
+            name(str): 데이터셋 이름
+            lines(list): [[[lon, lat], ...], ...] 달리는 순서대로의 LINESTRING 좌표
+            buffer_m(float): 경로로부터의 거리(m)
+            fields(str): 응답 필드(쉼표 구분, "*"는 전체)
+
+        Returns:
+            [{ along_m: 경로 시작부터의 거리, distance_m: 경로까지의 거리, record: 레코드 }, ...]
+        """
+        self.check_dataset(name)
+        rows = self.backend.corridor(name, lines, buffer_m)
+        records = self.project((record for _, _, record in rows), self.resolve_fields(name, fields))
+        return [
+            {"along_m": along, "distance_m": distance, "record": record}
+            for (along, distance, _), record in zip(rows, records)
+        ]
+
+    def read_route_corridor(
+        self,
+        name: str,
+        route_id: int,
+        buffer_m: float = 30.0,
+        fields: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """경로(route_id)의 RouteGeoms LINESTRING 주변 레코드 조회 (read_corridor)"""
+        self.check_dataset(name)  # 없는 데이터셋이면 DB 조회 전에 실패
+        lines = self.route_geoms_repository.find_coordinates_by_route_id(route_id)
+        if not lines:
+            raise ControlledException(route_geoms_error_code.ROUTE_GEOM_NOT_FOUND)
+        return self.read_corridor(name, lines, buffer_m, fields)
+
+    def read_dataset(self, name: str) -> List[Dict[str, Any]]:
+        """데이터셋 이름(drinkingFountains/crosswalks)으로 전체 레코드("DATA") 조회"""
+        return self.get_dataset(name).records
 
-    # ---------- 공개 메서드 ----------
     def read_drinking_fountains(
         self,
         lat: Optional[float],
         lon: Optional[float],
         radius_m: float = 500.0,
+        fields: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """음수대 목록 조회(+선택적 반경 필터)"""
-        payload = self._read_default_json(self.DEFAULT_DRINKING_PATH)
-        data: List[Dict[str, Any]] = payload.get("DATA", [])
-        if lat is not None and lon is not None:
-            data = radius_filter(data, lat, lon, radius_m)  # dict의 "lat"/"lng" 사용
-        return data
+        """음수대 목록 조회(+선택적 반경 필터, 필드 투영)"""
+        return list(self.iter_dataset("drinkingFountains", lat, lon, radius_m, fields))
 
     def read_crosswalks(
         self,
         lat: Optional[float],
         lon: Optional[float],
         radius_m: float = 500.0,
+        fields: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """횡단보도 목록 조회(+선택적 반경 필터)"""
-        payload = self._read_default_json(self.DEFAULT_CROSSWALKS_PATH)
-        data: List[Dict[str, Any]] = payload.get("DATA", [])
-
-        if lat is not None and lon is not None:
-            cam_lat, cam_lon = float(lat), float(lon)
-            data = [o for o in data if self._crosswalk_within_radius(o, cam_lat, cam_lon, radius_m)]
-
-        return data
+        """횡단보도 목록 조회(+선택적 반경 필터, 필드 투영)"""
+        return list(self.iter_dataset("crosswalks", lat, lon, radius_m, fields))
@@ -0,0 +1,233 @@
+# app/routers/dataset/dataset_snapshot.py
+"""
+데이터셋 바이너리 스냅샷 (빌드 + 읽기 전용 mmap 로드)
+
+레지스트리의 데이터셋을 한 번 파싱/인덱싱한 결과(좌표 배열, 공간 격자, 직렬화한 레코드와 오프셋 표)를
+파일 하나로 저장한다. 워커는 이 파일을 mmap으로 열어 배열을 그대로 쓰므로 JSON 파싱/정렬 없이 바로 기동하고,
+같은 파일의 페이지 캐시를 모든 워커가 공유한다. (워커 수가 늘어도 데이터셋 메모리는 늘지 않는다)
+
+파일 형식:
+    [8B 매직][8B 헤더 길이(uint64 LE)][헤더 JSON][64바이트 정렬된 배열들]
+    헤더: 원본 파일 버전(mtime_ns, size), 빌드 설정, 격자 크기, 배열별 dtype/shape/offset
+    레코드: records(uint8, 레코드별 JSON을 이어 붙인 바이트) + record_offsets(int64, 레코드 수 + 1)
+
+원본 JSON의 버전이나 빌드 설정이 헤더와 다르면 스냅샷은 무시되고 JSON에서 다시 만든다.
+
+실행 (배포/컨테이너 빌드 단계에서):
+    python -m app.routers.dataset.dataset_snapshot
+    python -m app.routers.dataset.dataset_snapshot --registry ./datasets.json --out ./snapshot
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import time
+from collections.abc import Sequence
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.internal.log.log import log
+from app.routers.dataset.dataset_registry import DATASET_REGISTRY_PATH, DatasetConfig, load_dataset_configs
+
+# .env 환경 변수 추출
+DATASET_SNAPSHOT_DIR = os.getenv('DATASET_SNAPSHOT_DIR', str(Path(__file__).resolve().parent / 'res' / 'snapshot'))  # 비우면 스냅샷 미사용
+DATASET_SNAPSHOT_WRITE = os.getenv('DATASET_SNAPSHOT_WRITE', '0') == '1'  # 스냅샷이 없거나 오래되면 로드 후 저장 (기본 꺼짐: 런타임에 소스 트리에 쓰지 않음)
+
+SNAPSHOT_MAGIC = b"RNBLDS01"
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_ALIGN = 64
+
+# 빌드 결과에 영향이 없는 설정 (바뀌어도 스냅샷을 다시 만들 필요 없음)
+_RUNTIME_FIELDS = ("name", "path", "default_fields")
+
+
+class SnapshotRecords(Sequence):
+    """
+    요약:
+        스냅샷의 레코드 영역을 list[dict]처럼 보여주는 읽기 전용 시퀀스
+
+    설명:
+        레코드는 접근할 때만 해당 구간(offsets[i]:offsets[i+1])의 JSON을 디코딩한다.
+        반경 조회는 결과 레코드만 디코딩하므로, 전체 레코드를 dict로 들고 있지 않는다.
+
+    Attributes:
+        blob(ndarray[uint8]): 레코드 JSON을 이어 붙인 바이트 (mmap)
+        offsets(ndarray[int64]): 레코드별 시작 위치 (길이 = 레코드 수 + 1)
+    """
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray) -> None:
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        return json.loads(self.blob[start:end].tobytes())
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        bounds = self.offsets.tolist()
+        for start, end in zip(bounds, bounds[1:]):
+            yield json.loads(self.blob[start:end].tobytes())
+
+
+def snapshot_path(config: DatasetConfig, snapshot_dir: str = DATASET_SNAPSHOT_DIR) -> Path:
+    return Path(snapshot_dir) / f"{config.name}{SNAPSHOT_SUFFIX}"
+
+
+def _build_key(config: DatasetConfig) -> Dict[str, Any]:
+    """빌드 결과를 결정하는 설정 (헤더에 저장해 비교)"""
+    return {key: value for key, value in asdict(config).items() if key not in _RUNTIME_FIELDS}
+
+
+def _encode_records(records: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+    chunks = [json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") for record in records]
+    offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    return np.frombuffer(b"".join(chunks), dtype=np.uint8), offsets
+
+
+def write_snapshot(config: DatasetConfig, dataset, source_version: Optional[Tuple[int, int]], cell_m: float,
+                   path: Path) -> int:
+    """
+    요약:
+        메모리 저장소(PointDataset/WktDataset)를 스냅샷 파일로 저장하는 함수
+
+    설명:
+        임시 파일에 쓴 뒤 os.replace로 바꿔 넣는다. 이미 열어둔 워커는 기존 파일(inode)을 계속 읽으므로 안전하다.
+
+    Parameters:
+        config(DatasetConfig): 데이터셋 등록 정보
+        dataset: config.build로 만든 저장소
+        source_version(tuple): 원본 JSON의 (mtime_ns, size), 파일이 없으면 None
+        cell_m(float): 격자 크기(m)
+        path(Path): 저장할 스냅샷 경로
+
+    Returns:
+        파일 크기(바이트)
+    """
+    meta, arrays = dataset.snapshot()
+    blob, record_offsets = _encode_records(dataset.records)
+    arrays = {**arrays, "records": blob, "record_offsets": record_offsets}
+
+    # 헤더 길이가 배열 오프셋에 영향을 주므로, 오프셋은 헤더 뒤 상대 위치로 두고 읽을 때 더한다.
+    layout: Dict[str, Dict[str, Any]] = {}
+    position = 0
+    for key, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[key] = array
+        position = -(-position // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+        layout[key] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": position}
+        position += array.nbytes
+
+    header = json.dumps({
+        "name": config.name,
+        "build": _build_key(config),
+        "source": list(source_version) if source_version else None,
+        "cell_m": cell_m,
+        "meta": meta,
+        "arrays": layout,
+    }, ensure_ascii=False).encode("utf-8")
+    data_start = -(-(len(SNAPSHOT_MAGIC) + 8 + len(header)) // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(len(header).to_bytes(8, "little"))
+        f.write(header)
+        for key, array in arrays.items():
+            f.seek(data_start + layout[key]["offset"])
+            f.write(array.tobytes())
+        f.truncate(data_start + position)
+    os.replace(temp, path)
+    return data_start + position
+
+
+def open_snapshot(config: DatasetConfig, source_version: Optional[Tuple[int, int]], cell_m: float,
+                  path: Path):
+    """
+    요약:
+        스냅샷을 읽기 전용 mmap으로 열어 저장소를 복원하는 함수
+
+    설명:
+        배열은 mmap 위의 NumPy 뷰이므로 복사가 없고, 페이지는 실제로 읽을 때 올라온다.
+        스냅샷이 없거나, 원본 버전/빌드 설정/격자 크기가 다르면 None (JSON에서 다시 만들어야 함)
+
+    Returns:
+        PointDataset | WktDataset | None
+    """
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):  # ValueError: 빈 파일
+        return None
+
+    if buffer[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        return None
+    header_end = len(SNAPSHOT_MAGIC) + 8
+    header_length = int.from_bytes(buffer[len(SNAPSHOT_MAGIC):header_end], "little")
+    header = json.loads(buffer[header_end:header_end + header_length])
+
+    source = tuple(header["source"]) if header["source"] else None
+    if source != source_version or header["build"] != _build_key(config) or header["cell_m"] != cell_m:
+        return None
+
+    data_start = -(-(header_end + header_length) // SNAPSHOT_ALIGN) * SNAPSHOT_ALIGN
+    arrays = {}
+    for key, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        arrays[key] = np.frombuffer(buffer, dtype=dtype, count=count,
+                                    offset=data_start + spec["offset"]).reshape(spec["shape"])
+
+    records = SnapshotRecords(arrays.pop("records"), arrays.pop("record_offsets"))
+    return config.restore(records, header["meta"], arrays)
+
+
+def build_snapshots(registry_path: Path = DATASET_REGISTRY_PATH, snapshot_dir: str = DATASET_SNAPSHOT_DIR) -> List[Dict[str, Any]]:
+    """
+    요약:
+        레지스트리의 모든 데이터셋을 JSON에서 다시 만들어 스냅샷으로 저장하는 함수 (빌드 단계)
+
+    Returns:
+        [{ name, records, bytes, seconds, path }, ...]
+    """
+    from app.routers.dataset.dataset_store import DATASET_GRID_CELL_M, DatasetStore
+
+    results = []
+    for config in load_dataset_configs(registry_path).values():
+        started = time.perf_counter()
+        dataset = config.build(config.read())
+        path = snapshot_path(config, snapshot_dir)
+        size = write_snapshot(config, dataset, DatasetStore._version(config.path), DATASET_GRID_CELL_M, path)
+        results.append({
+            "name": config.name,
+            "records": len(dataset),
+            "bytes": size,
+            "seconds": time.perf_counter() - started,
+            "path": str(path),
+        })
+        # LOG. 스냅샷 저장
+        log.info(msg=f"\n\n[DatasetSnapshot] {config.name}: {len(dataset)}건 → {path} ({size} bytes)\n")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--registry", type=Path, default=DATASET_REGISTRY_PATH, help="데이터셋 레지스트리 경로")
+    parser.add_argument("--out", default=DATASET_SNAPSHOT_DIR, help="스냅샷을 저장할 폴더")
+    args = parser.parse_args()
+    print(json.dumps(build_snapshots(args.registry, args.out), ensure_ascii=False, indent=2))
@@ -0,0 +1,450 @@
+# app/routers/dataset/dataset_store.py
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.internal.log.log import log
+from app.routers.dataset.dataset_registry import DATASET_REGISTRY_PATH, DatasetConfig, load_dataset_configs
+from app.routers.dataset.dataset_snapshot import (DATASET_SNAPSHOT_DIR, DATASET_SNAPSHOT_WRITE, open_snapshot,
+                                                  snapshot_path, write_snapshot)
+from app.utils.polyline import Polyline
+from app.utils.radius_filter import EARTH_RADIUS_M, coordinates, haversine_m_array
+from app.utils.spatial_grid import SpatialGrid
+from config.common.singleton import Singleton
+
+# .env 환경 변수 추출
+DATASET_GRID_CELL_M = float(os.getenv('DATASET_GRID_CELL_M', '250'))  # 반경 조회용 격자 한 변의 길이(m)
+DATASET_RELOAD_INTERVAL = float(os.getenv('DATASET_RELOAD_INTERVAL', '5'))  # 파일 변경 확인 주기(초), 0이면 감시 안 함
+
+
+def _within_corridor(grid: SpatialGrid, owners: np.ndarray, polyline: Polyline,
+                     buffer_m: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    경로에서 buffer_m 안인 점(버텍스)의 레코드를 경로상 위치 순으로 반환.
+    레코드에 점이 여럿이면(WKT) 경로에 가장 가까운 점 하나로 대표한다.
+
+    Returns:
+        (record_ids, distance_m, along_m)
+    """
+    boxes = polyline.boxes(buffer_m)
+    if not boxes:
+        return owners[:0], np.empty(0), np.empty(0)
+    candidates = np.unique(np.concatenate([grid.box_candidates(*box) for box in boxes]))
+    distance, along = polyline.locate(grid.lat[candidates], grid.lng[candidates])
+    inside = distance <= buffer_m
+    record_ids, distance, along = owners[candidates[inside]], distance[inside], along[inside]
+
+    # 레코드별 최단 거리 점만 남긴 뒤 경로상 위치 순 정렬
+    order = np.lexsort((distance, record_ids))
+    _, first = np.unique(record_ids[order], return_index=True)
+    nearest = order[first]
+    nearest = nearest[np.argsort(along[nearest], kind="stable")]
+    return record_ids[nearest], distance[nearest], along[nearest]
+
+
+def _nearest(grid: SpatialGrid, owners: np.ndarray, lat: float, lon: float, k: int,
+             max_distance_m: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    가까운 레코드 k개를 거리 순으로 반환 (max_distance_m이 있으면 그 안에서만).
+
+    격자 한 칸 크기에서 시작해 반경을 두 배씩 늘리며 격자 후보만 거리 계산한다.
+    반경 R 안에 레코드가 k개 이상이면 가장 가까운 k개는 모두 R 안에 있으므로 거기서 멈춘다.
+    레코드에 점이 여럿이면(WKT) 가장 가까운 점의 거리로 대표한다.
+
+    Returns:
+        (record_ids, distance_m)
+    """
+    limit = min(max_distance_m, math.pi * EARTH_RADIUS_M) if max_distance_m is not None else math.pi * EARTH_RADIUS_M
+    radius = min(grid.cell_m, limit)
+    while True:
+        candidates = grid.candidates(lat, lon, radius)
+        distance = haversine_m_array(lat, lon, grid.lat[candidates], grid.lng[candidates])
+        inside = distance <= radius
+        record_ids, distance = owners[candidates[inside]], distance[inside]
+
+        # 레코드별 최단 거리
+        order = np.lexsort((distance, record_ids))
+        _, first = np.unique(record_ids[order], return_index=True)
+        nearest = order[first]
+        if len(nearest) >= k or radius >= limit:
+            nearest = nearest[np.argsort(distance[nearest], kind="stable")[:k]]
+            return record_ids[nearest], distance[nearest]
+        radius = min(radius * 2, limit)
+
+
+class PointDataset:
+    """
+    요약:
+        lat/lng 좌표를 가진 데이터셋을 열(column) 단위 NumPy 배열로 들고 있는 메모리 저장소.
+
+    설명:
+        - records는 원본 레코드(dict) 리스트이고, 레코드 id는 리스트 인덱스이다.
+        - 좌표가 있는 레코드만 lat/lng(float64) 배열에 담고, ids로 원래 레코드 id를 가리킨다.
+        - 반경 조회는 배열 연산으로만 수행하므로 요청마다 파일을 읽거나 dict를 순회하지 않는다.
+        - 좌표는 SpatialGrid로 인덱싱해, 반경을 덮는 격자의 점만 거리 계산한다.
+
+    Attributes:
+        name(str): 데이터셋 이름
+        records(Sequence[dict]): 원본 레코드 (id = 인덱스, 스냅샷에서 열었으면 SnapshotRecords)
+        ids(ndarray[int64]): 좌표가 있는 레코드의 id
+        lat(ndarray[float64]), lng(ndarray[float64]): ids와 같은 순서의 위경도(도)
+        grid(SpatialGrid): lat/lng의 공간 인덱스
+    """
+
+    def __init__(self, name: str, records: List[Dict[str, Any]], cell_m: float = DATASET_GRID_CELL_M,
+                 lat_field: str = "lat", lng_field: str = "lng") -> None:
+        self.name = name
+        self.records = records
+
+        # 좌표가 없거나 변환 실패한 레코드는 반경 조회 대상에서 제외
+        self.ids, self.lat, self.lng = coordinates(records, lat_field, lng_field)
+        self.grid = SpatialGrid(self.lat, self.lng, cell_m)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, record_id: int) -> Dict[str, Any]:
+        return self.records[record_id]
+
+    def snapshot(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """스냅샷 저장용 (메타 정보, 배열)"""
+        return {}, {"ids": self.ids, "lat": self.lat, "lng": self.lng, **self.grid.to_arrays()}
+
+    @classmethod
+    def from_snapshot(cls, name: str, records: Sequence[Dict[str, Any]], meta: Dict[str, Any],
+                      arrays: Dict[str, np.ndarray]) -> PointDataset:
+        """스냅샷 배열로 복원 (좌표 추출/격자 정렬 없음)"""
+        dataset = cls.__new__(cls)
+        dataset.name = name
+        dataset.records = records
+        dataset.ids, dataset.lat, dataset.lng = arrays["ids"], arrays["lat"], arrays["lng"]
+        dataset.grid = SpatialGrid.from_arrays(dataset.lat, dataset.lng, arrays)
+        return dataset
+
+    def within_radius(self, lat: float, lon: float, radius_m: float) -> np.ndarray:
+        """반경 안 레코드의 id 배열 (원본 순서)"""
+        return self.ids[self.grid.query(lat, lon, radius_m)]
+
+    def within_box(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> np.ndarray:
+        """사각형(min <= 값 < max) 안 레코드의 id 배열 (원본 순서)"""
+        return self.ids[self.grid.query_box(min_lat, max_lat, min_lon, max_lon)]
+
+    def within_corridor(self, polyline: Polyline, buffer_m: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """경로에서 buffer_m 안인 레코드의 (id, 거리(m), 경로상 위치(m)) 배열 (경로상 위치 순)"""
+        return _within_corridor(self.grid, self.ids, polyline, buffer_m)
+
+    def nearest(self, lat: float, lon: float, k: int,
+                max_distance_m: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """가까운 레코드 k개의 (id, 거리(m)) 배열 (거리 순)"""
+        return _nearest(self.grid, self.ids, lat, lon, k, max_distance_m)
+
+    def query_radius(self, lat: float, lon: float, radius_m: float) -> List[Dict[str, Any]]:
+        """반경 안 레코드 리스트 (원본 순서)"""
+        return [self.records[record_id] for record_id in self.within_radius(lat, lon, radius_m).tolist()]
+
+
+# WKT 문자열에서 숫자만 추출 (POINT / LINESTRING / MULTILINESTRING 공통)
+_NUM_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+"""
+좌표쌍 (x, y)의 축 순서
+- lonlat: x=경도, y=위도 (WKT 표준)
+- latlon: x=위도, y=경도
+- both: 판별 불가 → 두 해석 모두 반경 판정 (기존 동작)
+"""
+AXIS_ORDERS = ("lonlat", "latlon", "both")
+
+
+def detect_axis_order(xs: np.ndarray, ys: np.ndarray) -> str:
+    """
+    데이터셋 전체 좌표로 축 순서를 한 번 판별.
+    위도는 ±90을 넘을 수 없으므로, 한 축만 전부 ±90 안이면 그 축이 위도이다.
+    """
+    if not len(xs):
+        return "both"
+    x_is_lat = bool(np.all(np.abs(xs) <= 90.0))
+    y_is_lat = bool(np.all(np.abs(ys) <= 90.0))
+    if y_is_lat and not x_is_lat:
+        return "lonlat"
+    if x_is_lat and not y_is_lat:
+        return "latlon"
+    return "both"
+
+
+class WktDataset:
+    """
+    요약:
+        WKT 도형(POINT/LINESTRING/MULTILINESTRING)을 가진 데이터셋(예: 횡단보도)을 한 번만 파싱해 들고 있는 메모리 저장소.
+
+    설명:
+        - 로드 시 각 레코드의 WKT를 한 번만 파싱해, 모든 버텍스를 x/y 배열 하나에 이어 붙이고 offsets로 레코드 구간을 표시한다.
+          (레코드 i의 버텍스 = x[offsets[i]:offsets[i+1]])
+        - type_field 값이 point_type인 레코드(횡단보도의 NODE)는 point_wkt_field(POINT)의 첫 좌표 하나,
+          그 외(또는 POINT가 없는 레코드)는 line_wkt_field의 모든 버텍스를 쓴다. 기본값은 횡단보도 형식이다.
+        - 축 순서(lon/lat vs lat/lon)는 데이터셋 단위로 한 번 판별한다. 판별할 수 없으면 두 해석을 모두 버텍스로 넣는다.
+        - 반경 조회는 버텍스 SpatialGrid → 하버사인 → 버텍스가 하나라도 반경 안인 레코드(원본 순서).
+
+    Attributes:
+        name(str): 데이터셋 이름
+        records(Sequence[dict]): 원본 레코드 (id = 인덱스, 스냅샷에서 열었으면 SnapshotRecords)
+        x(ndarray[float64]), y(ndarray[float64]): WKT 좌표쌍 (파싱한 그대로)
+        offsets(ndarray[int64]): 레코드별 버텍스 구간 (길이 = 레코드 수 + 1)
+        axis_order(str): AXIS_ORDERS 중 하나
+        vertex_ids(ndarray[int64]): 반경 판정용 버텍스의 레코드 id
+        lat(ndarray[float64]), lng(ndarray[float64]): vertex_ids와 같은 순서의 위경도(도)
+        grid(SpatialGrid): lat/lng의 공간 인덱스
+    """
+
+    def __init__(self, name: str, records: List[Dict[str, Any]], cell_m: float = DATASET_GRID_CELL_M,
+                 type_field: Optional[str] = "node_type", point_type: Optional[str] = "NODE",
+                 point_wkt_field: Optional[str] = "node_wkt", line_wkt_field: Optional[str] = "lnkg_wkt") -> None:
+        self.name = name
+        self.records = records
+
+        # 1) WKT → 버텍스 배열 (로드 시 1회)
+        xs: List[float] = []
+        ys: List[float] = []
+        offsets = [0]
+        point_type = str(point_type or "").upper()
+        for record in records:
+            numbers: List[float] = []
+            if point_wkt_field and (not type_field or str(record.get(type_field, "")).upper() == point_type):
+                numbers = [float(n) for n in _NUM_RE.findall(record.get(point_wkt_field) or "")][:2]
+            if len(numbers) < 2 and line_wkt_field:  # 선 레코드 또는 좌표 없는 점 → 선의 모든 버텍스
+                numbers = [float(n) for n in _NUM_RE.findall(record.get(line_wkt_field) or "")]
+            pairs = len(numbers) // 2
+            xs.extend(numbers[0:pairs * 2:2])
+            ys.extend(numbers[1:pairs * 2:2])
+            offsets.append(len(xs))
+
+        self.x = np.asarray(xs, dtype=np.float64)
+        self.y = np.asarray(ys, dtype=np.float64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        owners = np.repeat(np.arange(len(records), dtype=np.int64), np.diff(self.offsets))
+
+        # 2) 축 순서 판별 (데이터셋당 1회) → 위경도 배열
+        self.axis_order = detect_axis_order(self.x, self.y)
+        if self.axis_order == "lonlat":
+            lat, lng, ids = self.y, self.x, owners
+        elif self.axis_order == "latlon":
+            lat, lng, ids = self.x, self.y, owners
+        else:
+            lat = np.concatenate([self.y, self.x])
+            lng = np.concatenate([self.x, self.y])
+            ids = np.concatenate([owners, owners])
+
+        valid = (np.abs(lat) <= 90.0) & (np.abs(lng) <= 180.0)  # 위경도로 성립하지 않는 해석은 제외
+        self.vertex_ids = ids[valid]
+        self.lat = lat[valid]
+        self.lng = lng[valid]
+        self.grid = SpatialGrid(self.lat, self.lng, cell_m)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, record_id: int) -> Dict[str, Any]:
+        return self.records[record_id]
+
+    SNAPSHOT_ARRAYS = ("x", "y", "offsets", "vertex_ids", "lat", "lng")
+
+    def snapshot(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """스냅샷 저장용 (메타 정보, 배열)"""
+        arrays = {key: getattr(self, key) for key in self.SNAPSHOT_ARRAYS}
+        return {"axis_order": self.axis_order}, {**arrays, **self.grid.to_arrays()}
+
+    @classmethod
+    def from_snapshot(cls, name: str, records: Sequence[Dict[str, Any]], meta: Dict[str, Any],
+                      arrays: Dict[str, np.ndarray]) -> WktDataset:
+        """스냅샷 배열로 복원 (WKT 파싱/축 판별/격자 정렬 없음)"""
+        dataset = cls.__new__(cls)
+        dataset.name = name
+        dataset.records = records
+        for key in cls.SNAPSHOT_ARRAYS:
+            setattr(dataset, key, arrays[key])
+        dataset.axis_order = meta["axis_order"]
+        dataset.grid = SpatialGrid.from_arrays(dataset.lat, dataset.lng, arrays)
+        return dataset
+
+    def within_radius(self, lat: float, lon: float, radius_m: float) -> np.ndarray:
+        """버텍스가 하나라도 반경 안인 레코드의 id 배열 (원본 순서)"""
+        return np.unique(self.vertex_ids[self.grid.query(lat, lon, radius_m)])
+
+    def within_box(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> np.ndarray:
+        """버텍스가 하나라도 사각형(min <= 값 < max) 안인 레코드의 id 배열 (원본 순서)"""
+        return np.unique(self.vertex_ids[self.grid.query_box(min_lat, max_lat, min_lon, max_lon)])
+
+    def within_corridor(self, polyline: Polyline, buffer_m: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """버텍스가 경로에서 buffer_m 안인 레코드의 (id, 거리(m), 경로상 위치(m)) 배열 (경로상 위치 순)"""
+        return _within_corridor(self.grid, self.vertex_ids, polyline, buffer_m)
+
+    def nearest(self, lat: float, lon: float, k: int,
+                max_distance_m: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """버텍스가 가장 가까운 레코드 k개의 (id, 거리(m)) 배열 (거리 순)"""
+        return _nearest(self.grid, self.vertex_ids, lat, lon, k, max_distance_m)
+
+    def query_radius(self, lat: float, lon: float, radius_m: float) -> List[Dict[str, Any]]:
+        """반경 안 레코드 리스트 (원본 순서)"""
+        return [self.records[record_id] for record_id in self.within_radius(lat, lon, radius_m).tolist()]
+
+
+class DatasetStore(metaclass=Singleton):
+    """
+    요약:
+        레지스트리(datasets.json)에 등록된 데이터셋을 메모리 저장소(PointDataset/WktDataset)로 보관하는 싱글턴.
+
+    설명:
+        - 처음 get(name)이 호출될 때(또는 앱 기동 시 load_all) 파일을 읽고, 이후에는 메모리의 저장소를 반환한다.
+        - watch()를 켜면 백그라운드 스레드가 레지스트리/데이터 파일의 변경(mtime, size)을 감지해 새 저장소를 만들고,
+          다 만든 뒤에 참조 하나만 바꿔 끼운다(atomic swap). 요청은 시작할 때 받은 저장소를 끝까지 쓰므로
+          만들다 만 인덱스를 볼 일이 없다.
+        - 스냅샷(dataset_snapshot)이 원본과 같은 버전이면 JSON 대신 mmap으로 연다. 없거나 오래됐으면 JSON에서 만들고, DATASET_SNAPSHOT_WRITE=1이면 저장한다.
+          워커가 여러 개여도 배열은 같은 파일의 페이지 캐시를 공유한다.
+        - 새 파일을 읽다 실패하거나 파일이 사라지면(쓰는 중인 파일 등) 기존 저장소를 유지하고, 파일이 다시 바뀌면 그때 재시도한다.
+          파일이 없을 때 빈 데이터셋으로 대신하는 것은 최초 로드뿐이다.
+        - 파일 형식은 { "DATA": [...] } 가정.
+
+    Attributes:
+        registry_path(Path): 레지스트리 파일 경로
+    """
+
+    def __init__(self, registry_path: Path = DATASET_REGISTRY_PATH) -> None:
+        self.registry_path = registry_path
+        self._configs: Dict[str, DatasetConfig] = load_dataset_configs(registry_path)
+        self._registry_version = self._version(registry_path)
+        self._datasets: Dict[str, Any] = {}                              # 교체는 dict 통째로(참조 하나) 바꿔 끼운다
+        self._versions: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._failed: Dict[str, Optional[Tuple[int, int]]] = {}          # 로드에 실패한 파일 버전 (같은 버전은 재시도하지 않음)
+        self._lock = threading.Lock()                                    # 빌드 직렬화 (읽기는 잠그지 않음)
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _version(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def names(self) -> List[str]:
+        return list(self._configs)
+
+    def config(self, name: str) -> DatasetConfig:
+        """등록 정보 (없으면 KeyError)"""
+        return self._configs[name]
+
+    def register(self, config: DatasetConfig) -> None:
+        """코드에서 데이터셋 등록 (레지스트리 파일과 같은 이름이면 덮어쓴다)"""
+        self._configs = {**self._configs, config.name: config}
+
+    def get(self, name: str):
+        """현재 저장소 (없으면 로드, 등록되지 않은 이름이면 KeyError)"""
+        dataset = self._datasets.get(name)
+        if dataset is None:
+            self.reload(name)
+            dataset = self._datasets[name]
+        return dataset
+
+    def reload(self, name: str) -> None:
+        """파일을 다시 읽어 새 저장소를 만든 뒤 교체"""
+        with self._lock:
+            config = self._configs[name]
+            version = self._version(config.path)
+            if name in self._datasets and name in self._versions and self._versions[name] == version:
+                return  # 다른 스레드가 이미 최신으로 교체함
+            if version is None and name in self._datasets:
+                # 빈 데이터셋 대체는 최초 로드에만. 이미 로드한 파일이 사라졌으면(교체 중 등) 실패로 보고 기존 저장소를 유지한다.
+                raise FileNotFoundError(f"{config.path} 파일이 없습니다.")
+
+            dataset, source = self._load(config, version), snapshot_path(config)
+            if dataset is None:
+                dataset, source = config.build(config.read()), config.path
+                self._save(config, dataset, version)
+            self._versions[name] = version
+            self._datasets = {**self._datasets, name: dataset}
+
+        # LOG. 교체 결과
+        log.info(msg=f"\n\n[DatasetStore] {name}: {len(dataset)}건 로드 ({source})\n")
+
+    @staticmethod
+    def _load(config: DatasetConfig, version: Optional[Tuple[int, int]]):
+        """원본과 버전이 같은 스냅샷이 있으면 mmap으로 연 저장소, 없으면 None"""
+        if not DATASET_SNAPSHOT_DIR:
+            return None
+        try:
+            return open_snapshot(config, version, DATASET_GRID_CELL_M, snapshot_path(config))
+        except Exception:
+            log.exception(msg=f"\n\n[DatasetStore] {config.name} 스냅샷 읽기 실패 (JSON에서 다시 만듦)\n")
+            return None
+
+    @staticmethod
+    def _save(config: DatasetConfig, dataset, version: Optional[Tuple[int, int]]) -> None:
+        """다음 기동/다른 워커가 쓸 스냅샷 저장 (실패해도 메모리 저장소는 그대로 사용)"""
+        if not DATASET_SNAPSHOT_DIR or not DATASET_SNAPSHOT_WRITE:
+            return
+        try:
+            write_snapshot(config, dataset, version, DATASET_GRID_CELL_M, snapshot_path(config))
+        except OSError:
+            log.exception(msg=f"\n\n[DatasetStore] {config.name} 스냅샷 저장 실패\n")
+
+    def load_all(self) -> None:
+        """등록된 데이터셋을 미리 로드 (앱 기동 시 호출)"""
+        for name in self.names():
+            self.get(name)
+
+    def refresh(self) -> None:
+        """
+        레지스트리/데이터 파일이 바뀐 데이터셋만 다시 로드 (watch 스레드가 주기적으로 호출)
+        """
+        registry_version = self._version(self.registry_path)
+        if registry_version != self._registry_version:
+            configs = load_dataset_configs(self.registry_path)
+            with self._lock:
+                changed = [name for name, config in configs.items() if self._configs.get(name) != config]
+                self._configs = configs
+                self._registry_version = registry_version
+                # 빠진 데이터셋은 제거, 설정이 바뀐 데이터셋은 아래에서 다시 로드 (그때까지는 기존 저장소 유지)
+                self._datasets = {name: dataset for name, dataset in self._datasets.items() if name in configs}
+                for name in changed:
+                    self._versions.pop(name, None)
+                    self._failed.pop(name, None)
+
+        for name, config in self._configs.items():
+            version = self._version(config.path)
+            if name in self._versions and self._versions[name] == version:
+                continue
+            if name in self._failed and self._failed[name] == version:
+                continue
+            try:
+                self.reload(name)
+                self._failed.pop(name, None)
+            except Exception:
+                self._failed[name] = version
+                log.exception(msg=f"\n\n[DatasetStore] {name} 다시 로드 실패 (기존 데이터 유지)\n")
+
+    def watch(self, interval: float = DATASET_RELOAD_INTERVAL) -> None:
+        """interval초마다 refresh하는 백그라운드 스레드 시작"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), name="dataset-watcher", daemon=True)
+        self._watcher.start()
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                log.exception(msg="\n\n[DatasetStore] 레지스트리 갱신 실패\n")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout)
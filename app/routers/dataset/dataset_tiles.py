@@ -0,0 +1,88 @@
+# app/routers/dataset/dataset_tiles.py
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Tuple
+from weakref import WeakKeyDictionary
+
+from config.common.singleton import Singleton
+
+# .env 환경 변수 추출
+DATASET_TILE_CACHE_SIZE = int(os.getenv('DATASET_TILE_CACHE_SIZE', '1024'))  # 데이터셋당 메모리에 둘 타일 수
+DATASET_TILE_MAX_AGE = int(os.getenv('DATASET_TILE_MAX_AGE', '300'))  # Cache-Control max-age(초)
+DATASET_TILE_MIN_ZOOM = int(os.getenv('DATASET_TILE_MIN_ZOOM', '10'))  # 이보다 낮은 줌(넓은 타일)은 거절
+DATASET_TILE_MAX_ZOOM = 22
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """
+    XYZ(Web Mercator) 타일 → 위경도 사각형 (min_lat, max_lat, min_lon, max_lon)
+    y는 북쪽(0)에서 남쪽으로 증가한다.
+    """
+    n = 2 ** z
+
+    def lat(tile_y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return lat(y + 1), lat(y), x / n * 360.0 - 180.0, (x + 1) / n * 360.0 - 180.0
+
+
+@dataclass(frozen=True)
+class Tile:
+    """
+    요약:
+        직렬화가 끝난 타일 응답
+
+    Attributes:
+        body(bytes): 응답 본문 (CommonResponse 형태의 JSON)
+        etag(str): 본문 해시로 만든 강한 ETag (따옴표 포함)
+    """
+    body: bytes
+    etag: str
+
+    @classmethod
+    def of(cls, body: bytes) -> Tile:
+        return cls(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+
+class TileCache(metaclass=Singleton):
+    """
+    요약:
+        자주 요청되는 타일을 직렬화된 채로 보관하는 LRU 캐시 (프로세스 싱글턴)
+
+    설명:
+        - 캐시는 데이터셋 저장소 객체별로 둔다(WeakKeyDictionary). 데이터셋이 다시 로드되어 교체되면
+          기존 저장소와 함께 그 타일들도 사라지므로, 오래된 타일을 따로 무효화할 필요가 없다.
+        - 저장소마다 최근 사용한 capacity개 타일만 유지한다.
+
+    Attributes:
+        capacity(int): 데이터셋당 최대 타일 수
+    """
+
+    def __init__(self, capacity: int = DATASET_TILE_CACHE_SIZE) -> None:
+        self.capacity = capacity
+        self._tiles: WeakKeyDictionary[Any, OrderedDict[Hashable, Tile]] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, dataset, key: Hashable, render: Callable[[], Tile]) -> Tile:
+        """캐시된 타일, 없으면 render()로 만들어 넣은 뒤 반환"""
+        with self._lock:
+            tiles = self._tiles.setdefault(dataset, OrderedDict())
+            tile = tiles.get(key)
+            if tile is not None:
+                tiles.move_to_end(key)
+                return tile
+
+        # 렌더링은 잠금 밖에서 (같은 타일을 동시에 만들어도 결과가 같으므로 무해)
+        tile = render()
+        with self._lock:
+            tiles[key] = tile
+            tiles.move_to_end(key)
+            while len(tiles) > self.capacity:
+                tiles.popitem(last=False)
+        return tile
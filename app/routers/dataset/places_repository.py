@@ -0,0 +1,136 @@
+# app/routers/dataset/places_repository.py
+import os
+import time
+from typing import Iterable
+
+from numpy import ndarray
+from pymilvus import DataType
+
+from app.utils.radius_filter import bounding_box, haversine_m
+from config.database.milvus_database import (MILVUS_COLLECTION_PREFIX, MILVUS_SEARCH_MAX_LIMIT, InsertChunkReport,
+                                             MilvusDatabase, vector_dim)
+from config.database.milvus_index_config import index_config
+from config.models.embedding_provider import embedding_model
+
+# .env 환경 변수 추출
+MILVUS_GEO_OVERFETCH = float(os.getenv('MILVUS_GEO_OVERFETCH', '2'))  # 사각형 모서리에서 탈락할 몫만큼 더 조회하는 배수 (첫 조회)
+
+class PlacesRepository:
+    """
+    요약:
+        장소(데이터셋 레코드) 하이브리드 검색용 Milvus 콜렉션(places)에 접근하는 Repository
+
+    설명:
+        레코드는 임베딩 벡터와 함께 lat/lng를 스칼라 필드로 저장한다.
+        검색 시 위경도 사각형을 Milvus 필터로 먼저 걸고, 하버사인으로 반경을 확정한다(search).
+        원본 레코드는 payload(JSON)로 저장해 검색 결과를 바로 반환한다.
+        COLLECTION_NAME은 별칭(alias)이다. 전체 재색인은 새 콜렉션(places_<생성 시각>)을 채운 뒤 별칭만 바꾼다.
+    """
+    COLLECTION_NAME = f"{MILVUS_COLLECTION_PREFIX}places"
+    PARTITION_NAME = "_default"
+    VECTOR_FIELD = "embedding"
+    TEXT_FIELD = "text"
+    TEXT_MAX_LENGTH = 2048
+    OUTPUT_FIELDS = ["kind", "payload", "lat", "lng"]
+
+    def __init__(self, milvus_database: MilvusDatabase | None = None) -> None:
+        self.milvus_database = milvus_database or MilvusDatabase()
+
+    def ensure_collection(self) -> None:
+        # 콜렉션(별칭)이 없을 때만 생성
+        if self.milvus_database.has_collection(self.COLLECTION_NAME):
+            return
+        self.publish(self.create_collection())
+
+    def create_collection(self) -> str:
+        # 새 실제 콜렉션을 만들고 이름을 반환 (별칭은 아직 바꾸지 않음)
+        collection_name = f"{self.COLLECTION_NAME}_{time.time_ns() // 1_000_000}"
+        schema = self.milvus_database.create_schema(auto_id=True, enable_dynamic_field=False)
+        schema.add_field(field_name="place_id", datatype=DataType.INT64, is_primary=True)
+        schema.add_field(field_name="kind", datatype=DataType.VARCHAR, max_length=64)
+        schema.add_field(field_name="lat", datatype=DataType.DOUBLE)
+        schema.add_field(field_name="lng", datatype=DataType.DOUBLE)
+        schema.add_field(field_name=self.TEXT_FIELD, datatype=DataType.VARCHAR, max_length=self.TEXT_MAX_LENGTH)
+        schema.add_field(field_name="payload", datatype=DataType.JSON)
+        schema.add_field(field_name=self.VECTOR_FIELD, datatype=DataType.FLOAT16_VECTOR, dim=vector_dim)
+
+        index_params = self.milvus_database.prepare_index_params()
+        index_config.add_to(index_params, self.VECTOR_FIELD)  # 인덱스 종류는 .env의 MILVUS_INDEX
+        # 사각형 필터(범위 조건)를 빠르게 하기 위한 스칼라 인덱스
+        index_params.add_index(field_name="lat", index_type="STL_SORT")
+        index_params.add_index(field_name="lng", index_type="STL_SORT")
+        self.milvus_database.create_collection(collection_name, schema, index_params)
+        return collection_name
+
+    def publish(self, collection_name: str) -> None:
+        # 별칭을 새 콜렉션으로 바꾼 뒤, 이전 콜렉션을 삭제
+        previous = self.milvus_database.switch_alias(self.COLLECTION_NAME, collection_name)
+        if previous and previous != collection_name:
+            self.milvus_database.drop_collection(previous)
+
+    def drop_collection(self, collection_name: str) -> None:
+        # 재색인에 실패한 (별칭이 가리키지 않는) 콜렉션 정리용
+        self.milvus_database.drop_collection(collection_name)
+
+    def embedding(self, texts: list[str]) -> list[ndarray]:
+        return embedding_model.embedding(texts)
+
+    def bulk_insert(self, records: Iterable[dict], collection_name: str | None = None) -> list[InsertChunkReport]:
+        # records: kind/lat/lng/text/payload. 벡터는 text로 생성.
+        # collection_name: 재색인 중인 새 콜렉션 (None이면 별칭)
+        return self.milvus_database.bulk_insert(
+            collection_name=collection_name or self.COLLECTION_NAME,
+            partition_name=self.PARTITION_NAME,
+            records=records,
+            text_field=self.TEXT_FIELD,
+            vector_field=self.VECTOR_FIELD,
+        )
+
+    def search(self, vector: ndarray, lat: float, lon: float, radius_m: float, limit: int, kind: str | None = None) -> list[dict]:
+        """
+        요약:
+            반경(radius_m) 안의 장소 중 vector와 가장 유사한 장소를 top-k로 조회하는 함수
+
+        설명:
+            1) 반경 원을 감싸는 위경도 사각형을 lat/lng 스칼라 필터로 만들어 Milvus 안에서 먼저 거른다.
+            2) 사각형 안의 장소만 벡터 검색하고, 3) 하버사인 거리로 모서리(반경 밖)를 제외한다.
+            첫 조회는 limit x MILVUS_GEO_OVERFETCH건이며, 모서리에서 탈락해 limit건을 못 채우면
+            사각형 안의 후보가 바닥나거나 MILVUS_SEARCH_MAX_LIMIT에 닿을 때까지 조회 건수를 두 배로 늘려 다시 조회한다.
+            따라서 limit보다 적게 반환되는 것은 반경 안의 장소가 그만큼뿐이거나, 상한에 닿았을 때뿐이다.
+
+        Parameters:
+            kind(str): 데이터셋 종류 (PlacesService.KINDS에서 검증된 값)
+
+        Returns:
+            [{"id", "distance"(유사도), "distance_m"(기준점과의 거리), "entity"}, ...] 유사도 내림차순
+        """
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_m)
+        filter = f"lat >= {min_lat} and lat <= {max_lat} and lng >= {min_lon} and lng <= {max_lon}"
+        if kind:
+            filter = f'kind == "{kind}" and {filter}'
+
+        fetch = min(max(limit, int(limit * MILVUS_GEO_OVERFETCH)), MILVUS_SEARCH_MAX_LIMIT)
+        while True:
+            hits = self.milvus_database.search(
+                collection_name=self.COLLECTION_NAME,
+                search_field=self.VECTOR_FIELD,
+                data=vector,
+                limit=fetch,
+                filter=filter,
+                output_fields=self.OUTPUT_FIELDS,
+                search_params=index_config.to_search_params(),
+            )[0]
+
+            results: list[dict] = []
+            for hit in hits:
+                entity = hit["entity"]
+                distance_m = haversine_m(lat, lon, float(entity["lat"]), float(entity["lng"]))
+                if distance_m <= radius_m:
+                    results.append({"id": hit["id"], "distance": hit["distance"], "distance_m": distance_m, "entity": entity})
+                    if len(results) == limit:
+                        return results
+
+            # 후보가 바닥났거나(요청보다 적게 옴) 상한에 닿았으면 종료
+            if len(hits) < fetch or fetch >= MILVUS_SEARCH_MAX_LIMIT:
+                return results
+            fetch = min(fetch * 2, MILVUS_SEARCH_MAX_LIMIT)
@@ -0,0 +1,107 @@
+# app/routers/dataset/places_service.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.internal.exception.controlled_exception import ControlledException
+from app.internal.exception.errorcode import dataset_error_code
+from app.routers.dataset.dataset_service import DatasetService
+
+
+class PlacesService:
+    """
+    요약:
+        데이터셋 레코드를 장소 검색 콜렉션에 색인하고, "의미 + 반경" 하이브리드 검색을 수행하는 서비스 레이어.
+
+    설명:
+        - 색인: 데이터셋(KINDS)의 레코드를 이름/주소/상세 항목을 묶은 문장으로 임베딩해 lat/lng와 함께 저장한다.
+        - 검색: 검색어 임베딩 → 반경 사각형으로 Milvus 안에서 사전 필터 → 하버사인으로 반경 확정.
+        - kind는 Milvus 필터 식에 들어가므로 KINDS에 있는 값만 허용한다.
+    """
+
+    # 색인 대상 데이터셋: kind → 문장에 붙일 한글 분류명
+    KINDS = {
+        "drinkingFountains": "음수대",
+    }
+
+    def __init__(self, dataset_service: DatasetService, places_repository) -> None:
+        # places_repository: PlacesRepository (Milvus 의존이라 컨트롤러에서 지연 import)
+        self.dataset_service = dataset_service
+        self.places_repository = places_repository
+
+    # 내부 유틸: 레코드 1건 → 색인 문장
+    @staticmethod
+    def build_text(label: str, obj: Dict[str, Any], text_max_length: int) -> str:
+        # 분류명 / 이름 / 주소 / "상세필드명 상세명" 쌍(cot_name_XX, cot_value_XX)
+        details = [
+            f"{obj.get(f'cot_name_{n:02d}') or ''} {obj[f'cot_value_{n:02d}']}".strip()
+            for n in range(1, 21)
+            if obj.get(f"cot_value_{n:02d}")
+        ]
+        parts = [label, obj.get("cot_conts_name"), obj.get("cot_addr_full_new") or obj.get("cot_addr_full_old"), *details]
+        text = "\n".join(str(part) for part in parts if part)
+        # VARCHAR max_length는 바이트 단위 → UTF-8 기준으로 자름
+        return text.encode("utf-8")[:text_max_length].decode("utf-8", errors="ignore")
+
+    # 내부 유틸: 좌표가 있는 레코드만 색인 문서로 변환
+    def _documents(self) -> Iterator[Dict[str, Any]]:
+        text_max_length = self.places_repository.TEXT_MAX_LENGTH
+        for kind, label in self.KINDS.items():
+            for obj in self.dataset_service.read_dataset(kind):
+                try:
+                    lat, lng = float(obj["lat"]), float(obj["lng"])
+                except (KeyError, TypeError, ValueError):
+                    continue  # 좌표 없거나 변환 실패 → 스킵
+                yield {
+                    "kind": kind,
+                    "lat": lat,
+                    "lng": lng,
+                    "text": self.build_text(label, obj, text_max_length),
+                    "payload": obj,
+                }
+
+    # 전체 재색인: 새 콜렉션에 채운 뒤 별칭을 교체 (기존 색인은 교체 전까지 그대로 검색됨)
+    def index_all(self) -> Dict[str, Any]:
+        collection_name = self.places_repository.create_collection()
+        try:
+            reports = self.places_repository.bulk_insert(self._documents(), collection_name=collection_name)
+        except Exception:
+            self.places_repository.drop_collection(collection_name)
+            raise
+
+        # 실패한 청크가 있으면 불완전한 색인으로 바꾸지 않고 기존 색인을 유지
+        failed_chunks = [report.index for report in reports if report.error]
+        if failed_chunks:
+            self.places_repository.drop_collection(collection_name)
+        else:
+            self.places_repository.publish(collection_name)
+        return {
+            "indexed": sum(report.inserted for report in reports),
+            "failed_chunks": failed_chunks,
+            "published": not failed_chunks,
+        }
+
+    # 하이브리드 검색 (의미 + 반경)
+    def search(
+        self,
+        query: str,
+        lat: float,
+        lon: float,
+        radius_m: float = 1000.0,
+        limit: int = 10,
+        kind: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        if kind is not None and kind not in self.KINDS:
+            raise ControlledException(dataset_error_code.UNKNOWN_PLACE_KIND)
+
+        vector = self.places_repository.embedding([query])[0]
+        hits = self.places_repository.search(vector, lat, lon, radius_m, limit, kind)
+        return [
+            {
+                **hit["entity"]["payload"],
+                "kind": hit["entity"]["kind"],
+                "score": float(hit["distance"]),
+                "distance_m": round(hit["distance_m"], 1),
+            }
+            for hit in hits
+        ]
@@ -1,7 +1,8 @@
 # app/routers/route_geoms/route_geoms_repository.py
+import json
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import func, select
 from app.routers.route_geoms.route_geoms import RouteGeoms
 
 class RouteGeomsRepository:
@@ -29,6 +30,15 @@ class RouteGeomsRepository:
         stmt = select(RouteGeoms).where(RouteGeoms.route_id == route_id)
         return list(self.database.execute(stmt).scalars().all())
 
+    def find_coordinates_by_route_id(self, route_id: int) -> List[List[List[float]]]:
+        # 특정 route의 LINESTRING 좌표만 ([[lon, lat], ...]를 route_geom_id 순으로). 엔티티는 만들지 않음.
+        stmt = (
+            select(func.ST_AsGeoJSON(RouteGeoms.geom))
+            .where(RouteGeoms.route_id == route_id)
+            .order_by(RouteGeoms.route_geom_id)
+        )
+        return [json.loads(geojson)["coordinates"] for geojson in self.database.execute(stmt).scalars().all()]
+
     def delete(self, route_geom: RouteGeoms) -> None:
         # 삭제는 Service에서 commit으로 마무리.
         self.database.delete(route_geom)
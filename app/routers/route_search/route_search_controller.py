@@ -0,0 +1,47 @@
+# app/routers/route_search/route_search_controller.py
+from fastapi import APIRouter, Depends
+from starlette import status
+from sqlalchemy.orm import Session
+
+from app.routers.route_search.route_search_dto import RouteIndexOut, RouteSearchOut, RouteSearchQuery
+from app.routers.route_search.route_search_service import RouteSearchService
+from app.routers.routes.routes_repository import RoutesRepository
+from app.routers.sections.sections_repository import SectionsRepository
+from config.common.common_response import CommonResponse
+from config.database.postgres_database import get_database  # Session 제공
+
+router = APIRouter(prefix="/route-search", tags=["route_search"])
+
+# - 여기서 Service 인스턴스를 DI로 주입한다.
+# - Milvus/임베딩 모델은 무거우므로 첫 검색 요청 때 import(로딩)한다. 앱 기동과 다른 API에는 영향 없음.
+def get_route_search_service(database: Session = Depends(get_database)) -> RouteSearchService:
+    from app.routers.route_search.route_search_repository import RouteSearchRepository
+
+    return RouteSearchService(
+        database,
+        RoutesRepository(database),
+        SectionsRepository(database),
+        RouteSearchRepository(),
+    )
+
+# 의미 검색
+@router.get(
+    "",
+    response_model=CommonResponse[list[RouteSearchOut]],
+    status_code=status.HTTP_200_OK,
+)
+def search(search_query: RouteSearchQuery = Depends(), route_search_service: RouteSearchService = Depends(get_route_search_service)):
+    # 검색어 임베딩 → Milvus top-k(+거리/고도 필터) → Postgres에서 원본 조회
+    routes = route_search_service.search(search_query)
+    return CommonResponse(code=200, message="경로 검색 성공", data=routes)
+
+# 전체 재색인
+@router.post(
+    "/index",
+    response_model=CommonResponse[RouteIndexOut],
+    status_code=status.HTTP_200_OK,
+)
+def index_all(route_search_service: RouteSearchService = Depends(get_route_search_service)):
+    # routes/sections 전체를 임베딩해 검색 콜렉션을 새로 만든다.
+    result = route_search_service.index_all()
+    return CommonResponse(code=200, message="경로 색인 성공", data=result)
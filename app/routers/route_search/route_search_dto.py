@@ -0,0 +1,89 @@
+# app/routers/route_search/route_search_dto.py
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.routers.routes.routes_dto import RouteOut
+
+# 검색 조건 (Query 파라미터)
+class RouteSearchQuery(BaseModel):
+    query: str = Field(
+        ...,
+        min_length=1,
+        description="자연어 검색어. 경로 제목/설명/구간 출발지와 의미가 가까운 경로를 찾는다.",
+        examples=["여의도 근처 평탄한 강변 5km"],
+    )
+    min_distance: Optional[int] = Field(
+        None,
+        ge=0,
+        description="최소 총 거리(미터).",
+        examples=[3000],
+    )
+    max_distance: Optional[int] = Field(
+        None,
+        ge=0,
+        description="최대 총 거리(미터).",
+        examples=[7000],
+    )
+    min_height: Optional[float] = Field(
+        None,
+        description="허용 최저 고도(미터). 경로의 low_height가 이 값 이상이어야 한다.",
+        examples=[0.0],
+    )
+    max_height: Optional[float] = Field(
+        None,
+        description="허용 최고 고도(미터). 경로의 high_height가 이 값 이하여야 한다.",
+        examples=[50.0],
+    )
+    limit: int = Field(
+        10,
+        ge=1,
+        le=100,
+        description="반환할 최대 경로 수.",
+        examples=[10],
+    )
+
+# 검색 결과 DTO
+class RouteSearchOut(RouteOut):
+    score: float = Field(
+        ...,
+        description="검색어와의 코사인 유사도(높을수록 유사).",
+        examples=[0.82],
+    )
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "route_id": 101,
+                    "title": "한강 러닝 코스 A",
+                    "description": "여의도 공원 출발 강변 5km 코스",
+                    "distance": 5000,
+                    "high_height": 22.4,
+                    "low_height": 8.7,
+                    "is_deleted": False,
+                    "created_at": "2025-09-01T00:00:00Z",
+                    "updated_at": "2025-09-08T19:05:12Z",
+                    "score": 0.82,
+                }
+            ]
+        },
+    )
+
+# 색인 결과 DTO
+class RouteIndexOut(BaseModel):
+    indexed: int = Field(
+        ...,
+        description="색인된 경로 수.",
+        examples=[120],
+    )
+    failed_chunks: list[int] = Field(
+        default_factory=list,
+        description="색인에 실패한 청크 번호.",
+        examples=[[]],
+    )
+    published: bool = Field(
+        True,
+        description="새 색인으로 교체했는지 여부. 실패한 청크가 있으면 기존 색인을 유지한다.",
+        examples=[True],
+    )
@@ -0,0 +1,115 @@
+# app/routers/route_search/route_search_repository.py
+import time
+from typing import Iterable
+
+from numpy import ndarray
+from pymilvus import DataType
+
+from config.database.milvus_database import MILVUS_COLLECTION_PREFIX, InsertChunkReport, MilvusDatabase, vector_dim
+from config.database.milvus_index_config import index_config
+from config.models.embedding_provider import embedding_model
+
+class RouteSearchRepository:
+    """
+    요약:
+        경로 검색용 Milvus 콜렉션(route_search)에 접근하는 Repository
+
+    설명:
+        레코드는 route_id(PK), 임베딩 벡터, 스칼라 필터용 distance/high_height/low_height, 원문 text로 구성된다.
+        임베딩 모델(float16 출력)과 맞추기 위해 벡터 필드는 FLOAT16_VECTOR를 사용한다.
+        COLLECTION_NAME은 별칭(alias)이다. 실제 콜렉션은 route_search_<생성 시각>이며,
+        전체 재색인은 새 콜렉션을 채운 뒤 별칭만 바꾸므로 검색이 중단되지 않는다.
+    """
+    COLLECTION_NAME = f"{MILVUS_COLLECTION_PREFIX}route_search"
+    PARTITION_NAME = "_default"
+    VECTOR_FIELD = "embedding"
+    TEXT_FIELD = "text"
+    TEXT_MAX_LENGTH = 4096
+    OUTPUT_FIELDS = ["route_id"]
+
+    def __init__(self, milvus_database: MilvusDatabase | None = None) -> None:
+        self.milvus_database = milvus_database or MilvusDatabase()
+
+    def ensure_collection(self) -> None:
+        # 콜렉션(별칭)이 없을 때만 생성
+        if self.milvus_database.has_collection(self.COLLECTION_NAME):
+            return
+        self.publish(self.create_collection())
+
+    def create_collection(self) -> str:
+        # 새 실제 콜렉션을 만들고 이름을 반환 (별칭은 아직 바꾸지 않음)
+        collection_name = f"{self.COLLECTION_NAME}_{time.time_ns() // 1_000_000}"
+        schema = self.milvus_database.create_schema(auto_id=False, enable_dynamic_field=False)
+        schema.add_field(field_name="route_id", datatype=DataType.INT64, is_primary=True)
+        schema.add_field(field_name="distance", datatype=DataType.INT64)
+        schema.add_field(field_name="high_height", datatype=DataType.FLOAT)
+        schema.add_field(field_name="low_height", datatype=DataType.FLOAT)
+        schema.add_field(field_name=self.TEXT_FIELD, datatype=DataType.VARCHAR, max_length=self.TEXT_MAX_LENGTH)
+        schema.add_field(field_name=self.VECTOR_FIELD, datatype=DataType.FLOAT16_VECTOR, dim=vector_dim)
+
+        index_params = self.milvus_database.prepare_index_params()
+        index_config.add_to(index_params, self.VECTOR_FIELD)  # 인덱스 종류는 .env의 MILVUS_INDEX
+        self.milvus_database.create_collection(collection_name, schema, index_params)
+        return collection_name
+
+    def publish(self, collection_name: str) -> None:
+        # 별칭을 새 콜렉션으로 바꾼 뒤, 이전 콜렉션을 삭제
+        previous = self.milvus_database.switch_alias(self.COLLECTION_NAME, collection_name)
+        if previous and previous != collection_name:
+            self.milvus_database.drop_collection(previous)
+
+    def drop_collection(self, collection_name: str) -> None:
+        # 재색인에 실패한 (별칭이 가리키지 않는) 콜렉션 정리용
+        self.milvus_database.drop_collection(collection_name)
+
+    def embedding(self, texts: list[str]) -> list[ndarray]:
+        return embedding_model.embedding(texts)
+
+    def bulk_insert(self, records: Iterable[dict], collection_name: str | None = None) -> list[InsertChunkReport]:
+        # records: route_id/distance/high_height/low_height/text. 벡터는 text로 생성.
+        # collection_name: 재색인 중인 새 콜렉션 (None이면 별칭)
+        return self.milvus_database.bulk_insert(
+            collection_name=collection_name or self.COLLECTION_NAME,
+            partition_name=self.PARTITION_NAME,
+            records=records,
+            text_field=self.TEXT_FIELD,
+            vector_field=self.VECTOR_FIELD,
+        )
+
+    def upsert(self, records: list[dict]) -> None:
+        # records: bulk_insert와 같은 형식. 같은 route_id는 교체된다.
+        if not records:
+            return
+        vectors = self.embedding([record[self.TEXT_FIELD] for record in records])
+        self.milvus_database.upsert(
+            collection_name=self.COLLECTION_NAME,
+            partition_name=self.PARTITION_NAME,
+            data=[{**record, self.VECTOR_FIELD: vector} for record, vector in zip(records, vectors)],
+        )
+
+    def delete(self, route_ids: list[int]) -> None:
+        if not route_ids:
+            return
+        self.milvus_database.delete(
+            collection_name=self.COLLECTION_NAME,
+            partition_name=self.PARTITION_NAME,
+            filter=f"route_id in {[int(route_id) for route_id in route_ids]}",
+        )
+
+    def is_indexed(self) -> bool:
+        # 최초 색인 전에는 별칭(과 별칭 도입 전의 실제 콜렉션)이 모두 없다.
+        return (self.milvus_database.alias_target(self.COLLECTION_NAME) is not None
+                or self.milvus_database.has_collection(self.COLLECTION_NAME))
+
+    def search(self, vector: ndarray, filter: str, limit: int) -> list[tuple[int, float]]:
+        # [(route_id, score), ...] 유사도 내림차순
+        hits = self.milvus_database.search(
+            collection_name=self.COLLECTION_NAME,
+            search_field=self.VECTOR_FIELD,
+            data=vector,
+            limit=limit,
+            filter=filter,
+            output_fields=self.OUTPUT_FIELDS,
+            search_params=index_config.to_search_params(),
+        )[0]
+        return [(int(hit["id"]), float(hit["distance"])) for hit in hits]
@@ -0,0 +1,129 @@
+# app/routers/route_search/route_search_service.py
+from collections import defaultdict
+from typing import Iterator, List
+
+from sqlalchemy.orm import Session
+
+from app.internal.exception.controlled_exception import ControlledException
+from app.internal.exception.errorcode import route_search_error_code
+from app.routers.route_search.route_search_dto import RouteIndexOut, RouteSearchOut, RouteSearchQuery
+from app.routers.routes.routes import Routes
+from app.routers.routes.routes_dto import RouteOut
+from app.routers.routes.routes_repository import RoutesRepository
+from app.routers.sections.sections import Sections
+from app.routers.sections.sections_repository import SectionsRepository
+
+
+class RouteSearchService:
+    def __init__(
+        self,
+        database: Session,
+        routes_repository: RoutesRepository,
+        sections_repository: SectionsRepository,
+        route_search_repository,  # RouteSearchRepository (Milvus 의존이라 컨트롤러에서 지연 import)
+    ) -> None:
+        # Postgres(원본)와 Milvus(검색 색인)를 함께 다룬다. 원본 수정은 하지 않으므로 commit 없음.
+        self.database = database
+        self.routes_repository = routes_repository
+        self.sections_repository = sections_repository
+        self.route_search_repository = route_search_repository
+
+    # 내부 유틸: 경로 1건을 색인용 문서(레코드)로 변환
+    @staticmethod
+    def build_document(route: Routes, sections: List[Sections], text_max_length: int) -> dict:
+        # 제목/설명/구간 출발지를 한 문장 묶음으로 → 하나의 벡터
+        places = " / ".join(section.start_place for section in sections if section.start_place)
+        text = "\n".join(part for part in (route.title, route.description, places) if part)
+        # VARCHAR max_length는 바이트 단위 → UTF-8 기준으로 자름
+        text = text.encode("utf-8")[:text_max_length].decode("utf-8", errors="ignore")
+        return {
+            "route_id": route.route_id,
+            "distance": int(route.distance),
+            "high_height": float(route.high_height),
+            "low_height": float(route.low_height),
+            "text": text,
+        }
+
+    # 내부 유틸: 소프트 삭제되지 않은 경로들을 색인 문서로 변환
+    def _documents(self, routes: List[Routes], sections: List[Sections]) -> Iterator[dict]:
+        sections_by_route = defaultdict(list)
+        for section in sections:
+            sections_by_route[section.route_id].append(section)
+
+        text_max_length = self.route_search_repository.TEXT_MAX_LENGTH
+        for route in routes:
+            if not route.is_deleted:
+                yield self.build_document(route, sections_by_route[route.route_id], text_max_length)
+
+    # 내부 유틸: 검색 조건 → Milvus 스칼라 필터 식
+    @staticmethod
+    def build_filter(search: RouteSearchQuery) -> str:
+        if search.min_distance is not None and search.max_distance is not None and search.min_distance > search.max_distance:
+            raise ControlledException(route_search_error_code.INVALID_RANGE)
+        if search.min_height is not None and search.max_height is not None and search.min_height > search.max_height:
+            raise ControlledException(route_search_error_code.INVALID_RANGE)
+
+        conditions = []
+        if search.min_distance is not None:
+            conditions.append(f"distance >= {int(search.min_distance)}")
+        if search.max_distance is not None:
+            conditions.append(f"distance <= {int(search.max_distance)}")
+        if search.min_height is not None:
+            conditions.append(f"low_height >= {float(search.min_height)}")
+        if search.max_height is not None:
+            conditions.append(f"high_height <= {float(search.max_height)}")
+        return " and ".join(conditions)
+
+    # 전체 재색인: 새 콜렉션에 채운 뒤 별칭을 교체 (기존 색인은 교체 전까지 그대로 검색됨)
+    def index_all(self) -> RouteIndexOut:
+        collection_name = self.route_search_repository.create_collection()
+        try:
+            # 섹션은 한 번의 쿼리로 전체 조회
+            documents = self._documents(self.routes_repository.find_all(), self.sections_repository.find_all())
+            reports = self.route_search_repository.bulk_insert(documents, collection_name=collection_name)
+        except Exception:
+            self.route_search_repository.drop_collection(collection_name)
+            raise
+
+        # 실패한 청크가 있으면 불완전한 색인으로 바꾸지 않고 기존 색인을 유지
+        failed_chunks = [report.index for report in reports if report.error]
+        if failed_chunks:
+            self.route_search_repository.drop_collection(collection_name)
+        else:
+            self.route_search_repository.publish(collection_name)
+        return RouteIndexOut(
+            indexed=sum(report.inserted for report in reports),
+            failed_chunks=failed_chunks,
+            published=not failed_chunks,
+        )
+
+    # 부분 동기화 (outbox 워커가 호출)
+    def sync_routes(self, upsert_ids: List[int], delete_ids: List[int]) -> None:
+        # upsert 대상 중 삭제/소프트 삭제된 경로는 색인에서 제거
+        routes = self.routes_repository.find_by_ids(upsert_ids)
+        live_ids = [route.route_id for route in routes]
+        sections = self.sections_repository.find_by_route_ids(live_ids)
+
+        self.route_search_repository.ensure_collection()
+        self.route_search_repository.upsert(list(self._documents(routes, sections)))
+        self.route_search_repository.delete(sorted(set(delete_ids) | (set(upsert_ids) - set(live_ids))))
+
+    # 의미 검색 (벡터 유사도 + 거리/고도 필터)
+    def search(self, search: RouteSearchQuery) -> List[RouteSearchOut]:
+        filter_expression = self.build_filter(search)
+        # 최초 색인 전이면 Milvus 오류(500) 대신 색인이 없다고 응답
+        if not self.route_search_repository.is_indexed():
+            raise ControlledException(route_search_error_code.ROUTE_SEARCH_INDEX_NOT_BUILT)
+        vector = self.route_search_repository.embedding([search.query])[0]
+        hits = self.route_search_repository.search(vector, filter_expression, search.limit)
+
+        # 색인과 원본 사이 시차가 있을 수 있으므로, 원본(Postgres)에 살아있는 경로만 유사도 순서대로 반환
+        routes = {route.route_id: route for route in self.routes_repository.find_by_ids([route_id for route_id, _ in hits])}
+        results = [
+            RouteSearchOut(**RouteOut.model_validate(routes[route_id]).model_dump(), score=score)
+            for route_id, score in hits
+            if route_id in routes
+        ]
+        if not results:
+            raise ControlledException(route_search_error_code.ROUTE_SEARCH_NOT_FOUND)
+        return results
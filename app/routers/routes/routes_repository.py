@@ -24,6 +24,13 @@ class RoutesRepository:
         # 전체 조회. scalars()로 엔티티 컬럼만 뽑고, all() → list 캐스팅.
         return list(self.database.execute(select(Routes)).scalars().all())
 
+    def find_by_ids(self, route_ids: List[int]) -> List[Routes]:
+        # 여러 PK를 한 번에 조회(소프트 삭제 제외). 순서는 보장하지 않음.
+        if not route_ids:
+            return []
+        stmt = select(Routes).where(Routes.route_id.in_(route_ids), Routes.is_deleted.is_(False))
+        return list(self.database.execute(stmt).scalars().all())
+
     def delete(self, route: Routes) -> None:
         # 삭제는 Service에서 commit으로 마무리.
         self.database.delete(route)
@@ -5,15 +5,20 @@ from sqlalchemy.exc import IntegrityError
 
 from app.internal.exception.controlled_exception import ControlledException
 from app.internal.exception.errorcode import routes_error_code
+from app.internal.outbox import vector_outbox_repository as outbox
+from app.internal.outbox.vector_outbox_repository import VectorOutboxRepository
 from app.routers.routes.routes import Routes
 from app.routers.routes.routes_dto import RouteCreate, RouteUpdate
 from app.routers.routes.routes_repository import RoutesRepository
 
 class RoutesService:
-    def __init__(self, database: Session, routes_repository: RoutesRepository) -> None:
+    def __init__(self, database: Session, routes_repository: RoutesRepository,
+                 vector_outbox_repository: VectorOutboxRepository | None = None) -> None:
         # Service는 트랜잭션 경계(Commit/Rollback) + 의미있는 예외 매핑 담당.
         self.database = database
         self.routes_repository = routes_repository
+        # 검색 색인(Milvus) 동기화 이벤트는 같은 트랜잭션에 outbox로 기록
+        self.vector_outbox_repository = vector_outbox_repository or VectorOutboxRepository(database)
 
     # 생성
     def create_route(self, route_create: RouteCreate) -> Routes:
@@ -26,6 +31,7 @@ class RoutesService:
         )
         try:
             self.routes_repository.save(route) # flush까지 하고 PK 확보
+            self.vector_outbox_repository.enqueue(outbox.ROUTE, route.route_id, outbox.UPSERT)
             self.database.commit() # [핵심] 트랜잭션 확정은 Service에서만
         except IntegrityError as e:
             self.database.rollback()
@@ -63,6 +69,8 @@ class RoutesService:
             if k in allowed and k != "route_id":
                 setattr(route, k, v)
 
+        operation = outbox.DELETE if route.is_deleted else outbox.UPSERT
+        self.vector_outbox_repository.enqueue(outbox.ROUTE, route.route_id, operation)
         try:
             self.database.commit()
         except IntegrityError as e:
@@ -79,5 +87,6 @@ class RoutesService:
         if not route:
             raise ControlledException(routes_error_code.ROUTE_NOT_FOUND)
         self.routes_repository.delete(route)
+        self.vector_outbox_repository.enqueue(outbox.ROUTE, route_id, outbox.DELETE)
         self.database.commit()  # delete는 커밋까지 해야 반영
         return route
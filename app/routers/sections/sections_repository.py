@@ -43,6 +43,20 @@ class SectionsRepository:
         )
         return list(self.database.execute(stmt).scalars().all())
 
+    def find_by_route_ids(self, route_ids: List[int]) -> List[Sections]:
+        # 여러 route의 섹션들을 한 번에(소프트 삭제 제외). section_id ASC 정렬.
+        if not route_ids:
+            return []
+        stmt = (
+            select(Sections)
+            .where(
+                Sections.route_id.in_(route_ids),
+                Sections.is_deleted.is_(False),
+            )
+            .order_by(Sections.section_id.asc())
+        )
+        return list(self.database.execute(stmt).scalars().all())
+
     def delete(self, section: Sections) -> None:
         # 삭제는 Service에서 commit으로 마무리.
         self.database.delete(section)
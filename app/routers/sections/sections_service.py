@@ -5,15 +5,20 @@ from sqlalchemy.exc import IntegrityError
 
 from app.internal.exception.controlled_exception import ControlledException
 from app.internal.exception.errorcode import sections_error_code
+from app.internal.outbox import vector_outbox_repository as outbox
+from app.internal.outbox.vector_outbox_repository import VectorOutboxRepository
 from app.routers.sections.sections import Sections
 from app.routers.sections.sections_dto import SectionCreate, SectionUpdate
 from app.routers.sections.sections_repository import SectionsRepository
 
 class SectionsService:
-    def __init__(self, database: Session, sections_repository: SectionsRepository) -> None:
+    def __init__(self, database: Session, sections_repository: SectionsRepository,
+                 vector_outbox_repository: VectorOutboxRepository | None = None) -> None:
         # Service는 트랜잭션 경계(Commit/Rollback) + 의미있는 예외 매핑 담당.
         self.database = database
         self.sections_repository = sections_repository
+        # 섹션은 경로 검색 문서에 포함되므로, 바뀌면 소속 경로를 다시 색인
+        self.vector_outbox_repository = vector_outbox_repository or VectorOutboxRepository(database)
 
     # 생성
     def create_section(self, section_create: SectionCreate) -> Sections:
@@ -24,6 +29,7 @@ class SectionsService:
         )
         try:
             self.sections_repository.save(section)  # flush까지 하고 PK 확보
+            self.vector_outbox_repository.enqueue(outbox.ROUTE, section.route_id, outbox.UPSERT)
             self.database.commit()                  # 트랜잭션 확정은 Service에서만
         except IntegrityError as e:
             self.database.rollback()
@@ -59,6 +65,8 @@ class SectionsService:
         if not section:
             raise ControlledException(sections_error_code.SECTION_NOT_FOUND)
 
+        previous_route_id = section.route_id
+
         # 화이트리스트 필드만 반영
         allowed = {"route_id", "distance", "slope", "is_deleted"}
         data = section_update.model_dump(exclude_none=True)
@@ -66,6 +74,9 @@ class SectionsService:
             if k in allowed and k != "section_id":
                 setattr(section, k, v)
 
+        # 다른 경로로 옮겨졌으면 이전 경로도 다시 색인
+        for route_id in {previous_route_id, section.route_id}:
+            self.vector_outbox_repository.enqueue(outbox.ROUTE, route_id, outbox.UPSERT)
         try:
             self.database.commit()
         except IntegrityError as e:
@@ -80,5 +91,6 @@ class SectionsService:
         if not section:
             raise ControlledException(sections_error_code.SECTION_NOT_FOUND)
         self.sections_repository.delete(section)
+        self.vector_outbox_repository.enqueue(outbox.ROUTE, section.route_id, outbox.UPSERT)
         self.database.commit()
         return section
@@ -0,0 +1,111 @@
+# app/utils/polyline.py
+from __future__ import annotations
+
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.radius_filter import DEG2RAD, EARTH_RADIUS_M
+
+# 점 x 선분 거리 행렬을 나눠 계산할 때 한 번에 만들 최대 원소 수
+_CHUNK_ELEMENTS = 1 << 20
+
+
+class Polyline:
+    """
+    요약:
+        경로(LINESTRING 여러 개)를 선분 배열로 들고, 점들과의 최단 거리와 경로상 위치를 벡터 연산으로 구하는 클래스
+
+    설명:
+        - 경로 평균 위도 기준 등장방형(equirectangular) 투영으로 미터 좌표를 만든 뒤 점-선분 거리를 계산한다.
+          도시 규모(수십 km) 경로에서 하버사인 대비 오차는 무시할 수준이다.
+        - 여러 LINESTRING은 주어진 순서대로 이어 달리는 것으로 보고, 경로상 위치(along_m)를 누적한다.
+          (LINESTRING 사이는 선분으로 잇지 않는다)
+
+    Attributes:
+        lat(ndarray), lng(ndarray): 모든 버텍스의 위경도(도)
+        length_m(float): 전체 경로 길이(m)
+    """
+
+    def __init__(self, lines: Sequence[Sequence[Sequence[float]]]) -> None:
+        """
+        Parameters:
+            lines: [[[lon, lat], ...], ...] (GeoJSON LINESTRING 좌표 순서)
+        """
+        lines = [np.asarray(line, dtype=np.float64).reshape(-1, 2) for line in lines if len(line)]
+        vertices = np.concatenate(lines) if lines else np.empty((0, 2), dtype=np.float64)
+        self.lng, self.lat = vertices[:, 0], vertices[:, 1]
+
+        ref_lat = float(self.lat.mean()) if len(self.lat) else 0.0
+        self._ref_lng = float(self.lng.mean()) if len(self.lng) else 0.0
+        self._ky = EARTH_RADIUS_M * DEG2RAD
+        self._kx = self._ky * math.cos(ref_lat * DEG2RAD)
+
+        # 선분 시작/끝점 (버텍스가 하나뿐인 선은 길이 0인 선분 하나로 둔다)
+        starts = [line[:-1] if len(line) > 1 else line for line in lines]
+        ends = [line[1:] if len(line) > 1 else line for line in lines]
+        starts = np.concatenate(starts) if starts else np.empty((0, 2), dtype=np.float64)
+        ends = np.concatenate(ends) if ends else np.empty((0, 2), dtype=np.float64)
+        self._segment_lat = np.stack([starts[:, 1], ends[:, 1]], axis=1)  # boxes()용
+        self._segment_lng = np.stack([starts[:, 0], ends[:, 0]], axis=1)
+
+        # 선분 시작점/방향 벡터(m), 시작점의 경로상 위치(m)
+        a, b = self._project(starts), self._project(ends)
+        self._ax, self._ay = a[:, 0], a[:, 1]
+        self._dx, self._dy = b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]
+        self._len2 = self._dx ** 2 + self._dy ** 2
+        lengths = np.sqrt(self._len2)
+        self._along = np.concatenate([[0.0], np.cumsum(lengths)[:-1]]) if len(lengths) else lengths
+        self.length_m = float(lengths.sum())
+
+    def __len__(self) -> int:
+        """선분 수"""
+        return len(self._ax)
+
+    def _project(self, lnglat: np.ndarray) -> np.ndarray:
+        return np.stack([(lnglat[:, 0] - self._ref_lng) * self._kx, lnglat[:, 1] * self._ky], axis=1)
+
+    def boxes(self, buffer_m: float, group: int = 8) -> List[Tuple[float, float, float, float]]:
+        """
+        연속한 선분 group개씩 묶어, buffer_m만큼 넓힌 위경도 사각형 (min_lat, max_lat, min_lon, max_lon) 목록.
+        경로 전체를 덮는 사각형 하나보다 후보 점이 훨씬 적다(대각선 경로).
+        """
+        dlat = buffer_m / self._ky + 1e-9
+        result = []
+        for start in range(0, len(self), group):
+            lat = self._segment_lat[start:start + group]
+            lng = self._segment_lng[start:start + group]
+            min_lat, max_lat = float(lat.min()) - dlat, float(lat.max()) + dlat
+            dlng = dlat / max(math.cos(max(abs(min_lat), abs(max_lat)) * DEG2RAD), 1e-6)
+            result.append((min_lat, max_lat, float(lng.min()) - dlng, float(lng.max()) + dlng))
+        return result
+
+    def locate(self, lat: np.ndarray, lng: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        점들의 (경로까지 최단 거리(m), 가장 가까운 지점의 경로상 위치(m))
+
+        점 x 선분 행렬로 한 번에 계산하되, 메모리를 위해 점을 나눠 처리한다.
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        distance = np.full(len(lat), np.inf)
+        along = np.zeros(len(lat))
+        if not len(self) or not len(lat):
+            return distance, along
+
+        px = (lng - self._ref_lng) * self._kx
+        py = lat * self._ky
+        safe_len2 = np.where(self._len2 > 0, self._len2, 1.0)  # 길이 0인 선분은 t=0 (시작점)
+        rows = max(_CHUNK_ELEMENTS // len(self), 1)
+        for start in range(0, len(lat), rows):
+            ex = px[start:start + rows, None] - self._ax[None, :]
+            ey = py[start:start + rows, None] - self._ay[None, :]
+            t = np.clip((ex * self._dx + ey * self._dy) / safe_len2, 0.0, 1.0)
+            dist2 = (ex - t * self._dx) ** 2 + (ey - t * self._dy) ** 2
+
+            nearest = dist2.argmin(axis=1)
+            picked = np.arange(len(nearest))
+            distance[start:start + rows] = np.sqrt(dist2[picked, nearest])
+            along[start:start + rows] = self._along[nearest] + t[picked, nearest] * np.sqrt(self._len2[nearest])
+        return distance, along
@@ -4,21 +4,24 @@ from __future__ import annotations
 import math
 from typing import Iterable, Any, Mapping, List, TypeVar
 
+import numpy as np
+
 T = TypeVar("T")
 
 EARTH_RADIUS_M = 6_371_000.0  # meters
 DEG2RAD = math.pi / 180.0
+_BOX_EPSILON_DEG = 1e-9  # 사각형 경계의 부동소수 오차 여유
 
 
-def _get_lat_lon(o: Any) -> tuple[float, float]:
+def _get_lat_lon(o: Any, lat_key: str = "lat", lng_key: str = "lng") -> tuple[float, float]:
     """dict(키: lat/lng) 또는 속성(lat/lng) 모두 지원."""
     # dict 스타일 우선
     if isinstance(o, Mapping):
-        lat_raw = o.get("lat")
-        lon_raw = o.get("lng")
+        lat_raw = o.get(lat_key)
+        lon_raw = o.get(lng_key)
     else:
-        lat_raw = getattr(o, "lat", None)
-        lon_raw = getattr(o, "lng", None)
+        lat_raw = getattr(o, lat_key, None)
+        lon_raw = getattr(o, lng_key, None)
 
     if lat_raw is None or lon_raw is None:
         raise ValueError("lat/lng missing")
@@ -26,6 +29,112 @@ def _get_lat_lon(o: Any) -> tuple[float, float]:
     return float(lat_raw), float(lon_raw)
 
 
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 위경도(도) 사이의 하버사인 거리(m)."""
+    lat1_rad = lat1 * DEG2RAD
+    lat2_rad = lat2 * DEG2RAD
+    dlat = lat2_rad - lat1_rad
+    dlon = (lon2 - lon1) * DEG2RAD
+
+    a = (math.sin(dlat / 2) ** 2) + math.cos(lat1_rad) * math.cos(lat2_rad) * (math.sin(dlon / 2) ** 2)
+    return EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def haversine_m_array(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """기준점(도)에서 좌표 배열(도)까지의 하버사인 거리(m) 배열."""
+    lat_rad = lat * DEG2RAD
+    lats_rad = np.radians(lats)
+    dlat = lats_rad - lat_rad
+    dlon = np.radians(lons) - lon * DEG2RAD
+
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat_rad) * np.cos(lats_rad) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def bounding_box(lat: float, lon: float, radius: float) -> tuple[float, float, float, float]:
+    """
+    반경 원을 감싸는 위경도 사각형 (min_lat, max_lat, min_lon, max_lon).
+
+    사각형 안이라고 반경 안은 아니므로(모서리), 정확한 판정은 haversine_m으로 한 번 더 한다.
+    경도 폭은 asin(sin(d) / cos(lat))로 구한다(원의 동서 끝은 기준 위도보다 극 쪽에 있으므로 d / cos(lat)보다 넓다).
+    극이 원 안에 들어오는 경우처럼 경도 폭을 정할 수 없으면 경도는 전체(-180~180)로 둔다.
+    """
+    angular = radius / EARTH_RADIUS_M
+    dlat = angular / DEG2RAD + _BOX_EPSILON_DEG
+    sin_ratio = math.sin(min(angular, math.pi / 2)) / max(math.cos(lat * DEG2RAD), 1e-12)
+    if angular >= math.pi / 2 or sin_ratio >= 1.0:
+        return lat - dlat, lat + dlat, -180.0, 180.0
+    dlon = math.asin(sin_ratio) / DEG2RAD + _BOX_EPSILON_DEG
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
+
+
+def coordinates(objects: Iterable[Any], lat_key: str = "lat", lng_key: str = "lng") -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    객체들의 위경도(lat_key/lng_key)를 한 번에 배열로 추출.
+
+    Returns:
+        (indices, lats, lons) 좌표가 있는 객체의 원래 인덱스와 위경도(도). 좌표 없거나 변환 실패한 객체는 제외.
+    """
+    objects = objects if isinstance(objects, list) else list(objects or [])
+
+    # 빠른 경로: 전부 dict면 lat/lng를 모아 NumPy가 한 번에 float 변환 (None → NaN)
+    if all(isinstance(obj, Mapping) for obj in objects):
+        try:
+            lats = np.array([obj.get(lat_key) for obj in objects], dtype=np.float64)
+            lons = np.array([obj.get(lng_key) for obj in objects], dtype=np.float64)
+        except (TypeError, ValueError):
+            pass  # 변환 불가 값이 섞여 있음 → 객체별로 처리
+        else:
+            valid = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+            return valid.astype(np.int64), lats[valid], lons[valid]
+
+    indices: List[int] = []
+    lats: List[float] = []
+    lons: List[float] = []
+    for index, obj in enumerate(objects):
+        try:
+            lat, lon = _get_lat_lon(obj, lat_key, lng_key)
+        except (TypeError, ValueError):
+            continue  # 좌표 없거나 변환 실패 → 스킵
+        indices.append(index)
+        lats.append(lat)
+        lons.append(lon)
+    return (np.asarray(indices, dtype=np.int64),
+            np.asarray(lats, dtype=np.float64),
+            np.asarray(lons, dtype=np.float64))
+
+
+def radius_indices(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    camera_lat: float,
+    camera_lon: float,
+    radius: float = 500.0,
+) -> np.ndarray:
+    """
+    좌표 배열 중 반경(m) 안에 있는 위치의 인덱스 (오름차순).
+
+    1) 위경도 사각형 비교(저렴)로 후보를 거른 뒤 2) 살아남은 좌표만 하버사인으로 확정한다.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    min_lat, max_lat, min_lon, max_lon = bounding_box(camera_lat, camera_lon, radius)
+    mask = (lats >= min_lat) & (lats <= max_lat)
+    if min_lon > -180.0 or max_lon < 180.0:
+        # 날짜변경선(±180)을 넘는 사각형은 경도를 360도 돌려서도 비교
+        lon_mask = (lons >= min_lon) & (lons <= max_lon)
+        if min_lon < -180.0:
+            lon_mask |= lons >= min_lon + 360.0
+        if max_lon > 180.0:
+            lon_mask |= lons <= max_lon - 360.0
+        mask &= lon_mask
+
+    candidates = np.flatnonzero(mask)
+    distances = haversine_m_array(camera_lat, camera_lon, lats[candidates], lons[candidates])
+    return candidates[distances <= radius]
+
+
 def radius_filter(
     objects: Iterable[T],
     camera_lat: float,
@@ -33,34 +142,14 @@ def radius_filter(
     radius: float = 500.0,
 ) -> List[T]:
     """
-    특정 반경(m) 안의 객체만 필터링하여 반환.
+    특정 반경(m) 안의 객체만 필터링하여 반환 (입력 순서 유지).
 
     objects: 각 원소가 lat/lng(도) 좌표를 가진 dict 또는 객체
     camera_lat / camera_lon: 기준 위경도(도)
     radius: 반경(m)
-    """
-    cam_lat_rad = camera_lat * DEG2RAD
-    cam_lon_rad = camera_lon * DEG2RAD
-    cos_cam_lat = math.cos(cam_lat_rad)
-
-    out: List[T] = []
-    for obj in objects or []:
-        try:
-            lat, lon = _get_lat_lon(obj)
-        except (TypeError, ValueError):
-            continue  # 좌표 없거나 변환 실패 → 스킵
-
-        # 하버사인
-        lat_rad = lat * DEG2RAD
-        lon_rad = lon * DEG2RAD
-        dlat = lat_rad - cam_lat_rad
-        dlon = lon_rad - cam_lon_rad
-
-        a = (math.sin(dlat / 2) ** 2) + cos_cam_lat * math.cos(lat_rad) * (math.sin(dlon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        distance = EARTH_RADIUS_M * c
 
-        if distance <= radius:
-            out.append(obj)
-
-    return out
+    같은 객체들을 여러 번 조회한다면 coordinates()로 배열을 한 번만 만들고 radius_indices()를 쓰세요.
+    """
+    objects = list(objects or [])
+    indices, lats, lons = coordinates(objects)
+    return [objects[i] for i in indices[radius_indices(lats, lons, camera_lat, camera_lon, radius)].tolist()]
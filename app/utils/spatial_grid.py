@@ -0,0 +1,138 @@
+# app/utils/spatial_grid.py
+from __future__ import annotations
+
+import math
+from typing import Dict
+
+import numpy as np
+
+from app.utils.radius_filter import DEG2RAD, EARTH_RADIUS_M, bounding_box, haversine_m_array
+
+
+class SpatialGrid:
+    """
+    요약:
+        위경도 점들을 균일한 격자(cell)로 나눈 공간 인덱스. 반경 조회 시 후보 격자의 점만 거리 계산한다.
+
+    설명:
+        - 데이터셋 평균 위도 기준 등장방형(equirectangular) 투영으로 격자 크기를 미터(cell_m)로 맞춘다.
+          투영이 위경도에 대해 선형이므로, 반경을 감싸는 위경도 사각형은 정확히 격자 사각형으로 대응된다.
+        - 점들은 격자 키 순서로 정렬해 두고(order), 격자별 시작/끝 위치(starts/ends)만 보관한다.
+        - 조회 비용은 전체 점 수가 아니라 후보 격자 안의 점 수에 비례한다.
+
+    Attributes:
+        lat(ndarray), lng(ndarray): 인덱싱한 위경도(도)
+        cell_m(float): 격자 한 변의 길이(m, 기준 위도에서)
+    """
+
+    def __init__(self, lat: np.ndarray, lng: np.ndarray, cell_m: float = 250.0) -> None:
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lng = np.asarray(lng, dtype=np.float64)
+        self.cell_m = cell_m
+
+        # 격자 한 칸의 위경도 크기 (기준 위도 = 평균 위도)
+        ref_lat = float(self.lat.mean()) if len(self.lat) else 0.0
+        self._cell_lat = (cell_m / EARTH_RADIUS_M) / DEG2RAD
+        self._cell_lng = self._cell_lat / max(math.cos(ref_lat * DEG2RAD), 1e-6)
+
+        if not len(self.lat):
+            self._keys = self._starts = self._ends = self._order = np.empty(0, dtype=np.int64)
+            self._cx_min = self._cy_min = 0
+            self._width = self._height = 0
+            return
+
+        cx = np.floor(self.lng / self._cell_lng).astype(np.int64)
+        cy = np.floor(self.lat / self._cell_lat).astype(np.int64)
+        self._cx_min, self._cy_min = int(cx.min()), int(cy.min())
+        self._width = int(cx.max()) - self._cx_min + 1
+        self._height = int(cy.max()) - self._cy_min + 1
+
+        # 격자 키 순서로 정렬 → 격자별 연속 구간
+        keys = (cy - self._cy_min) * self._width + (cx - self._cx_min)
+        self._order = np.argsort(keys, kind="stable")
+        self._keys, self._starts, counts = np.unique(keys[self._order], return_index=True, return_counts=True)
+        self._ends = self._starts + counts
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        인덱스 상태를 배열로 내보냄 (데이터셋 스냅샷 저장용, from_arrays로 복원)
+        """
+        meta = [self.cell_m, self._cell_lat, self._cell_lng, self._cx_min, self._cy_min, self._width, self._height]
+        return {
+            "grid_meta": np.asarray(meta, dtype=np.float64),
+            "grid_order": self._order,
+            "grid_keys": self._keys,
+            "grid_starts": self._starts,
+            "grid_ends": self._ends,
+        }
+
+    @classmethod
+    def from_arrays(cls, lat: np.ndarray, lng: np.ndarray, arrays: Dict[str, np.ndarray]) -> SpatialGrid:
+        """
+        to_arrays로 내보낸 배열로 인덱스 복원 (정렬/격자 계산 없이 배열만 연결, 읽기 전용 mmap 배열도 그대로 사용)
+        """
+        grid = cls.__new__(cls)
+        grid.lat, grid.lng = lat, lng
+        cell_m, grid._cell_lat, grid._cell_lng, cx_min, cy_min, width, height = arrays["grid_meta"].tolist()
+        grid.cell_m = cell_m
+        grid._cx_min, grid._cy_min, grid._width, grid._height = int(cx_min), int(cy_min), int(width), int(height)
+        grid._order = arrays["grid_order"]
+        grid._keys = arrays["grid_keys"]
+        grid._starts = arrays["grid_starts"]
+        grid._ends = arrays["grid_ends"]
+        return grid
+
+    def candidates(self, lat: float, lon: float, radius_m: float) -> np.ndarray:
+        """
+        반경을 감싸는 격자들에 속한 점의 인덱스 (정렬되지 않음, 반경 밖 점 포함)
+        """
+        return self.box_candidates(*bounding_box(lat, lon, radius_m))
+
+    def box_candidates(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> np.ndarray:
+        """
+        위경도 사각형과 겹치는 격자들에 속한 점의 인덱스 (정렬되지 않음, 사각형 밖 점 포함)
+        """
+        if not len(self.lat):
+            return self._order
+
+        x0 = max(int(math.floor(min_lon / self._cell_lng)) - self._cx_min, 0)
+        x1 = min(int(math.floor(max_lon / self._cell_lng)) - self._cx_min, self._width - 1)
+        y0 = max(int(math.floor(min_lat / self._cell_lat)) - self._cy_min, 0)
+        y1 = min(int(math.floor(max_lat / self._cell_lat)) - self._cy_min, self._height - 1)
+        if x0 > x1 or y0 > y1:
+            return self._order[:0]
+
+        # 후보 격자가 비어있지 않은 격자 수보다 많으면 전체를 보는 편이 싸다.
+        if (x1 - x0 + 1) * (y1 - y0 + 1) >= len(self._keys):
+            return self._order
+
+        rows = np.arange(y0, y1 + 1, dtype=np.int64)[:, None] * self._width
+        cells = (rows + np.arange(x0, x1 + 1, dtype=np.int64)[None, :]).ravel()
+        # 비어있지 않은 격자만 (cells는 오름차순이므로 searchsorted로 찾는다)
+        positions = np.searchsorted(self._keys, cells)
+        found = positions < len(self._keys)
+        found[found] = self._keys[positions[found]] == cells[found]
+        positions = positions[found]
+        if not len(positions):
+            return self._order[:0]
+        return np.concatenate([self._order[start:end] for start, end in zip(self._starts[positions], self._ends[positions])])
+
+    def query_box(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> np.ndarray:
+        """
+        사각형 안 점의 인덱스 (오름차순). 경계는 min <= 값 < max (맞닿은 사각형끼리 점이 겹치지 않게)
+        """
+        candidates = self.box_candidates(min_lat, max_lat, min_lon, max_lon)
+        lat, lng = self.lat[candidates], self.lng[candidates]
+        inside = (lat >= min_lat) & (lat < max_lat) & (lng >= min_lon) & (lng < max_lon)
+        return np.sort(candidates[inside])
+
+    def query(self, lat: float, lon: float, radius_m: float) -> np.ndarray:
+        """
+        반경 안 점의 인덱스 (오름차순 = 원본 순서). 후보 격자의 점만 하버사인으로 확정한다.
+        """
+        candidates = self.candidates(lat, lon, radius_m)
+        distances = haversine_m_array(lat, lon, self.lat[candidates], self.lng[candidates])
+        return np.sort(candidates[distances <= radius_m])
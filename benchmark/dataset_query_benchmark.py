@@ -0,0 +1,294 @@
+# benchmark/dataset_query_benchmark.py
+"""
+데이터셋 질의(DatasetService)의 로드 시간, 메모리, 질의 지연(p50/p99)을 데이터 규모/밀도별로 측정하는 벤치마크
+
+합성 데이터셋을 만들어 JSON 파일로 쓴 뒤, 앱과 같은 경로(DatasetStore → DatasetService)로 로드/질의한다.
+- geometry: point(음수대 형식, lat/lng 문자열) / line(횡단보도 형식, LINESTRING WKT)
+- density: dense(도심 약 3km 사각형) / city(서울) / sparse(남한 전체)에 같은 개수를 흩뿌린다.
+- 백엔드
+    - memory: 메모리 저장소(공간 격자) - 기본
+    - postgis: dataset_features 테이블 (--postgis, 로컬 Postgres 필요)
+    - radius_filter: 인덱스 없이 레코드 전체를 훑는 radius_filter (점 데이터셋, --baseline-max 이하 크기만)
+- 질의: radius(read_drinking_fountains/read_crosswalks와 같은 iter_dataset), nearest(kNN), corridor(경로 주변), tile(memory)
+- 로드: JSON 로드(파싱 + 인덱싱), 스냅샷 쓰기/열기(memory), 적재(postgis)
+- 메모리: 레코드(dict) 크기(tracemalloc)와 인덱스 배열 크기(memory), 행 크기 합(postgis)
+
+결과는 JSON(표준 출력, --output 지정 시 파일에도)이므로 리뷰에서 이전 결과와 비교할 수 있다.
+
+실행:
+    python -m benchmark.dataset_query_benchmark --sizes 1000 10000 100000 --queries 200
+    python -m benchmark.dataset_query_benchmark --sizes 100000 1000000 --densities city --postgis --output result.json
+"""
+import os
+
+# 합성 데이터셋의 스냅샷이 앱 폴더(res/snapshot)에 남지 않도록 앱 모듈 import 전에 끈다. (스냅샷은 임시 폴더에서 따로 측정)
+os.environ["DATASET_SNAPSHOT_DIR"] = ""
+
+import argparse
+import json
+import math
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from app.routers.dataset.dataset_backend import MemoryDatasetBackend
+from app.routers.dataset.dataset_registry import DatasetConfig
+from app.routers.dataset.dataset_service import DatasetService
+from app.routers.dataset.dataset_snapshot import open_snapshot, write_snapshot
+from app.routers.dataset.dataset_store import DATASET_GRID_CELL_M, DatasetStore
+from app.routers.dataset.dataset_tiles import DATASET_TILE_MIN_ZOOM
+from app.utils.radius_filter import DEG2RAD, EARTH_RADIUS_M, radius_filter
+
+# (min_lat, max_lat, min_lon, max_lon)
+DENSITIES = {
+    "dense": (37.550, 37.577, 126.962, 126.996),  # 도심 약 3km 사각형
+    "city": (37.42, 37.70, 126.76, 127.18),       # 서울
+    "sparse": (34.5, 38.0, 126.3, 129.3),         # 남한
+}
+GEOMETRIES = ("point", "line")
+QUERY_TYPES = ("radius", "nearest", "corridor", "tile")
+
+# 횡단보도(line) 한 레코드의 버텍스 수/간격, 경로(corridor 질의)의 버텍스 수/간격
+LINE_VERTICES = (2, 6)
+LINE_STEP_M = 15.0
+ROUTE_VERTICES = 40
+ROUTE_STEP_M = 100.0
+
+
+def _walk(rng: np.random.Generator, lat: float, lon: float, steps: int, step_m: float) -> list[list[float]]:
+    """(lat, lon)에서 시작해 step_m씩 임의 방향으로 걷는 [[lon, lat], ...]"""
+    headings = rng.uniform(0, 2 * math.pi, steps)
+    dlat = np.cos(headings) * step_m / (EARTH_RADIUS_M * DEG2RAD)
+    dlon = np.sin(headings) * step_m / (EARTH_RADIUS_M * DEG2RAD * math.cos(lat * DEG2RAD))
+    lats = lat + np.concatenate([[0.0], np.cumsum(dlat)])
+    lons = lon + np.concatenate([[0.0], np.cumsum(dlon)])
+    return [[x, y] for x, y in zip(lons.tolist(), lats.tolist())]
+
+
+def make_records(geometry: str, count: int, extent: tuple, seed: int = 0) -> list[dict]:
+    """
+    실제 데이터셋과 같은 형식의 레코드 생성
+    - point: { id, name, lat, lng } (위경도는 문자열)
+    - line: { id, node_type: "LINK", lnkg_wkt: "LINESTRING(lon lat, ...)" }
+    """
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(extent[0], extent[1], count).tolist()
+    lons = rng.uniform(extent[2], extent[3], count).tolist()
+    if geometry == "point":
+        return [{"id": i, "name": f"synthetic-{i}", "lat": f"{lat:.9f}", "lng": f"{lon:.9f}"}
+                for i, (lat, lon) in enumerate(zip(lats, lons))]
+
+    records = []
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        line = _walk(rng, lat, lon, int(rng.integers(*LINE_VERTICES)) - 1, LINE_STEP_M)
+        wkt = "LINESTRING(" + ", ".join(f"{x:.9f} {y:.9f}" for x, y in line) + ")"
+        records.append({"id": i, "node_type": "LINK", "lnkg_wkt": wkt})
+    return records
+
+
+def make_config(geometry: str, name: str, path: Path) -> DatasetConfig:
+    if geometry == "point":
+        return DatasetConfig(name=name, path=path, geometry="point")
+    return DatasetConfig(name=name, path=path, geometry="wkt", type_field="node_type", point_type="NODE",
+                         point_wkt_field="node_wkt", line_wkt_field="lnkg_wkt")
+
+
+def make_queries(count: int, extent: tuple, seed: int = 1) -> dict:
+    """질의 종류별 입력 (같은 시드 → 백엔드 간 같은 질의)"""
+    rng = np.random.default_rng(seed)
+    centers = list(zip(rng.uniform(extent[0], extent[1], count).tolist(),
+                       rng.uniform(extent[2], extent[3], count).tolist()))
+    zoom = max(DATASET_TILE_MIN_ZOOM, 15)
+    tiles = []
+    for lat, lon in centers:
+        x = int((lon + 180.0) / 360.0 * 2 ** zoom)
+        y = int((1.0 - math.asinh(math.tan(lat * DEG2RAD)) / math.pi) / 2.0 * 2 ** zoom)
+        tiles.append((zoom, x, y))
+    routes = [[_walk(rng, lat, lon, ROUTE_VERTICES - 1, ROUTE_STEP_M)] for lat, lon in centers]
+    return {"centers": centers, "tiles": tiles, "routes": routes}
+
+
+def latency(function, inputs: list, warmup: int) -> dict:
+    """입력마다 function(결과 수 또는 None 반환)을 실행해 지연(ms) 분포와 평균 결과 수"""
+    for item in inputs[:warmup]:
+        function(item)
+    elapsed, counts = [], []
+    for item in inputs:
+        start = time.perf_counter()
+        count = function(item)
+        elapsed.append(time.perf_counter() - start)
+        if count is not None:
+            counts.append(count)
+    elapsed = np.asarray(elapsed) * 1000
+    return {
+        "p50_ms": float(np.percentile(elapsed, 50)),
+        "p99_ms": float(np.percentile(elapsed, 99)),
+        "mean_ms": float(elapsed.mean()),
+        "mean_results": float(np.mean(counts)) if counts else None,
+    }
+
+
+def run_queries(service: DatasetService, name: str, queries: dict, query_types: list[str],
+                radius_m: float, k: int, buffer_m: float, warmup: int) -> dict:
+    """DatasetService 공개 메서드로 질의 종류별 지연 측정"""
+    def tile(zxy: tuple) -> None:
+        service.read_tile(name, *zxy)  # 응답은 직렬화된 본문이라 결과 수는 세지 않는다.
+
+    runners = {
+        "radius": (lambda c: len(list(service.iter_dataset(name, c[0], c[1], radius_m))), queries["centers"]),
+        "nearest": (lambda c: len(service.read_nearest(name, c[0], c[1], k)), queries["centers"]),
+        "corridor": (lambda route: len(service.read_corridor(name, route, buffer_m)), queries["routes"]),
+        "tile": (tile, queries["tiles"]),
+    }
+    return {query: latency(*runners[query], warmup) for query in query_types}
+
+
+def run_memory(config: DatasetConfig, records_bytes: int, queries: dict, args, work_dir: Path) -> dict:
+    """memory 백엔드: JSON 로드, 스냅샷 쓰기/열기, 인덱스 크기, 질의 지연"""
+    from app.routers.dataset.dataset_tiles import TileCache
+
+    # 케이스마다 새 저장소/타일 캐시 (이전 케이스의 데이터셋을 메모리에서 내린다)
+    DatasetStore.reset_instance()
+    TileCache.reset_instance()
+    store = DatasetStore()
+    store.register(config)
+    service = DatasetService(store=store, tiles=TileCache(capacity=0),  # 타일은 캐시 없이 렌더링 비용만 측정
+                             backend=MemoryDatasetBackend(store))
+
+    start = time.perf_counter()
+    dataset = store.get(config.name)  # 앱과 같은 경로 (JSON 파싱 + 좌표 추출 + 격자)
+    load_s = time.perf_counter() - start
+
+    _, arrays = dataset.snapshot()
+    snapshot = work_dir / f"{config.name}.snapshot"
+    start = time.perf_counter()
+    snapshot_bytes = write_snapshot(config, dataset, None, DATASET_GRID_CELL_M, snapshot)
+    snapshot_write_s = time.perf_counter() - start
+    start = time.perf_counter()
+    opened = open_snapshot(config, None, DATASET_GRID_CELL_M, snapshot)
+    snapshot_open_s = time.perf_counter() - start
+    assert opened is not None and len(opened) == len(dataset)
+
+    return {
+        "backend": "memory",
+        "load_s": load_s,
+        "snapshot_write_s": snapshot_write_s,
+        "snapshot_open_s": snapshot_open_s,
+        "records_bytes": records_bytes,
+        "index_bytes": int(sum(array.nbytes for array in arrays.values())),
+        "snapshot_bytes": snapshot_bytes,
+        "queries": run_queries(service, config.name, queries, args.query_types, args.radius, args.k, args.buffer,
+                               args.warmup),
+    }
+
+
+def run_postgis(config: DatasetConfig, database, queries: dict, args) -> dict:
+    """postgis 백엔드: dataset_features 적재 시간, 행 크기, 질의 지연 (측정 후 적재한 행은 지운다)"""
+    from sqlalchemy import text
+
+    from app.routers.dataset.dataset_backend import PostgisDatasetBackend
+    from app.routers.dataset.dataset_features_import import feature_rows
+    from app.routers.dataset.dataset_features_repository import DatasetFeaturesRepository
+
+    store = DatasetStore()
+    repository = DatasetFeaturesRepository(database)
+    service = DatasetService(store=store, backend=PostgisDatasetBackend(repository))
+
+    start = time.perf_counter()
+    repository.replace(config.name, feature_rows(store.get(config.name)))
+    database.commit()
+    database.execute(text("ANALYZE dataset_features"))
+    load_s = time.perf_counter() - start
+
+    table_bytes = database.scalar(
+        text("SELECT COALESCE(SUM(pg_column_size(f.*)), 0) FROM dataset_features f WHERE f.dataset = :dataset"),
+        {"dataset": config.name},
+    )
+    # 타일은 메모리 저장소 전용이므로 제외
+    query_types = [query for query in args.query_types if query != "tile"]
+    try:
+        result = run_queries(service, config.name, queries, query_types, args.radius, args.k, args.buffer, args.warmup)
+    finally:
+        repository.replace(config.name, [])
+        database.commit()
+    return {"backend": "postgis", "load_s": load_s, "table_bytes": int(table_bytes), "queries": result}
+
+
+def run_baseline(records: list[dict], queries: dict, args) -> dict:
+    """radius_filter: 인덱스 없이 질의마다 레코드 전체를 훑는 기존 경로"""
+    return {
+        "backend": "radius_filter",
+        "queries": {"radius": latency(lambda c: len(radius_filter(records, c[0], c[1], args.radius)),
+                                      queries["centers"], args.warmup)},
+    }
+
+
+def run(args) -> list[dict]:
+    work_dir = Path(tempfile.mkdtemp(prefix="dataset_query_benchmark_"))
+    database = None
+    if args.postgis:
+        from app.routers.dataset.dataset_features import DatasetFeatures
+        from config.database.postgres_database import Base, SessionLocal, engine, ensure_postgis
+
+        ensure_postgis()
+        Base.metadata.create_all(bind=engine, tables=[DatasetFeatures.__table__])
+        database = SessionLocal()
+
+    results = []
+    try:
+        for geometry in args.geometries:
+            for density in args.densities:
+                extent = DENSITIES[density]
+                queries = make_queries(args.queries, extent)
+                for size in args.sizes:
+                    name = f"bench_{geometry}_{density}_{size}"
+                    path = work_dir / f"{name}.json"
+
+                    # 레코드(dict) 크기: JSON을 읽어 만든 레코드가 잡은 메모리
+                    records = make_records(geometry, size, extent)
+                    path.write_text(json.dumps({"DATA": records}), encoding="utf-8")
+                    del records
+                    config = make_config(geometry, name, path)
+                    tracemalloc.start()
+                    records = config.read()
+                    records_bytes = tracemalloc.get_traced_memory()[0]
+                    tracemalloc.stop()
+
+                    case = {"geometry": geometry, "density": density, "size": size}
+                    results.append({**case, **run_memory(config, records_bytes, queries, args, work_dir)})
+                    if database is not None:
+                        results.append({**case, **run_postgis(config, database, queries, args)})
+                    if geometry == "point" and size <= args.baseline_max and "radius" in args.query_types:
+                        results.append({**case, **run_baseline(records, queries, args)})
+                    path.unlink()
+    finally:
+        if database is not None:
+            database.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="레코드 수")
+    parser.add_argument("--geometries", nargs="+", choices=GEOMETRIES, default=list(GEOMETRIES), help="데이터셋 종류")
+    parser.add_argument("--densities", nargs="+", choices=list(DENSITIES), default=list(DENSITIES), help="분포 범위")
+    parser.add_argument("--query-types", nargs="+", choices=QUERY_TYPES, default=list(QUERY_TYPES), help="질의 종류")
+    parser.add_argument("--queries", type=int, default=200, help="질의 종류별 질의 수")
+    parser.add_argument("--warmup", type=int, default=10, help="측정 전 워밍업 질의 수")
+    parser.add_argument("--radius", type=float, default=500.0, help="반경 질의 반경(m)")
+    parser.add_argument("--k", type=int, default=5, help="kNN 질의 k")
+    parser.add_argument("--buffer", type=float, default=30.0, help="경로 주변 질의 거리(m)")
+    parser.add_argument("--baseline-max", type=int, default=100_000, help="radius_filter(전체 스캔)를 측정할 최대 크기")
+    parser.add_argument("--postgis", action="store_true", help="postgis 백엔드도 측정 (로컬 Postgres 필요)")
+    parser.add_argument("--output", type=Path, help="결과 JSON을 저장할 경로")
+    args = parser.parse_args()
+
+    output = json.dumps(run(args), ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    print(output)
@@ -0,0 +1,75 @@
+# benchmark/embedding_backend_benchmark.py
+"""
+임베딩 백엔드(torch/int8/onnx)별 처리량과 fp32 대비 정확도를 측정하는 벤치마크
+
+실행:
+    python -m benchmark.embedding_backend_benchmark --backends torch int8 onnx --texts 512
+"""
+import argparse
+import json
+import random
+import time
+
+import numpy as np
+
+from config.models.embedding_model import EMBEDDING_BACKENDS, EmbeddingModel
+from config.models.embedding_provider import embedding_model
+
+# 실제 데이터와 비슷한 길이 분포를 만들기 위한 문장 조각
+_FRAGMENTS = [
+    "한강 러닝 코스", "여의도 공원 출발", "마포대교를 건너는 평탄한 구간", "남산 순환로 오르막",
+    "초반 2km는 경사가 심하므로 페이스를 낮춰 주세요.", "음수대와 화장실이 있는 쉼터",
+    "자전거 도로와 분리된 보행로", "야간에도 조명이 밝은 코스", "횡단보도 신호 대기 구간",
+]
+
+
+def make_texts(count: int, seed: int = 0) -> list[str]:
+    """
+    짧은 제목부터 긴 설명까지 섞인 텍스트를 생성하는 함수
+    """
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(_FRAGMENTS, k=rng.choice([1, 2, 4, 8, 32]))) for _ in range(count)]
+
+
+def run(backends: list[str], count: int, repeat: int) -> list[dict]:
+    texts = make_texts(count)
+    reference = None
+    results = []
+    for backend in backends:
+        # 모듈 싱글턴과 같은 백엔드면 재사용(모델 중복 로딩 방지)
+        model = embedding_model if backend == embedding_model.backend else EmbeddingModel(backend=backend)
+        model.embedding(texts[:8])  # 워밍업
+
+        elapsed = []
+        vectors = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            vectors = model.embedding(texts)
+            elapsed.append(time.perf_counter() - start)
+
+        matrix = np.stack(vectors).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        if backend == "torch":
+            reference = matrix
+        cosine = np.sum(matrix * reference, axis=1) if reference is not None else None
+
+        results.append({
+            "backend": backend,
+            "texts": count,
+            "texts_per_second": count / min(elapsed),
+            "min_cosine_vs_fp32": None if cosine is None else float(cosine.min()),
+            "mean_cosine_vs_fp32": None if cosine is None else float(cosine.mean()),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=list(EMBEDDING_BACKENDS), choices=EMBEDDING_BACKENDS)
+    parser.add_argument("--texts", type=int, default=256, help="측정에 사용할 텍스트 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수(최솟값 기준으로 보고)")
+    args = parser.parse_args()
+
+    # fp32 기준값이 먼저 계산되도록 torch를 맨 앞으로
+    ordered = sorted(args.backends, key=lambda b: b != "torch")
+    print(json.dumps(run(ordered, args.texts, args.repeat), ensure_ascii=False, indent=2))
@@ -0,0 +1,125 @@
+# benchmark/embedding_projection_benchmark.py
+"""
+임베딩 차원 축소(Matryoshka 절단/PCA)의 recall@k를 원본 차원과 비교하는 벤치마크
+
+원본 차원의 코사인 top-k를 정답으로 두고, 축소 벡터로 구한 top-k가 얼마나 겹치는지 측정한다.
+
+실행:
+    python -m benchmark.embedding_projection_benchmark --corpus 2000 --queries 200 --dims 64 128 256 512
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmark.embedding_backend_benchmark import make_texts
+from config.models.embedding_provider import embedding_model
+from config.models.embedding_projection import EmbeddingProjection, TruncateProjection
+
+
+class PCAProjection(EmbeddingProjection):
+    """
+    요약:
+        표본 임베딩으로 학습한 PCA 행렬로 투영
+
+    설명:
+        절단(TruncateProjection)과 품질을 비교하는 벤치마크 전용 투영이다.
+        콜렉션에 적용하려면 학습한 행렬을 콜렉션과 함께 저장해 모든 호스트/워커가 불러와야 하는데,
+        현재 콜렉션 투영은 스키마의 dim만으로 정해지는 절단만 지원하므로 서비스 코드에는 두지 않는다.
+
+    Attributes:
+        mean(ndarray): 표본 평균 (원본 차원)
+        components(ndarray): 주성분 행렬 (dim, 원본 차원)
+    """
+    KIND = "pca"
+
+    def __init__(self, dim: int, mean: np.ndarray, components: np.ndarray):
+        super().__init__(dim)
+        self.mean = mean
+        self.components = components
+
+    @classmethod
+    def fit(cls, vectors: list[np.ndarray], dim: int) -> 'PCAProjection':
+        """
+        요약:
+            표본 임베딩으로 PCA 행렬을 학습하는 함수
+
+        Parameters:
+            vectors(list[ndarray]): 콜렉션에 저장될 데이터와 분포가 비슷한 표본 임베딩 (dim개 이상)
+            dim(int): 투영 후 차원 수
+        """
+        matrix = np.stack(vectors).astype(np.float32)
+        if dim > min(matrix.shape):
+            raise ValueError(f"PCA 차원({dim})은 표본 수/원본 차원({min(matrix.shape)})보다 클 수 없습니다.")
+        mean = matrix.mean(axis=0)
+        # SVD의 오른쪽 특이벡터가 주성분 (분산이 큰 순서)
+        _, _, vt = np.linalg.svd(matrix - mean, full_matrices=False)
+        return cls(dim, mean, vt[:dim].copy())
+
+    def _project(self, matrix: np.ndarray) -> np.ndarray:
+        return (matrix - self.mean) @ self.components.T
+
+
+def top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """
+    정규화된 벡터의 내적(=코사인) 기준 top-k 인덱스
+    """
+    scores = queries @ corpus.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def recall_at_k(truth: np.ndarray, found: np.ndarray) -> float:
+    hits = [len(set(t) & set(f)) for t, f in zip(truth.tolist(), found.tolist())]
+    return float(np.mean(hits) / truth.shape[1])
+
+
+def evaluate(projection: EmbeddingProjection, corpus: list[np.ndarray], queries: list[np.ndarray],
+             truth: np.ndarray, k: int) -> dict:
+    reduced_corpus = np.stack(projection.apply(corpus)).astype(np.float32)
+    reduced_queries = np.stack(projection.apply(queries)).astype(np.float32)
+
+    start = time.perf_counter()
+    found = top_k(reduced_corpus, reduced_queries, k)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "projection": projection.KIND,
+        "dim": projection.dim,
+        f"recall@{k}": recall_at_k(truth, found),
+        "bytes_per_vector": projection.dim * 2,  # float16
+        "search_seconds": elapsed,
+    }
+
+
+def run(corpus_size: int, query_size: int, dims: list[int], k: int) -> list[dict]:
+    corpus = embedding_model.embedding(make_texts(corpus_size, seed=1))
+    queries = embedding_model.embedding(make_texts(query_size, seed=2))
+
+    full_corpus = np.stack(corpus).astype(np.float32)
+    full_queries = np.stack(queries).astype(np.float32)
+    start = time.perf_counter()
+    truth = top_k(full_corpus, full_queries, k)
+    results = [{
+        "projection": "full",
+        "dim": full_corpus.shape[1],
+        f"recall@{k}": 1.0,
+        "bytes_per_vector": full_corpus.shape[1] * 2,
+        "search_seconds": time.perf_counter() - start,
+    }]
+
+    for dim in dims:
+        results.append(evaluate(TruncateProjection(dim), corpus, queries, truth, k))
+        results.append(evaluate(PCAProjection.fit(corpus, dim), corpus, queries, truth, k))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=int, default=2000, help="검색 대상 텍스트 수")
+    parser.add_argument("--queries", type=int, default=200, help="질의 텍스트 수")
+    parser.add_argument("--dims", type=int, nargs="+", default=[64, 128, 256, 512], help="비교할 축소 차원")
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.corpus, args.queries, args.dims, args.k), ensure_ascii=False, indent=2))
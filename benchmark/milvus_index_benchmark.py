@@ -0,0 +1,159 @@
+# benchmark/milvus_index_benchmark.py
+"""
+Milvus 벡터 인덱스(FLAT/IVF/HNSW/양자화)별 빌드 시간, 메모리, QPS, recall@k를 비교하는 벤치마크
+
+로컬 Milvus Lite 파일(--uri)에 인덱스별 콜렉션을 만들고, 우리 임베딩 모델로 만든 벡터로 측정한다.
+정답은 numpy로 구한 코사인 전수 비교 top-k이다.
+결과 중 recall@k가 --min-recall 이상이면서 QPS가 가장 높은 인덱스를 .env의 MILVUS_INDEX로 추천한다.
+
+주의:
+    Milvus Lite는 일부 인덱스 종류만 지원하며, 지원하지 않는 종류는 다른 인덱스로 대체하거나 오류를 낸다.
+    실제로 만들어진 인덱스 종류는 결과의 built_index_type으로 확인하고, 운영 Milvus에서 다시 측정하세요.
+
+실행:
+    python -m benchmark.milvus_index_benchmark --corpus 5000 --queries 200 --indexes FLAT IVF_FLAT IVF_SQ8 IVF_PQ HNSW
+"""
+import argparse
+import json
+import time
+from itertools import islice
+
+import numpy as np
+from pymilvus import DataType, MilvusClient
+
+from app.routers.dataset.dataset_service import DatasetService
+from app.routers.dataset.places_service import PlacesService
+from benchmark.embedding_backend_benchmark import make_texts
+from config.database.milvus_index_config import INDEX_PRESETS, MilvusIndexConfig
+from config.models.embedding_provider import embedding_model
+
+VECTOR_FIELD = "embedding"
+INSERT_CHUNK_SIZE = 1000
+
+
+def corpus_texts(count: int) -> list[str]:
+    """
+    데이터셋 레코드(장소 색인 문장)를 먼저 쓰고, 모자라면 합성 문장으로 채운다.
+    """
+    dataset_service = DatasetService()
+    texts = [PlacesService.build_text(label, obj, 2048)
+             for kind, label in PlacesService.KINDS.items()
+             for obj in dataset_service.read_dataset(kind)]
+    return (texts + make_texts(max(count - len(texts), 0), seed=1))[:count]
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def estimated_bytes(config: MilvusIndexConfig, count: int, dim: int) -> int:
+    """
+    인덱스가 올라갔을 때의 대략적인 메모리(바이트). Milvus Lite는 사용량을 노출하지 않으므로 구조로 추정한다.
+    """
+    raw = count * dim * 2  # float16 원본
+    if config.index_type == "IVF_SQ8":
+        return count * dim + config.params["nlist"] * dim * 4
+    if config.index_type == "IVF_PQ":
+        codebooks = config.params["m"] * (2 ** config.params["nbits"]) * (dim // config.params["m"]) * 4
+        return count * config.params["m"] * config.params["nbits"] // 8 + codebooks
+    if config.index_type == "IVF_FLAT":
+        return raw + config.params["nlist"] * dim * 4
+    if config.index_type == "HNSW":
+        return raw + count * config.params["M"] * 2 * 8  # 레벨 0 이웃 목록
+    return raw
+
+
+def measure(client: MilvusClient, name: str, config: MilvusIndexConfig, corpus: list[np.ndarray],
+            queries: list[np.ndarray], truth: np.ndarray, k: int) -> dict:
+    collection_name = f"index_benchmark_{name.lower()}"
+    if client.has_collection(collection_name):
+        client.drop_collection(collection_name)
+
+    dim = len(corpus[0])
+    schema = client.create_schema(auto_id=False, enable_dynamic_field=False)
+    schema.add_field(field_name="id", datatype=DataType.INT64, is_primary=True)
+    schema.add_field(field_name=VECTOR_FIELD, datatype=DataType.FLOAT16_VECTOR, dim=dim)
+    client.create_collection(collection_name=collection_name, schema=schema)
+
+    # 1) 적재 (인덱스 없이)
+    rows = iter({"id": i, VECTOR_FIELD: vector} for i, vector in enumerate(corpus))
+    while chunk := list(islice(rows, INSERT_CHUNK_SIZE)):
+        client.insert(collection_name=collection_name, data=chunk)
+    client.flush(collection_name=collection_name)
+
+    # 2) 인덱스 빌드 + 로딩
+    start = time.perf_counter()
+    index_params = config.add_to(client.prepare_index_params(), VECTOR_FIELD)
+    client.create_index(collection_name=collection_name, index_params=index_params, sync=True)
+    client.load_collection(collection_name=collection_name)
+    build_seconds = time.perf_counter() - start
+    built = client.describe_index(collection_name=collection_name, index_name=VECTOR_FIELD)
+
+    # 3) 질의 1건씩 (지연 시간/QPS)
+    search_params = config.to_search_params()
+    latencies = []
+    found = []
+    for query in queries:
+        start = time.perf_counter()
+        hits = client.search(collection_name=collection_name, data=[query], anns_field=VECTOR_FIELD,
+                             limit=k, search_params=search_params)[0]
+        latencies.append(time.perf_counter() - start)
+        found.append([int(hit["id"]) for hit in hits])
+
+    recall = np.mean([len(set(t) & set(f)) / k for t, f in zip(truth.tolist(), found)])
+    client.drop_collection(collection_name)
+    return {
+        "index": name,
+        "built_index_type": built.get("index_type"),
+        "params": config.params,
+        "search_params": config.search_params,
+        "vectors": len(corpus),
+        "build_seconds": build_seconds,
+        "estimated_memory_bytes": estimated_bytes(config, len(corpus), dim),
+        "qps": len(queries) / sum(latencies),
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p95_ms": float(np.percentile(latencies, 95) * 1000),
+        f"recall@{k}": float(recall),
+    }
+
+
+def run(uri: str, corpus_size: int, query_size: int, indexes: list[str], k: int) -> list[dict]:
+    corpus = embedding_model.embedding(corpus_texts(corpus_size))
+    queries = embedding_model.embedding(make_texts(query_size, seed=2))
+    truth = exact_top_k(np.stack(corpus).astype(np.float32), np.stack(queries).astype(np.float32), k)
+
+    client = MilvusClient(uri=uri)
+    results = []
+    try:
+        for name in indexes:
+            try:
+                results.append(measure(client, name, INDEX_PRESETS[name], corpus, queries, truth, k))
+            except Exception as e:  # Milvus Lite 미지원 인덱스 등
+                results.append({"index": name, "error": str(e)})
+    finally:
+        client.close()
+    return results
+
+
+def recommend(results: list[dict], k: int, min_recall: float) -> str | None:
+    candidates = [result for result in results if result.get(f"recall@{k}", 0.0) >= min_recall]
+    return max(candidates, key=lambda result: result["qps"])["index"] if candidates else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uri", default="./milvus_index_benchmark.db", help="Milvus Lite 파일 경로 (또는 Milvus URI)")
+    parser.add_argument("--corpus", type=int, default=5000, help="색인할 벡터 수")
+    parser.add_argument("--queries", type=int, default=200, help="질의 수")
+    parser.add_argument("--indexes", nargs="+", default=[name for name in INDEX_PRESETS if name != "AUTOINDEX"],
+                        choices=list(INDEX_PRESETS), help="비교할 인덱스 프리셋")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--min-recall", type=float, default=0.95, help="추천 인덱스의 최소 recall@k")
+    args = parser.parse_args()
+
+    results = run(args.uri, args.corpus, args.queries, args.indexes, args.k)
+    print(json.dumps({
+        "results": results,
+        "recommended": {"MILVUS_INDEX": recommend(results, args.k, args.min_recall)},
+    }, ensure_ascii=False, indent=2))
@@ -0,0 +1,105 @@
+# benchmark/radius_filter_benchmark.py
+"""
+반경 필터 구현별 소요 시간을 비교하는 벤치마크
+
+- loop: 기존 구현 (객체마다 _get_lat_lon + math 하버사인)
+- vectorized: radius_filter (좌표 추출 1회 + 사각형 사전 필터 + NumPy 하버사인)
+- arrays: radius_indices (좌표 배열을 미리 만들어 둔 경우, 질의당 비용)
+
+실행:
+    python -m benchmark.radius_filter_benchmark --sizes 10000 100000 1000000 --radius 500
+"""
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from app.utils.radius_filter import DEG2RAD, EARTH_RADIUS_M, _get_lat_lon, coordinates, radius_filter, radius_indices
+
+# 서울 일대
+LAT_RANGE = (37.42, 37.70)
+LON_RANGE = (126.76, 127.18)
+
+
+def radius_filter_loop(objects, camera_lat: float, camera_lon: float, radius: float = 500.0) -> list:
+    """
+    벡터화 이전의 radius_filter (비교 기준)
+    """
+    cam_lat_rad = camera_lat * DEG2RAD
+    cam_lon_rad = camera_lon * DEG2RAD
+    cos_cam_lat = math.cos(cam_lat_rad)
+
+    out = []
+    for obj in objects or []:
+        try:
+            lat, lon = _get_lat_lon(obj)
+        except (TypeError, ValueError):
+            continue
+
+        lat_rad = lat * DEG2RAD
+        dlat = lat_rad - cam_lat_rad
+        dlon = lon * DEG2RAD - cam_lon_rad
+        a = (math.sin(dlat / 2) ** 2) + cos_cam_lat * math.cos(lat_rad) * (math.sin(dlon / 2) ** 2)
+        if EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)) <= radius:
+            out.append(obj)
+    return out
+
+
+def make_objects(count: int, seed: int = 0) -> list[dict]:
+    """
+    데이터셋 레코드처럼 lat/lng를 문자열로 가진 dict 생성
+    """
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(*LAT_RANGE, count)
+    lons = rng.uniform(*LON_RANGE, count)
+    return [{"lat": f"{lat:.9f}", "lng": f"{lon:.9f}"} for lat, lon in zip(lats.tolist(), lons.tolist())]
+
+
+def timed(function, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: list[int], radius: float, queries: int, repeat: int) -> list[dict]:
+    rng = np.random.default_rng(1)
+    centers = list(zip(rng.uniform(*LAT_RANGE, queries).tolist(), rng.uniform(*LON_RANGE, queries).tolist()))
+
+    results = []
+    for size in sizes:
+        objects = make_objects(size)
+        _, lats, lons = coordinates(objects)
+
+        # 결과가 같은지 먼저 확인
+        for lat, lon in centers:
+            assert radius_filter(objects, lat, lon, radius) == radius_filter_loop(objects, lat, lon, radius)
+
+        loop = timed(lambda: [radius_filter_loop(objects, lat, lon, radius) for lat, lon in centers], repeat)
+        vectorized = timed(lambda: [radius_filter(objects, lat, lon, radius) for lat, lon in centers], repeat)
+        arrays = timed(lambda: [radius_indices(lats, lons, lat, lon, radius) for lat, lon in centers], repeat)
+        results.append({
+            "points": size,
+            "radius_m": radius,
+            "loop_ms": loop / queries * 1000,
+            "vectorized_ms": vectorized / queries * 1000,
+            "arrays_ms": arrays / queries * 1000,
+            "speedup_vectorized": loop / vectorized,
+            "speedup_arrays": loop / arrays,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="점 개수")
+    parser.add_argument("--radius", type=float, default=500.0, help="반경(m)")
+    parser.add_argument("--queries", type=int, default=5, help="크기별 질의 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sizes, args.radius, args.queries, args.repeat), ensure_ascii=False, indent=2))
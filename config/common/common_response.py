@@ -1,5 +1,7 @@
 # config/dataset/common_response.py
-from typing import Generic, Optional, TypeVar
+import json
+from itertools import islice
+from typing import Any, Generic, Iterable, Iterator, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -17,4 +19,35 @@ class CommonResponse(BaseModel, Generic[T]):
     """
     code: int
     message: str
-    data: Optional[T] = None
\ No newline at end of file
+    data: Optional[T] = None
+
+"""
+스트리밍 응답
+
+큰 목록을 한 번에 직렬화하지 않고, chunk_size개씩 JSON으로 만들어 바로 내보낸다.
+응답 메모리는 목록 크기가 아니라 chunk_size에 비례한다.
+"""
+STREAM_CHUNK_SIZE = 256
+
+def _dumps(item: Any) -> str:
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":"), default=str)
+
+def stream_ndjson(items: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    NDJSON(한 줄에 JSON 하나) 스트림. media_type: application/x-ndjson
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield "".join(_dumps(item) + "\n" for item in chunk)
+
+def stream_common_response(code: int, message: str, items: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    CommonResponse와 같은 모양({"code", "message", "data": [...]})의 JSON을 data 배열부터 조금씩 내보내는 스트림.
+    """
+    yield f'{{"code":{int(code)},"message":{_dumps(message)},"data":['
+    iterator = iter(items)
+    first = True
+    while chunk := list(islice(iterator, chunk_size)):
+        yield ("" if first else ",") + ",".join(_dumps(item) for item in chunk)
+        first = False
+    yield "]}"
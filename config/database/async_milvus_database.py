@@ -0,0 +1,567 @@
+# config/database/async_milvus_database.py
+import asyncio
+import os
+import threading
+import time
+from itertools import islice
+from typing import AsyncIterator, Iterable
+
+from numpy import ndarray
+from pymilvus import AsyncMilvusClient, CollectionSchema
+from pymilvus.milvus_client import IndexParams
+
+from app.internal.log.log import log
+from config.database.milvus_database import (MILVUS_INSERT_CHUNK_SIZE, MILVUS_SEARCH_BATCH_SIZE, MILVUS_SEARCH_MAX_LIMIT,
+                                             MILVUS_URI, InsertChunkReport, MilvusDatabase, embedding_dim, project_rows,
+                                             project_vectors, vector_dims)
+from config.models.embedding_provider import embedding_model
+
+# .env 환경 변수 추출
+MILVUS_MAX_CONCURRENCY = int(os.getenv('MILVUS_MAX_CONCURRENCY', '8'))  # 동시에 보낼 수 있는 Milvus 요청 수
+
+class AsyncMilvusDatabase:
+    """
+    벡터 데이터베이스(Milvus)를 asyncio에서 이용하기 위한 클래스
+
+    MilvusDatabase와 같은 DDL/DML/Partition 함수를 코루틴으로 제공합니다.
+    async def 엔드포인트에서 이벤트 루프나 스레드풀 스레드를 막지 않고 벡터 검색을 수행할 수 있습니다.
+    pymilvus의 AsyncMilvusClient를 이용해 싱글턴으로 구현하였습니다.
+    위경도 반경 검색은 장소 검색 repository(PlacesRepository.search)가 search를 조합해 수행하므로 따로 제공하지 않습니다.
+
+    Attributes:
+        _instance: 싱글턴 인스턴스입니다.
+        _lock: 싱글턴을 구현하기 위한 동기화 Flag 객체입니다.
+        __connections: 이벤트 루프 → AsyncMilvusClient (루프 안에서 처음 사용할 때 생성, 루프가 닫히면 다음 생성 시 close)
+        __semaphores: 이벤트 루프 → 동시에 진행 중인 요청 수를 MILVUS_MAX_CONCURRENCY로 제한하는 세마포
+        _vector_dims(dict): 콜렉션 명 → {벡터 field 명: 차원 수} (투영 결정용 캐시)
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super().__new__(cls)
+                    cls._instance.__connections = {}
+                    cls._instance.__semaphores = {}
+                    cls._instance._vector_dims = {}
+        return cls._instance
+
+    @staticmethod
+    def _init_connection():
+        """
+        connection을 생성하는 함수입니다.
+        """
+        return AsyncMilvusClient(
+            uri=MILVUS_URI,
+            token="root:Milvus"
+        )
+
+    def get_connection(self):
+        """
+        데이터베이스 Connection을 반환하는 함수
+
+        gRPC aio 채널은 생성된 이벤트 루프에 묶이므로, 실행 중인 루프마다 처음 호출될 때 생성합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self.__connections:
+            self._close_stale_connections()
+            self.__connections[loop] = self._init_connection()
+        return self.__connections[loop]
+
+    def _close_stale_connections(self):
+        """
+        이미 닫힌 이벤트 루프에 남은 Connection을 close하는 함수
+
+        닫힌 루프에서는 close()를 await할 수 없으므로, 별도 스레드의 임시 루프에서 수행합니다.
+        채널이 이전 루프에 묶여 있어 close가 실패할 수 있으므로, 실패는 로그만 남깁니다.
+        """
+        for loop in [loop for loop in self.__connections if loop.is_closed()]:
+            connection = self.__connections.pop(loop)
+            self.__semaphores.pop(loop, None)
+            closer = threading.Thread(target=self._close_quietly, args=(connection,), daemon=True)
+            closer.start()
+            closer.join()
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            asyncio.run(connection.close())
+        except Exception as e:
+            # LOG. 닫힌 루프의 Connection 정리 실패
+            log.warning(msg=f"\n\n[AsyncMilvusDatabase] stale connection close failed: {e!r}\n")
+
+    def _limit(self) -> asyncio.Semaphore:
+        """
+        동시 요청 수를 제한하는 세마포를 반환하는 함수
+
+        세마포도 이벤트 루프에 묶이므로 실행 중인 루프마다 따로 둔다.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self.__semaphores:
+            self.__semaphores[loop] = asyncio.Semaphore(MILVUS_MAX_CONCURRENCY)
+        return self.__semaphores[loop]
+
+    async def close(self):
+        """
+        해당 클래스의 인스턴스를 종료하는 함수
+
+        현재 이벤트 루프의 Connection과 (싱글턴이라면) Instance를 close해주세요.
+        """
+        loop = asyncio.get_running_loop()
+        self.__semaphores.pop(loop, None)
+        connection = self.__connections.pop(loop, None)
+        if connection:
+            await connection.close()
+        self._close_stale_connections()
+
+        if self.__class__._instance:
+            self.__class__._instance = None
+
+    @staticmethod
+    async def embedding(texts: list[str]) -> list[ndarray]:
+        """
+        텍스트를 임베딩하는 함수
+
+        임베딩은 CPU 연산이므로 이벤트 루프를 막지 않도록 별도 스레드에서 수행합니다.
+        """
+        return await asyncio.to_thread(embedding_model.embedding, texts)
+
+    """
+    DDL
+    """
+    async def create_collection(self, collection_name:str, schema:CollectionSchema, index_params:IndexParams):
+        """
+        콜렉션(collection)을 생성하는 함수
+
+        벡터 차원 수와 투영은 MilvusDatabase.create_collection과 같이 schema의 벡터 field(dim)가 정한다.
+
+        Parameters:
+            collection_name(str): 생성할 콜렉션 명
+            schema(CollectionSchema): 콜렉션의 스키마(fields)
+            index_params(IndexParams): 스키마의 인덱스
+        """
+        self._vector_dims.pop(collection_name, None)
+        async with self._limit():
+            return await self.get_connection().create_collection(
+                collection_name=collection_name,
+                schema=schema,
+                index_params=index_params,
+                dimension=embedding_dim
+            )
+
+    async def drop_collection(self, collection_name:str):
+        """
+        콜렉션(collection)을 삭제하는 함수
+
+        Parameters:
+            collection_name(str): 삭제할 콜렉션 명
+        """
+        self._vector_dims.pop(collection_name, None)
+        async with self._limit():
+            return await self.get_connection().drop_collection(
+                collection_name=collection_name
+            )
+
+    async def has_collection(self, collection_name:str):
+        async with self._limit():
+            return await self.get_connection().has_collection(collection_name=collection_name)
+
+    def create_schema(self):
+        return AsyncMilvusClient.create_schema(auto_id=True, enable_dynamic_field=True)
+
+    def prepare_index_params(self):
+        return AsyncMilvusClient.prepare_index_params()
+
+    """
+    Projection
+    """
+    async def vector_dims(self, collection_name:str) -> dict[str, int]:
+        """
+        콜렉션의 벡터 field 명: 차원 수를 반환하는 함수 (콜렉션별로 한 번만 조회해 캐시)
+        """
+        if collection_name not in self._vector_dims:
+            async with self._limit():
+                description = await self.get_connection().describe_collection(collection_name=collection_name)
+            self._vector_dims[collection_name] = vector_dims(description)
+        return self._vector_dims[collection_name]
+
+    async def _project_vectors(self, collection_name:str, vector_field:str, vectors:list[ndarray]) -> list[ndarray]:
+        return project_vectors(await self.vector_dims(collection_name), vector_field, vectors)
+
+    async def _project_rows(self, collection_name:str, rows:dict|list[dict]) -> dict|list[dict]:
+        return project_rows(await self.vector_dims(collection_name), rows)
+
+    """
+    DML
+    """
+    async def select_all(self, collection_name: str, partition_names: list[str], output_fields:list[str], filter:str="id >= 0"):
+        """
+        콜렉션 레코드를 전체 조회하는 함수
+
+        Parameters:
+            collection_name(str): 조회할 콜렉션 명
+            partition_names(list[str]): 조회할 파티션 묶음
+            output_fields(list[str]): 반환받고 싶은 field 명
+            filter(str): 전체 검색을 하는 조건
+        """
+        async with self._limit():
+            return await self.get_connection().query(
+                collection_name=collection_name,
+                partition_names=partition_names,
+                output_fields=output_fields,
+                filter=filter
+            )
+
+    async def select_passages_to_ids(self, collection_name: str, partition_names: list[str], output_fields: list[str], ids: int|list[int]):
+        """
+        콜렉션 레코드를 id를 통해 조회하는 함수
+
+        Parameters:
+            collection_name(str): 조회할 콜렉션 명
+            partition_names(list[str]): 조회할 파티션 묶음
+            output_fields(list[str]): 반환받고 싶은 field 명
+            ids(int|list[int]): 조회할 id
+        """
+        async with self._limit():
+            return await self.get_connection().get(
+                collection_name=collection_name,
+                partition_names=partition_names,
+                output_fields=output_fields,
+                ids=ids
+            )
+
+    async def range_select(self, collection_name: str, search_field: str, partition_names: list[str],
+                           output_fields: list[str], data: ndarray|list[ndarray], radius: float = 0.6):
+        """
+        datas와 인접한 벡터를 가진 콜렉션 레코드를 조회하는 함수
+
+        Parameters:
+            collection_name(str): 조회할 콜렉션 명
+            partition_names(list[str]): 조회할 파티션 묶음
+            output_fields(list[str]): 반환받고 싶은 field 명
+            search_field(str): 인접 벡터를 구할 벡터 필드
+            data(ndarray|list[ndarray]): 인접 벡터를 구할 기준 벡터(임베딩 텍스트)
+            radius(float): 레코드 유사도 범위(높을수록 유사한 것 *0.0~1.0)
+        """
+        vectors = await self._project_vectors(collection_name, search_field, data if isinstance(data, list) else [data])
+        async with self._limit():
+            return await self.get_connection().search(
+                collection_name=collection_name,
+                partition_names=partition_names,
+                output_fields=output_fields,
+                search_params={
+                    "metric_type": "COSINE",
+                    "params": {
+                        "radius": radius
+                    }
+                },
+                anns_field=search_field,
+                data=vectors
+            )
+
+    async def search(self, collection_name: str, search_field: str, data: ndarray|list[ndarray], limit: int = 10,
+                     filter: str = "", output_fields: list[str] | None = None, partition_names: list[str] | None = None,
+                     search_params: dict | None = None):
+        """
+        data와 가장 유사한 벡터를 가진 콜렉션 레코드를 top-k로 조회하는 함수
+
+        Parameters:
+            collection_name(str): 조회할 콜렉션 명
+            search_field(str): 인접 벡터를 구할 벡터 필드
+            data(ndarray|list[ndarray]): 기준 벡터
+            limit(int): 질의당 반환할 최대 레코드 수 (최대 MILVUS_SEARCH_MAX_LIMIT)
+            filter(str): 스칼라 필터 식
+            output_fields(list[str]): 반환받고 싶은 field 명
+            partition_names(list[str]): 조회할 파티션 묶음
+            search_params(dict): 인덱스별 검색 파라미터 * default: COSINE
+        """
+        vectors = await self._project_vectors(collection_name, search_field, data if isinstance(data, list) else [data])
+        async with self._limit():
+            return await self.get_connection().search(
+                collection_name=collection_name,
+                data=vectors,
+                anns_field=search_field,
+                limit=min(limit, MILVUS_SEARCH_MAX_LIMIT),
+                filter=filter,
+                output_fields=output_fields,
+                partition_names=partition_names,
+                search_params=search_params or {"metric_type": "COSINE"}
+            )
+
+    async def search_batch(self, collection_name: str, search_field: str, data: list[ndarray], limit: int = 10,
+                           filter: str = "", output_fields: list[str] | None = None, partition_names: list[str] | None = None,
+                           search_params: dict | None = None, batch_size: int = MILVUS_SEARCH_BATCH_SIZE) -> list[list[dict]]:
+        """
+        여러 질의 벡터를 batch_size개씩 나누어 동시에 top-k 검색하는 함수
+
+        나뉜 요청은 동시에 보내지만, 세마포에 의해 MILVUS_MAX_CONCURRENCY개까지만 진행된다.
+
+        Returns:
+            [질의1의 결과, 질의2의 결과, ...] 입력 순서대로
+        """
+        batches = await asyncio.gather(*(
+            self.search(
+                collection_name=collection_name,
+                search_field=search_field,
+                data=data[start:start + batch_size],
+                limit=limit,
+                filter=filter,
+                output_fields=output_fields,
+                partition_names=partition_names,
+                search_params=search_params
+            )
+            for start in range(0, len(data), batch_size)
+        ))
+        return [hits for batch in batches for hits in batch]
+
+    async def search_iterator(self, collection_name: str, search_field: str, data: ndarray, batch_size: int = 100,
+                              limit: int = -1, filter: str = "", output_fields: list[str] | None = None,
+                              partition_names: list[str] | None = None,
+                              search_params: dict | None = None) -> AsyncIterator[list[dict]]:
+        """
+        유사도 순서대로 결과를 batch_size개씩 끊어 반환하는 함수 (깊은 페이지 조회용)
+
+        AsyncMilvusClient에는 search iterator가 없으므로, MilvusDatabase.search_iterator의 페이지를
+        별도 스레드에서 하나씩 받아온다. 순회를 멈추면 서버 측 iterator도 닫는다.
+
+        Returns:
+            AsyncIterator[list[dict]] 페이지 단위
+        """
+        pages = MilvusDatabase().search_iterator(
+            collection_name=collection_name,
+            search_field=search_field,
+            data=data,
+            batch_size=batch_size,
+            limit=limit,
+            filter=filter,
+            output_fields=output_fields,
+            partition_names=partition_names,
+            search_params=search_params
+        )
+        try:
+            while page := await asyncio.to_thread(next, pages, None):
+                yield page
+        finally:
+            await asyncio.to_thread(pages.close)
+
+    async def insert(self, collection_name:str, partition_name:str, data:dict|list[dict]):
+        """
+        콜렉션 레코드를 추가하는 함수
+
+        Parameters:
+            collection_name(str): 조회할 콜렉션 명
+            partition_name(str): 조회할 파티션 묶음
+            data(dict|list[dict]): 추가할 레코드
+        """
+        rows = await self._project_rows(collection_name, data)
+        async with self._limit():
+            return await self.get_connection().insert(
+                collection_name=collection_name,
+                partition_name=partition_name,
+                data=rows
+            )
+
+    async def upsert(self, collection_name:str, partition_name:str, data:dict|list[dict]):
+        """
+        콜렉션 레코드를 추가하거나, 같은 primary key가 있으면 교체하는 함수
+
+        Parameters:
+            collection_name(str): 추가할 콜렉션 명
+            partition_name(str): 추가할 파티션 묶음
+            data(dict|list[dict]): 추가/교체할 레코드 (primary key 포함)
+        """
+        rows = await self._project_rows(collection_name, data)
+        async with self._limit():
+            return await self.get_connection().upsert(
+                collection_name=collection_name,
+                partition_name=partition_name,
+                data=rows
+            )
+
+    async def bulk_insert(self, collection_name:str, partition_name:str, records:Iterable[dict], text_field:str,
+                          vector_field:str, chunk_size:int=MILVUS_INSERT_CHUNK_SIZE) -> list[InsertChunkReport]:
+        """
+        대량의 레코드를 임베딩하면서 청크 단위로 추가하는 함수
+
+        MilvusDatabase.bulk_insert와 같이 청크 i를 쓰는 동안 청크 i+1을 (별도 스레드에서) 임베딩하고,
+        쓰기는 한 번에 하나만 진행한다. 실패한 청크는 건너뛰고 보고서에 사유를 남긴다.
+
+        Returns:
+            [InsertChunkReport, ...] 청크 순서대로
+        """
+        reports: list[InsertChunkReport] = []
+        iterator = iter(records)
+
+        pending: asyncio.Task | None = None
+        while chunk := list(islice(iterator, chunk_size)):
+            report = InsertChunkReport(index=len(reports), count=len(chunk))
+            reports.append(report)
+
+            # 1) 임베딩 (이전 청크의 insert와 병렬로 진행)
+            started = time.perf_counter()
+            try:
+                vectors = await self.embedding([str(record[text_field]) for record in chunk])
+                vectors = await self._project_vectors(collection_name, vector_field, vectors)
+                rows = [{**record, vector_field: vector} for record, vector in zip(chunk, vectors)]
+            except Exception as e:
+                report.error = f"embedding: {e}"
+                rows = None
+            report.embed_seconds = time.perf_counter() - started
+
+            # 2) 이전 청크의 insert가 끝날 때까지 대기 후 다음 insert 시작
+            if pending is not None:
+                await pending
+            pending = asyncio.create_task(self._insert_chunk(collection_name, partition_name, rows, report)) if rows else None
+
+        if pending is not None:
+            await pending
+
+        inserted = sum(report.inserted for report in reports)
+        failed = [report.index for report in reports if report.error]
+        # LOG. 대량 추가 결과
+        log.info(msg=f"\n\n[AsyncMilvusDatabase] bulk_insert({collection_name}) {inserted}건 저장, 실패 청크 {failed}\n")
+        return reports
+
+    async def _insert_chunk(self, collection_name:str, partition_name:str, rows:list[dict], report:InsertChunkReport):
+        """
+        bulk_insert의 청크 하나를 추가하고, 결과를 report에 기록하는 함수
+        """
+        started = time.perf_counter()
+        try:
+            result = await self.insert(collection_name=collection_name, partition_name=partition_name, data=rows)
+            report.inserted = int(result.get("insert_count", len(rows)))
+        except Exception as e:
+            report.error = f"insert: {e}"
+        report.insert_seconds = time.perf_counter() - started
+
+    async def delete(self, collection_name: str, partition_name: str, filter:str):
+        """
+        콜렉션 레코드를 삭제하는 함수
+
+        Parameters:
+            partition_name(str): 삭제할 파티션 묶음
+            filter(str): 삭제할 원문의 조건
+        """
+        async with self._limit():
+            return await self.get_connection().delete(
+                collection_name=collection_name,
+                partition_name=partition_name,
+                filter=filter
+            )
+
+    """
+    Partition
+    """
+    async def create_partition(self, collection_name:str, partition_name:str):
+        """
+        콜렉션에 새로운 파티션을 추가하는 함수
+
+        Parameters:
+            collection_name(str): 추가할 콜렉션 명
+            partition_name(str): 추가할 파티션의 명
+        """
+        async with self._limit():
+            return await self.get_connection().create_partition(
+                collection_name=collection_name,
+                partition_name=partition_name
+            )
+
+    async def drop_partition(self, collection_name:str, partition_name:str):
+        """
+        콜렉션에 새로운 파티션을 제거하는 함수
+
+        Parameters:
+            collection_name(str): 제거할 콜렉션 명
+            partition_name(str): 제거할 파티션 명
+        """
+        async with self._limit():
+            return await self.get_connection().drop_partition(
+                collection_name=collection_name,
+                partition_name=partition_name
+            )
+
+    async def has_partition(self, collection_name:str, partition_name:str):
+        """
+        콜렉션에 이미 파티션이 존재하는지 확인하는 함수
+
+        Parameters:
+            collection_name(str): 확인할 콜렉션 명
+            partition_name(str): 확인할 파티션 명
+        """
+        async with self._limit():
+            return await self.get_connection().has_partition(
+                collection_name=collection_name,
+                partition_name=partition_name
+            )
+
+    async def list_partitions(self, collection_name:str) -> list[str]:
+        """
+        콜렉션의 파티션 명을 모두 반환하는 함수
+
+        Parameters:
+            collection_name(str): 확인할 콜렉션 명
+        """
+        async with self._limit():
+            return await self.get_connection().list_partitions(
+                collection_name=collection_name
+            )
+
+    async def load_partitions(self, collection_name:str, partition_names:str|list[str]):
+        """
+        Milvus에 파티션을 불러오는 함수
+
+        불러오지 않은 파티션은 사용하지 못한다.
+
+        Parameters:
+            collection_name(str): 해당 파티션이 있는 콜렉션
+            partition_names(list[str]): 불러올 파티션 명
+        """
+        async with self._limit():
+            return await self.get_connection().load_partitions(
+                collection_name=collection_name,
+                partition_names=partition_names
+            )
+
+    async def get_load_state(self, collection_name:str, partition_name:str):
+        """
+        Milvus에 로딩된 파티션을 확인하는 함수
+
+        Parameters:
+            collection_name(str): 해당 파티션이 있는 콜렉션
+            partition_name(str): 확인할 파티션 명
+        """
+        async with self._limit():
+            return await self.get_connection().get_load_state(
+                collection_name=collection_name,
+                partition_name=partition_name
+            )
+
+    async def get_partition_stats(self, collection_name:str, partition_name:str):
+        """
+        파티션의 통계(row_count)를 확인하는 함수
+
+        Parameters:
+            collection_name(str): 해당 파티션이 있는 콜렉션
+            partition_name(str): 확인할 파티션 명
+        """
+        async with self._limit():
+            return await self.get_connection().get_partition_stats(
+                collection_name=collection_name,
+                partition_name=partition_name
+            )
+
+    async def release_partitions(self, collection_name:str, partition_names:list[str]):
+        """
+        Milvus에 파티션을 해제하는 함수
+
+        Parameters:
+            collection_name(str): 해당 파티션이 있는 콜렉션
+            partition_names(list[str]): 해제할 파티션 명
+        """
+        async with self._limit():
+            return await self.get_connection().release_partitions(
+                collection_name=collection_name,
+                partition_names=partition_names
+            )
@@ -1,21 +1,119 @@
 # config/database/milvus_database.py
 import os
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator
 
 from numpy import ndarray
-from pymilvus import CollectionSchema, MilvusClient
+from pymilvus import CollectionSchema, MilvusClient, MilvusException
 from pymilvus.milvus_client import IndexParams
 
-from config.models.embedding_model import embedding_model
+from app.internal.log.log import log
+from config.models.embedding_provider import embedding_model
+from config.models.embedding_projection import EmbeddingProjection, TruncateProjection
 
 # .env 환경 변수 추출
 MILVUS_URI = os.getenv('MILVUS_URI')
+MILVUS_COLLECTION_PREFIX = os.getenv('MILVUS_COLLECTION_PREFIX', '')  # 콜렉션 명 접두사 (테스트는 test_로 운영 콜렉션과 분리)
+MILVUS_INSERT_CHUNK_SIZE = int(os.getenv('MILVUS_INSERT_CHUNK_SIZE', '512'))
+MILVUS_SEARCH_MAX_LIMIT = int(os.getenv('MILVUS_SEARCH_MAX_LIMIT', '1000'))  # 한 번의 top-k 검색 상한 (더 깊은 결과는 search_iterator)
+MILVUS_SEARCH_BATCH_SIZE = int(os.getenv('MILVUS_SEARCH_BATCH_SIZE', '16'))   # search_batch에서 한 번에 보내는 질의 벡터 수
+MILVUS_PARTITION_RESIDENCY = os.getenv('MILVUS_PARTITION_RESIDENCY', '0') == '1'  # 파티션 검색 시 PartitionResidencyManager로 load/release
+MILVUS_VECTOR_DIM = os.getenv('MILVUS_VECTOR_DIM')  # (선택) 새 콜렉션에 저장할 벡터 차원 수 (없으면 embedding_dim)
 
 """
 임베딩 모델의 최대 차원 수를 명시한 상수이다. 
 """
 embedding_dim = len(embedding_model.embedding(["임베딩 모델 차원 수 측정용"])[0])
 
+"""
+새로 만드는 콜렉션(route_search, places)의 벡터 field 차원 수이다.
+embedding_dim보다 작으면 저장/검색 벡터에 Matryoshka 절단이 적용된다(projection_for).
+"""
+vector_dim = int(MILVUS_VECTOR_DIM) if MILVUS_VECTOR_DIM else embedding_dim
+if not 0 < vector_dim <= embedding_dim:
+    raise ValueError(f"MILVUS_VECTOR_DIM({vector_dim})은 1 이상 임베딩 차원({embedding_dim}) 이하여야 합니다.")
+
+def projection_for(dim: int | None) -> EmbeddingProjection | None:
+    """
+    요약:
+        콜렉션 벡터 field의 차원 수로 저장/검색 벡터에 적용할 투영을 정하는 함수
+
+    설명:
+        벡터 field의 dim이 embedding_dim보다 작으면 Matryoshka 절단(TruncateProjection)을 적용한다.
+        투영 정보가 콜렉션 스키마에 들어 있으므로 별도 파일 없이 모든 호스트/워커가 같은 투영을 쓴다.
+
+    Parameters:
+        dim(int): 벡터 field의 차원 수 (벡터 field가 아니면 None)
+    """
+    return TruncateProjection(dim) if dim and dim < embedding_dim else None
+
+def vector_dims(description: dict) -> dict[str, int]:
+    """
+    describe_collection 결과 → 벡터 field 명: 차원 수
+    """
+    return {field["name"]: int(field["params"]["dim"]) for field in description.get("fields", [])
+            if "dim" in (field.get("params") or {})}
+
+def project_vectors(dims: dict[str, int], vector_field: str, vectors: list[ndarray]) -> list[ndarray]:
+    """
+    벡터(원본 차원)를 콜렉션 벡터 field의 투영에 맞추는 함수 (투영이 없거나 이미 투영된 벡터는 그대로)
+
+    Parameters:
+        dims(dict[str, int]): 콜렉션의 벡터 field 명: 차원 수 (vector_dims 결과)
+        vector_field(str): 벡터 field 명
+        vectors(list[ndarray]): 저장/검색할 벡터
+    """
+    projection = projection_for(dims.get(vector_field))
+    if projection is None or not len(vectors) or len(vectors[0]) <= projection.dim:
+        return vectors
+    return projection.apply(vectors)
+
+def project_rows(dims: dict[str, int], rows: dict | list[dict]) -> dict | list[dict]:
+    """
+    저장할 레코드의 벡터 field를 콜렉션의 투영에 맞추는 함수
+
+    Parameters:
+        dims(dict[str, int]): 콜렉션의 벡터 field 명: 차원 수 (vector_dims 결과)
+        rows(dict|list[dict]): 저장할 레코드
+    """
+    single = isinstance(rows, dict)
+    rows = [rows] if single else list(rows)
+    for field in dims:
+        if rows and field in rows[0]:
+            vectors = project_vectors(dims, field, [row[field] for row in rows])
+            rows = [{**row, field: vector} for row, vector in zip(rows, vectors)]
+    return rows[0] if single else rows
+
+@dataclass
+class InsertChunkReport:
+    """
+    bulk_insert의 청크(chunk)별 처리 결과
+
+    Attributes:
+        index(int): 청크 순번 (0부터)
+        count(int): 청크의 레코드 수
+        embed_seconds(float): 임베딩 소요 시간(초)
+        insert_seconds(float): Milvus insert 소요 시간(초)
+        inserted(int): 실제로 저장된 레코드 수
+        error(str): 실패 사유 (성공 시 None)
+    """
+    index: int
+    count: int
+    embed_seconds: float = 0.0
+    insert_seconds: float = 0.0
+    inserted: int = 0
+    error: str | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.embed_seconds + self.insert_seconds
+        return self.inserted / elapsed if elapsed else 0.0
+
 class MilvusDatabase:
     """
     벡터 데이터베이스(Milvus)에서 공통적으로 이용하는 함수를 관리하는 클래스
@@ -25,15 +123,20 @@ class MilvusDatabase:
     Attributes:
         _instance: 싱글턴 인스턴스입니다.
         _lock: 싱글턴을 구현하기 위한 동기화 Flag 객체입니다.
+        _vector_dims(dict): 콜렉션 명 → {벡터 field 명: 차원 수} (투영 결정용 캐시)
+        _residency(dict): 콜렉션 명 → PartitionResidencyManager (MILVUS_PARTITION_RESIDENCY=1일 때 파티션 검색에 사용)
     """
     _instance = None
     _lock = threading.Lock()
+    _residency_lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
             with cls._lock:
                 if not cls._instance:
                     cls._instance = super().__new__(cls)
+                    cls._instance._vector_dims = {}
+                    cls._instance._residency = {}
                     cls.__connection = cls._instance._init_connection()
         return cls._instance
 
@@ -75,12 +178,15 @@ class MilvusDatabase:
         콜렉션(collection)을 생성하는 함수
 
         이를 수행하기 위해선 사전에 schema와 index_params를 우선 할당할 것
+        벡터 차원 수는 schema의 벡터 field(dim)가 정한다. dim을 embedding_dim보다 작게 두면
+        저장/검색 벡터에 Matryoshka 절단이 자동으로 적용된다(projection).
 
         Parameters:
             collection_name(str): 생성할 콜렉션 명
             schema(CollectionSchema): 콜렉션의 스키마(fields)
             index_params(IndexParams): 스키마의 인덱스
         """
+        self._vector_dims.pop(collection_name, None)
         return self.get_connection().create_collection(
             collection_name=collection_name,
             schema=schema,
@@ -95,18 +201,121 @@ class MilvusDatabase:
         Parameters:
             collection_name(str): 삭제할 콜렉션 명
         """
+        self._vector_dims.pop(collection_name, None)
+        self._residency.pop(collection_name, None)
         return self.get_connection().drop_collection(
             collection_name=collection_name
         )
 
     def has_collection(self, collection_name:str):
-        self.get_connection().has_collection(collection_name=collection_name)
+        return self.get_connection().has_collection(collection_name=collection_name)
 
-    def create_schema(self):
-        self.get_connection().create_schema(auto_id=True, enable_dynamic_field=True)
+    def create_schema(self, auto_id:bool=True, enable_dynamic_field:bool=True):
+        return self.get_connection().create_schema(auto_id=auto_id, enable_dynamic_field=enable_dynamic_field)
 
     def prepare_index_params(self):
-        self.get_connection().prepare_index_params()
+        return self.get_connection().prepare_index_params()
+
+    """
+    Alias
+    """
+    def alias_target(self, alias:str) -> str | None:
+        """
+        별칭(alias)이 가리키는 콜렉션 명을 반환하는 함수 (별칭이 없으면 None)
+
+        Parameters:
+            alias(str): 확인할 별칭
+        """
+        try:
+            return self.get_connection().describe_alias(alias=alias)["collection_name"]
+        except MilvusException:
+            return None
+
+    def switch_alias(self, alias:str, collection_name:str) -> str | None:
+        """
+        별칭이 collection_name을 가리키도록 바꾸고, 이전에 가리키던 콜렉션 명을 반환하는 함수
+
+        검색/쓰기는 별칭으로 하므로, 새 콜렉션을 다 채운 뒤 별칭만 바꾸면 중단 없이 교체된다.
+        별칭 도입 전에 같은 이름의 실제 콜렉션이 있으면, 별칭을 만들 수 있도록 그 콜렉션을 먼저 삭제한다(최초 1회).
+
+        Parameters:
+            alias(str): 별칭 (검색/쓰기에 쓰는 이름)
+            collection_name(str): 새로 가리킬 콜렉션 명
+        """
+        previous = self.alias_target(alias)
+        if previous is not None:
+            self.get_connection().alter_alias(collection_name=collection_name, alias=alias)
+        else:
+            if self.has_collection(alias):
+                self.drop_collection(alias)
+            self.get_connection().create_alias(collection_name=collection_name, alias=alias)
+        self._vector_dims.pop(alias, None)
+        self._residency.pop(alias, None)
+
+        # LOG. 별칭 교체
+        log.info(msg=f"\n\n[MilvusDatabase] alias {alias}: {previous} → {collection_name}\n")
+        return previous
+
+    """
+    Projection
+    """
+    def vector_dims(self, collection_name:str) -> dict[str, int]:
+        """
+        콜렉션의 벡터 field 명: 차원 수를 반환하는 함수 (콜렉션별로 한 번만 조회해 캐시)
+
+        Parameters:
+            collection_name(str): 콜렉션 명
+        """
+        if collection_name not in self._vector_dims:
+            self._vector_dims[collection_name] = vector_dims(
+                self.get_connection().describe_collection(collection_name=collection_name)
+            )
+        return self._vector_dims[collection_name]
+
+    def projection(self, collection_name:str, vector_field:str) -> EmbeddingProjection | None:
+        """
+        콜렉션의 벡터 field에 적용되는 투영을 반환하는 함수 (없으면 None)
+
+        저장/검색 벡터의 투영은 모두 이 함수로 정한다.
+
+        Parameters:
+            collection_name(str): 콜렉션 명
+            vector_field(str): 벡터 field 명
+        """
+        return projection_for(self.vector_dims(collection_name).get(vector_field))
+
+    def _project_vectors(self, collection_name:str, vector_field:str, vectors:list[ndarray]) -> list[ndarray]:
+        return project_vectors(self.vector_dims(collection_name), vector_field, vectors)
+
+    def _project_rows(self, collection_name:str, rows:dict|list[dict]) -> dict|list[dict]:
+        return project_rows(self.vector_dims(collection_name), rows)
+
+    """
+    Residency
+    """
+    def residency(self, collection_name:str):
+        """
+        콜렉션의 PartitionResidencyManager를 반환하는 함수 (콜렉션별로 처음 호출될 때 생성)
+
+        Parameters:
+            collection_name(str): 콜렉션 명
+        """
+        from config.database.milvus_partition_residency import PartitionResidencyManager
+
+        with self._residency_lock:
+            if collection_name not in self._residency:
+                self._residency[collection_name] = PartitionResidencyManager(collection_name, database=self)
+            return self._residency[collection_name]
+
+    def _resident(self, collection_name:str, partition_names:list[str] | None):
+        """
+        검색하는 동안 파티션을 불러온 상태로 유지하는 컨텍스트를 반환하는 함수
+
+        MILVUS_PARTITION_RESIDENCY가 꺼져 있거나 파티션을 지정하지 않은 검색은 그대로 수행한다.
+        """
+        if not MILVUS_PARTITION_RESIDENCY or not partition_names:
+            return nullcontext()
+        return self.residency(collection_name).use(partition_names)
 
     """
     DML
@@ -169,9 +378,102 @@ class MilvusDatabase:
                 }
             },
             anns_field=search_field,
-            data=data
+            data=self._project_vectors(collection_name, search_field, data if isinstance(data, list) else [data])
         )
 
+    def search(self, collection_name: str, search_field: str, data: ndarray|list[ndarray], limit: int = 10,
+               filter: str = "", output_fields: list[str] | None = None, partition_names: list[str] | None = None,
+               search_params: dict | None = None):
+        """
+        data와 가장 유사한 벡터를 가진 콜렉션 레코드를 top-k로 조회하는 함수
+
+        반환 건수는 limit(최대 MILVUS_SEARCH_MAX_LIMIT)로 고정되므로 응답 크기와 지연 시간을 예측할 수 있다.
+
+        Parameters:
+            collection_name(str): 조회할 콜렉션 명
+            search_field(str): 인접 벡터를 구할 벡터 필드
+            data(ndarray|list[ndarray]): 기준 벡터 (여러 개면 질의별 결과 리스트 반환)
+            limit(int): 질의당 반환할 최대 레코드 수 (top-k)
+            filter(str): 스칼라 필터 식 (예: 'distance >= 3000 and distance <= 5000')
+            output_fields(list[str]): 반환받고 싶은 field 명 (None이면 id/distance만)
+            partition_names(list[str]): 조회할 파티션 묶음 (None이면 전체)
+            search_params(dict): 인덱스별 검색 파라미터 * default: COSINE
+        """
+        with self._resident(collection_name, partition_names):
+            return self._search(collection_name, search_field, data, limit, filter, output_fields, partition_names, search_params)
+
+    def _search(self, collection_name: str, search_field: str, data: ndarray|list[ndarray], limit: int,
+                filter: str, output_fields: list[str] | None, partition_names: list[str] | None, search_params: dict | None):
+        return self.get_connection().search(
+            collection_name=collection_name,
+            data=self._project_vectors(collection_name, search_field, data if isinstance(data, list) else [data]),
+            anns_field=search_field,
+            limit=min(limit, MILVUS_SEARCH_MAX_LIMIT),
+            filter=filter,
+            output_fields=output_fields,
+            partition_names=partition_names,
+            search_params=search_params or {"metric_type": "COSINE"}
+        )
+
+    def search_batch(self, collection_name: str, search_field: str, data: list[ndarray], limit: int = 10,
+                     filter: str = "", output_fields: list[str] | None = None, partition_names: list[str] | None = None,
+                     search_params: dict | None = None, batch_size: int = MILVUS_SEARCH_BATCH_SIZE) -> list[list[dict]]:
+        """
+        여러 질의 벡터를 batch_size개씩 나누어 top-k 검색하는 함수
+
+        질의가 많아도 한 요청의 크기(nq x limit)가 batch_size x limit을 넘지 않는다.
+
+        Parameters:
+            data(list[ndarray]): 기준 벡터 리스트
+            batch_size(int): 한 번의 search 요청에 담을 질의 수
+            (그 외는 search와 동일)
+
+        Returns:
+            [질의1의 결과, 질의2의 결과, ...] 입력 순서대로
+        """
+        results: list[list[dict]] = []
+        # 모든 배치가 끝날 때까지 파티션을 해제하지 않는다.
+        with self._resident(collection_name, partition_names):
+            for start in range(0, len(data), batch_size):
+                results.extend(self._search(collection_name, search_field, data[start:start + batch_size], limit,
+                                            filter, output_fields, partition_names, search_params))
+        return results
+
+    def search_iterator(self, collection_name: str, search_field: str, data: ndarray, batch_size: int = 100,
+                        limit: int = -1, filter: str = "", output_fields: list[str] | None = None,
+                        partition_names: list[str] | None = None, search_params: dict | None = None) -> Iterator[list[dict]]:
+        """
+        유사도 순서대로 결과를 batch_size개씩 끊어 반환하는 함수 (깊은 페이지 조회용)
+
+        top-k 상한(MILVUS_SEARCH_MAX_LIMIT)을 넘는 결과가 필요할 때 사용한다.
+        필요한 만큼만 순회하고 멈추면 이후 페이지는 조회하지 않는다.
+
+        Parameters:
+            data(ndarray): 기준 벡터 1개
+            batch_size(int): 페이지당 레코드 수
+            limit(int): 전체 최대 레코드 수 (-1이면 제한 없음)
+            (그 외는 search와 동일)
+
+        Returns:
+            Iterator[list[dict]] 페이지 단위
+        """
+        iterator = self.get_connection().search_iterator(
+            collection_name=collection_name,
+            data=self._project_vectors(collection_name, search_field, [data]),
+            anns_field=search_field,
+            batch_size=batch_size,
+            limit=limit,
+            filter=filter,
+            output_fields=output_fields,
+            partition_names=partition_names,
+            search_params=search_params or {"metric_type": "COSINE"}
+        )
+        try:
+            while page := iterator.next():
+                yield list(page)
+        finally:
+            iterator.close()
+
     def insert(self, collection_name:str, partition_name:str, data:dict|list[dict]):
         """
         콜렉션 레코드를 추가하는 함수
@@ -184,9 +486,94 @@ class MilvusDatabase:
         return self.get_connection().insert(
             collection_name=collection_name,
             partition_name=partition_name,
-            data=data
+            data=self._project_rows(collection_name, data)
         )
 
+    def upsert(self, collection_name:str, partition_name:str, data:dict|list[dict]):
+        """
+        콜렉션 레코드를 추가하거나, 같은 primary key가 있으면 교체하는 함수
+
+        Parameters:
+            collection_name(str): 추가할 콜렉션 명
+            partition_name(str): 추가할 파티션 묶음
+            data(dict|list[dict]): 추가/교체할 레코드 (primary key 포함)
+        """
+        return self.get_connection().upsert(
+            collection_name=collection_name,
+            partition_name=partition_name,
+            data=self._project_rows(collection_name, data)
+        )
+
+    def bulk_insert(self, collection_name:str, partition_name:str, records:Iterable[dict], text_field:str,
+                    vector_field:str, chunk_size:int=MILVUS_INSERT_CHUNK_SIZE) -> list[InsertChunkReport]:
+        """
+        대량의 레코드를 임베딩하면서 청크 단위로 추가하는 함수
+
+        청크 i를 Milvus에 쓰는 동안 청크 i+1을 임베딩한다(CPU/IO 병렬).
+        쓰기는 한 번에 하나만 진행되므로, 메모리에는 최대 2개 청크만 올라간다(backpressure).
+        실패한 청크는 건너뛰고 보고서에 사유를 남긴다.
+
+        Parameters:
+            collection_name(str): 추가할 콜렉션 명
+            partition_name(str): 추가할 파티션 묶음
+            records(Iterable[dict]): 추가할 레코드 (iterator/generator 가능)
+            text_field(str): 임베딩할 텍스트가 담긴 field 명
+            vector_field(str): 임베딩 벡터를 저장할 field 명
+            chunk_size(int): 청크당 레코드 수
+
+        Returns:
+            [InsertChunkReport, ...] 청크 순서대로
+        """
+        reports: list[InsertChunkReport] = []
+        iterator = iter(records)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="milvus-insert") as writer:
+            pending: Future | None = None
+            while chunk := list(islice(iterator, chunk_size)):
+                report = InsertChunkReport(index=len(reports), count=len(chunk))
+                reports.append(report)
+
+                # 1) 임베딩 (이전 청크의 insert와 병렬로 진행)
+                started = time.perf_counter()
+                try:
+                    vectors = embedding_model.embedding([str(record[text_field]) for record in chunk])
+                    vectors = self._project_vectors(collection_name, vector_field, vectors)
+                    rows = [{**record, vector_field: vector} for record, vector in zip(chunk, vectors)]
+                except Exception as e:
+                    report.error = f"embedding: {e}"
+                    rows = None
+                report.embed_seconds = time.perf_counter() - started
+
+                # 2) 이전 청크의 insert가 끝날 때까지 대기 후 다음 insert 시작
+                if pending is not None:
+                    pending.result()
+                pending = writer.submit(self._insert_chunk, collection_name, partition_name, rows, report) if rows else None
+
+            if pending is not None:
+                pending.result()
+
+        inserted = sum(report.inserted for report in reports)
+        failed = [report.index for report in reports if report.error]
+        # LOG. 대량 추가 결과
+        log.info(msg=f"\n\n[MilvusDatabase] bulk_insert({collection_name}) {inserted}건 저장, 실패 청크 {failed}\n")
+        return reports
+
+    def _insert_chunk(self, collection_name:str, partition_name:str, rows:list[dict], report:InsertChunkReport):
+        """
+        bulk_insert의 청크 하나를 추가하고, 결과를 report에 기록하는 함수
+        """
+        started = time.perf_counter()
+        try:
+            result = self.insert(collection_name=collection_name, partition_name=partition_name, data=rows)
+            report.inserted = int(result.get("insert_count", len(rows)))
+        except Exception as e:
+            report.error = f"insert: {e}"
+        report.insert_seconds = time.perf_counter() - started
+
+        # LOG. 청크별 처리량
+        log.info(msg=f"\n\n[MilvusDatabase] chunk {report.index}: {report.inserted}/{report.count}건, "
+                     f"{report.rows_per_second:.1f} rows/s, error={report.error}\n")
+
     def delete(self, collection_name: str, partition_name: str, filter:str):
         """
         콜렉션 레코드를 삭제하는 함수
@@ -243,6 +630,15 @@ class MilvusDatabase:
             partition_name=partition_name
         )
 
+    def list_partitions(self, collection_name:str) -> list[str]:
+        """
+        콜렉션의 파티션 명을 모두 반환하는 함수
+
+        Parameters:
+            collection_name(str): 확인할 콜렉션 명
+        """
+        return self.get_connection().list_partitions(collection_name=collection_name)
+
     def load_partitions(self, collection_name:str, partition_names:str|list[str]):
         """
         Milvus에 파티션을 불러오는 함수
@@ -271,6 +667,19 @@ class MilvusDatabase:
             partition_name=partition_name
         )
 
+    def get_partition_stats(self, collection_name:str, partition_name:str):
+        """
+        파티션의 통계(row_count)를 확인하는 함수
+
+        Parameters:
+            collection_name(str): 해당 파티션이 있는 콜렉션
+            partition_name(str): 확인할 파티션 명
+        """
+        return self.get_connection().get_partition_stats(
+            collection_name=collection_name,
+            partition_name=partition_name
+        )
+
     def release_partitions(self, collection_name:str, partition_names:list[str]):
         """
         Milvus에 파티션을 해제하는 함수
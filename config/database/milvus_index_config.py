@@ -0,0 +1,92 @@
+# config/database/milvus_index_config.py
+import json
+import os
+from dataclasses import dataclass, field, replace
+
+from pymilvus.milvus_client import IndexParams
+
+# .env 환경 변수 추출
+MILVUS_INDEX = os.getenv('MILVUS_INDEX', 'AUTOINDEX')                        # 새 콜렉션에 적용할 인덱스 프리셋 이름
+MILVUS_INDEX_PARAMS = os.getenv('MILVUS_INDEX_PARAMS')                       # (선택) 빌드 파라미터 덮어쓰기 JSON 예: {"nlist": 256}
+MILVUS_INDEX_SEARCH_PARAMS = os.getenv('MILVUS_INDEX_SEARCH_PARAMS')         # (선택) 검색 파라미터 덮어쓰기 JSON 예: {"nprobe": 32}
+
+@dataclass(frozen=True)
+class MilvusIndexConfig:
+    """
+    요약:
+        벡터 필드 인덱스의 빌드/검색 파라미터 묶음
+
+    설명:
+        같은 인덱스로 만든 콜렉션은 같은 검색 파라미터로 조회해야 하므로 둘을 한 객체로 관리한다.
+        인덱스 선택 근거는 benchmark/milvus_index_benchmark.py(빌드 시간, 메모리, QPS, recall@k)로 측정한다.
+
+    Attributes:
+        index_type(str): Milvus 인덱스 종류 (FLAT, IVF_FLAT, IVF_SQ8, IVF_PQ, HNSW, AUTOINDEX)
+        metric_type(str): 유사도 척도 * default: COSINE
+        params(dict): 인덱스 빌드 파라미터 (예: nlist, M, efConstruction)
+        search_params(dict): 검색 파라미터 (예: nprobe, ef)
+    """
+    index_type: str
+    metric_type: str = "COSINE"
+    params: dict = field(default_factory=dict)
+    search_params: dict = field(default_factory=dict)
+
+    def add_to(self, index_params: IndexParams, field_name: str) -> IndexParams:
+        """
+        index_params에 벡터 필드 인덱스를 추가하는 함수
+
+        Parameters:
+            index_params(IndexParams): MilvusDatabase.prepare_index_params()의 반환값
+            field_name(str): 인덱스를 만들 벡터 필드 명
+        """
+        index_params.add_index(field_name=field_name, index_type=self.index_type,
+                               metric_type=self.metric_type, params=dict(self.params))
+        return index_params
+
+    def to_search_params(self) -> dict:
+        """
+        MilvusDatabase.search(search_params=...)에 넘길 검색 파라미터
+        """
+        return {"metric_type": self.metric_type, "params": dict(self.search_params)}
+
+"""
+인덱스 프리셋
+- FLAT: 전수 비교(정답 기준). 빌드 비용 없음, 데이터가 커질수록 느려진다.
+- IVF_FLAT / IVF_SQ8 / IVF_PQ: nlist개 군집 중 nprobe개만 탐색. SQ8(1byte/차원)과 PQ(m byte/벡터)는 벡터를 양자화해 메모리를 줄인다.
+- HNSW: 그래프 탐색. 메모리는 가장 크지만 recall 대비 지연 시간이 가장 좋다.
+- AUTOINDEX: Milvus가 정하는 기본값
+"""
+INDEX_PRESETS: dict[str, MilvusIndexConfig] = {
+    "AUTOINDEX": MilvusIndexConfig("AUTOINDEX"),
+    "FLAT": MilvusIndexConfig("FLAT"),
+    "IVF_FLAT": MilvusIndexConfig("IVF_FLAT", params={"nlist": 128}, search_params={"nprobe": 16}),
+    "IVF_SQ8": MilvusIndexConfig("IVF_SQ8", params={"nlist": 128}, search_params={"nprobe": 16}),
+    "IVF_PQ": MilvusIndexConfig("IVF_PQ", params={"nlist": 128, "m": 64, "nbits": 8}, search_params={"nprobe": 16}),
+    "HNSW": MilvusIndexConfig("HNSW", params={"M": 16, "efConstruction": 200}, search_params={"ef": 64}),
+}
+
+def get_index_config(name: str = MILVUS_INDEX, params: str | None = MILVUS_INDEX_PARAMS,
+                     search_params: str | None = MILVUS_INDEX_SEARCH_PARAMS) -> MilvusIndexConfig:
+    """
+    요약:
+        프리셋 이름(MILVUS_INDEX)과 덮어쓰기 JSON으로 인덱스 설정을 만드는 함수
+
+    Parameters:
+        name(str): INDEX_PRESETS의 키
+        params(str): 빌드 파라미터 덮어쓰기 JSON (None이면 프리셋 그대로)
+        search_params(str): 검색 파라미터 덮어쓰기 JSON (None이면 프리셋 그대로)
+    """
+    if name not in INDEX_PRESETS:
+        raise ValueError(f"지원하지 않는 Milvus 인덱스: {name} (선택 가능: {', '.join(INDEX_PRESETS)})")
+
+    config = INDEX_PRESETS[name]
+    if params:
+        config = replace(config, params={**config.params, **json.loads(params)})
+    if search_params:
+        config = replace(config, search_params={**config.search_params, **json.loads(search_params)})
+    return config
+
+"""
+새 콜렉션에 적용할 인덱스 설정 (.env의 MILVUS_INDEX)
+"""
+index_config = get_index_config()
@@ -0,0 +1,197 @@
+# config/database/milvus_partition_residency.py
+import os
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Iterator
+
+from app.internal.log.log import log
+from config.database.milvus_database import MilvusDatabase, embedding_dim
+
+# .env 환경 변수 추출
+MILVUS_PARTITION_MEMORY_BUDGET = int(os.getenv('MILVUS_PARTITION_MEMORY_BUDGET', str(2 * 1024 ** 3)))  # bytes
+MILVUS_ROW_OVERHEAD_BYTES = int(os.getenv('MILVUS_ROW_OVERHEAD_BYTES', '256'))  # 벡터 외 스칼라/인덱스 추정치
+
+class PartitionResidencyManager:
+    """
+    요약:
+        콜렉션의 파티션을 메모리 예산 안에서 필요할 때만 불러오고, 오래 안 쓴 파티션부터 해제하는 클래스
+
+    설명:
+        - 검색 전에 use()로 필요한 파티션을 불러온다(이미 올라가 있으면 그대로 사용).
+          MILVUS_PARTITION_RESIDENCY=1이면 MilvusDatabase.search/search_batch가 파티션을 지정한 검색마다
+          MilvusDatabase.residency(콜렉션 명)의 use()로 감싼다.
+        - 불러온 파티션의 추정 메모리 합이 memory_budget을 넘으면 LRU 순서로 release 한다.
+        - 검색 중인(use 블록 안의) 파티션은 해제하지 않는다.
+        - 파티션 크기는 row_count x bytes_per_row로 추정한다.
+        - lock은 상태 갱신에만 쓰고, load/release/통계 조회(네트워크)는 lock 밖에서 한다.
+          불러오거나 해제하는 중인 파티션은 _transitions에 표시해, 같은 파티션을 쓰려는 검색은 끝날 때까지 기다린다.
+        - 생성 시 이미 불러와져 있는 파티션(예: 인덱스와 함께 만든 콜렉션은 자동 load)을 _resident에 반영한다.
+
+    Attributes:
+        collection_name(str): 관리할 콜렉션 명
+        memory_budget(int): 불러온 파티션의 추정 메모리 상한(bytes)
+        bytes_per_row(int): 레코드 1건의 추정 메모리(bytes)
+        _resident(OrderedDict[str, int]): 불러온 파티션과 추정 메모리 (앞쪽이 가장 오래 안 쓴 파티션)
+        _transitions(dict[str, threading.Event]): 불러오거나 해제하는 중인 파티션 (끝나면 set)
+        _hits(Counter): 파티션별 접근 횟수
+        _pins(Counter): 파티션별 사용 중인 검색 수
+    """
+    def __init__(self, collection_name: str, memory_budget: int = MILVUS_PARTITION_MEMORY_BUDGET,
+                 bytes_per_row: int | None = None, database: MilvusDatabase | None = None):
+        self.collection_name = collection_name
+        self.memory_budget = memory_budget
+        self.bytes_per_row = bytes_per_row or embedding_dim * 4 + MILVUS_ROW_OVERHEAD_BYTES  # FLOAT_VECTOR 기준
+        self._database = database or MilvusDatabase()
+        self._resident: OrderedDict[str, int] = OrderedDict()
+        self._transitions: dict[str, threading.Event] = {}
+        self._hits: Counter = Counter()
+        self._pins: Counter = Counter()
+        self._lock = threading.Lock()
+        self._seed()
+
+    def _estimate_bytes(self, partition_name: str) -> int:
+        stats = self._database.get_partition_stats(self.collection_name, partition_name)
+        return int(stats.get("row_count", 0)) * self.bytes_per_row
+
+    def _seed(self):
+        """
+        이미 불러와져 있는 파티션을 _resident에 반영하고, 예산을 넘으면 해제하는 함수
+        """
+        for partition_name in self._database.list_partitions(self.collection_name):
+            state = self._database.get_load_state(self.collection_name, partition_name).get("state")
+            if str(state) in ("Loaded", "Loading"):
+                self._resident[partition_name] = self._estimate_bytes(partition_name)
+        self._evict()
+
+    def _evict(self):
+        """
+        예산을 넘는 동안 사용 중이 아닌 파티션을 LRU 순서로 해제하는 함수 (lock 밖에서 호출)
+        """
+        with self._lock:
+            evicted: list[str] = []
+            used = sum(self._resident.values())
+            for partition_name in list(self._resident):
+                if used <= self.memory_budget:
+                    break
+                if self._pins[partition_name] or partition_name in self._transitions:
+                    continue
+                used -= self._resident.pop(partition_name)
+                evicted.append(partition_name)
+            if not evicted:
+                return
+            released = self._begin_transition(evicted)
+
+        try:
+            self._database.release_partitions(self.collection_name, evicted)
+        finally:
+            self._end_transition(evicted, released)
+        # LOG. 파티션 해제
+        log.info(msg=f"\n\n[PartitionResidencyManager] {self.collection_name} release {evicted} (used={used} bytes)\n")
+
+    def _begin_transition(self, partition_names: list[str]) -> threading.Event:
+        """
+        파티션을 불러오거나 해제하는 중으로 표시하는 함수 (lock 안에서 호출)
+        """
+        done = threading.Event()
+        for partition_name in partition_names:
+            self._transitions[partition_name] = done
+        return done
+
+    def _end_transition(self, partition_names: list[str], done: threading.Event):
+        with self._lock:
+            for partition_name in partition_names:
+                self._transitions.pop(partition_name, None)
+        done.set()
+
+    def _acquire(self, partition_names: list[str]):
+        """
+        파티션을 사용 중으로 표시하고, 올라가 있지 않은 파티션을 불러오는 함수
+        """
+        with self._lock:
+            for partition_name in partition_names:
+                self._hits[partition_name] += 1
+                self._pins[partition_name] += 1
+
+        try:
+            while True:
+                # 1) 다른 검색이 불러오거나 해제하는 중인 파티션은 끝날 때까지 기다린 뒤 다시 확인한다.
+                with self._lock:
+                    busy = {self._transitions[name] for name in partition_names if name in self._transitions}
+                    if not busy:
+                        missing = [name for name in partition_names if name not in self._resident]
+                        loaded = self._begin_transition(missing)
+                        break
+                for done in busy:
+                    done.wait()
+
+            # 2) 불러오기와 크기 추정은 lock 밖에서 한다.
+            if missing:
+                try:
+                    self._database.load_partitions(self.collection_name, missing)
+                    sizes = {name: self._estimate_bytes(name) for name in missing}
+                except Exception:
+                    self._end_transition(missing, loaded)
+                    raise
+                with self._lock:
+                    self._resident.update(sizes)
+                self._end_transition(missing, loaded)
+
+            # 3) 기록: 방금 쓴 파티션을 LRU의 가장 뒤로
+            with self._lock:
+                for partition_name in partition_names:
+                    self._resident.move_to_end(partition_name)
+        except Exception:
+            with self._lock:
+                self._unpin(partition_names)
+            raise
+
+    @contextmanager
+    def use(self, partition_names: list[str]) -> Iterator[list[str]]:
+        """
+        요약:
+            파티션을 불러온 상태로 유지하는 컨텍스트
+
+        설명:
+            with 블록 안에서는 해당 파티션이 해제되지 않는다.
+
+        Parameters:
+            partition_names(list[str]): 사용할 파티션 명
+        """
+        self._acquire(partition_names)
+        try:
+            self._evict()
+            yield partition_names
+        finally:
+            with self._lock:
+                self._unpin(partition_names)
+            self._evict()
+
+    def _unpin(self, partition_names: list[str]):
+        for partition_name in partition_names:
+            self._pins[partition_name] -= 1
+            if self._pins[partition_name] <= 0:
+                del self._pins[partition_name]
+
+    def release_all(self):
+        """
+        관리 중인 파티션을 모두 해제하는 함수
+        """
+        with self._lock:
+            released = list(self._resident)
+            self._resident.clear()
+        if released:
+            self._database.release_partitions(self.collection_name, released)
+
+    def stats(self) -> dict:
+        """
+        불러온 파티션/추정 메모리/접근 횟수를 반환하는 함수
+        """
+        with self._lock:
+            return {
+                "collection_name": self.collection_name,
+                "memory_budget": self.memory_budget,
+                "used": sum(self._resident.values()),
+                "resident": list(self._resident),
+                "hits": dict(self._hits),
+            }
@@ -0,0 +1,142 @@
+# config/models/embedding_client.py
+import os
+import threading
+import time
+from multiprocessing.connection import Client
+
+import numpy as np
+
+# .env 환경 변수 추출
+EMBEDDING_SERVER_ADDRESS = os.getenv('EMBEDDING_SERVER_ADDRESS')
+EMBEDDING_SERVER_AUTHKEY = os.getenv('EMBEDDING_SERVER_AUTHKEY')  # 필수 (기본값 없음)
+EMBEDDING_SERVER_CONNECT_TIMEOUT = float(os.getenv('EMBEDDING_SERVER_CONNECT_TIMEOUT', '120'))
+
+def parse_address(address: str) -> str | tuple[str, int]:
+    """
+    요약:
+        EMBEDDING_SERVER_ADDRESS 문자열을 multiprocessing.connection 주소로 변환하는 함수
+
+    설명:
+        'host:port' 형식이면 TCP(AF_INET), 그 외에는 유닉스 도메인 소켓 경로(AF_UNIX)로 해석한다.
+
+    Parameters:
+        address(str): 예) '/tmp/runnable-embedding.sock', '127.0.0.1:8765'
+    """
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit():
+        return host, int(port)
+    return address
+
+def require_authkey(authkey: str | bytes | None) -> bytes:
+    """
+    요약:
+        임베딩 서버 인증 키를 확인해 bytes로 반환하는 함수
+
+    설명:
+        multiprocessing.connection은 주고받는 값을 pickle로 복원하므로, 소켓에 접속할 수 있는 누구나
+        키를 알면 서버/클라이언트 프로세스에서 코드를 실행할 수 있다. 그래서 공개된 기본 키를 두지 않고,
+        배포마다 EMBEDDING_SERVER_AUTHKEY를 직접 정하도록 강제한다.
+
+    Raises:
+        ValueError: 키가 설정되지 않은 경우
+    """
+    if not authkey:
+        raise ValueError("EMBEDDING_SERVER_AUTHKEY가 설정되지 않았습니다. (임베딩 서버/워커에 같은 임의의 키를 지정하세요)")
+    return authkey.encode() if isinstance(authkey, str) else authkey
+
+class EmbeddingClient:
+    """
+    요약:
+        임베딩 서버(config/models/embedding_server.py)에 임베딩을 요청하는 클라이언트
+
+    설명:
+        EmbeddingModel과 같은 embedding() 인터페이스를 제공하므로, 워커 프로세스는 모델을 직접 올리지 않고
+        서버 프로세스 하나가 가진 모델을 공유한다. 여러 요청은 서버에서 하나의 배치로 묶여 처리된다.
+        연결은 스레드마다 하나씩 (처음 요청할 때) 생성된다.
+
+    Attributes:
+        backend(str): EmbeddingModel.backend와 호환을 위한 값 ('server')
+        _address: 서버 주소
+        _authkey(bytes): 서버 인증 키 (EMBEDDING_SERVER_AUTHKEY, 필수)
+        _connect_timeout(float): 서버가 아직 모델을 로딩 중일 때 접속을 재시도하는 최대 시간(초)
+        _local: 스레드별 연결을 보관하는 객체
+    """
+    backend = "server"
+
+    def __init__(self, address: str = EMBEDDING_SERVER_ADDRESS, authkey: str | bytes | None = EMBEDDING_SERVER_AUTHKEY,
+                 connect_timeout: float = EMBEDDING_SERVER_CONNECT_TIMEOUT):
+        self._address = parse_address(address)
+        self._authkey = require_authkey(authkey)
+        self._connect_timeout = connect_timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        """
+        현재 스레드의 연결을 반환하는 함수 (없으면 생성)
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+
+        # 워커와 서버가 동시에 뜨는 경우, 서버가 소켓을 열 때까지 기다린다.
+        deadline = time.monotonic() + self._connect_timeout
+        while True:
+            try:
+                connection = Client(self._address, authkey=self._authkey)
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.5)
+        self._local.connection = connection
+        return connection
+
+    def _reset_connection(self):
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except OSError:
+                pass
+
+    def embedding(self, texts: list[str]) -> list[np.ndarray]:
+        """
+        요약:
+            텍스트 리스트를 임베딩 서버에 보내 임베딩하는 함수
+
+        설명:
+            서버 재시작 등으로 연결이 끊겼다면 한 번 재연결해 다시 요청한다.
+
+        Parameters:
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            [embedded_text1, embedded_text2, ...]
+
+        Raises:
+            RuntimeError: 서버에서 임베딩이 실패한 경우
+        """
+        if not texts:
+            return []
+
+        for attempt in range(2):
+            try:
+                connection = self._connection()
+                connection.send(list(texts))
+                status, payload = connection.recv()
+                break
+            except (EOFError, OSError):
+                self._reset_connection()
+                if attempt:
+                    raise
+
+        if status != "ok":
+            raise RuntimeError(f"임베딩 서버 오류: {payload}")
+        return list(payload)
+
+    def close(self):
+        """
+        현재 스레드의 연결을 종료하는 함수
+        """
+        self._reset_connection()
@@ -1,12 +1,70 @@
 # config/models/embedding_model.py
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
 import numpy as np
 import torch
 from transformers import AutoModel, AutoTokenizer
 from transformers.utils import logging as hf_logging
 
+from app.internal.log.log import log
+
 # 허깅페이스 로깅 레벨을 ERROR 이상으로 설정
 hf_logging.set_verbosity_error()
 
+EMBEDDINGS_MODEL = "dragonkue/snowflake-arctic-embed-l-v2.0-ko"
+
+# .env 환경 변수 추출
+EMBEDDING_MODEL_PATH = os.getenv('EMBEDDING_MODEL_PATH') # 로컬 스냅샷 폴더 (config/models/embedding_snapshot.py로 생성)
+EMBEDDING_MAX_LENGTH = int(os.getenv('EMBEDDING_MAX_LENGTH', '512'))
+EMBEDDING_TOKEN_BUDGET = int(os.getenv('EMBEDDING_TOKEN_BUDGET', '16384'))
+EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'torch')
+EMBEDDING_ONNX_DIR = os.getenv('EMBEDDING_ONNX_DIR', str(Path.home() / '.cache' / 'runnable' / 'embedding-onnx'))  # 모델 출처/리비전별 하위 폴더에 저장
+
+"""
+선택 가능한 추론 백엔드
+- torch: fp32 PyTorch 모델 (GPU 사용 가능 시 GPU)
+- int8: Linear 레이어를 int8로 동적 양자화한 PyTorch 모델 (CPU 전용)
+- onnx: ONNX로 내보낸 그래프를 onnxruntime으로 실행 (CPU 전용, onnxruntime 설치 필요)
+"""
+EMBEDDING_BACKENDS = ("torch", "int8", "onnx")
+
+def onnx_cache_path(cache_dir: str, source: str, revision: str) -> Path:
+    """
+    요약:
+        모델 출처(source)와 리비전별 ONNX 그래프 경로를 반환하는 함수
+
+    설명:
+        다른 모델/리비전으로 내보낸 그래프를 재사용하지 않도록, 폴더 이름에 둘의 해시를 넣는다.
+        예) {cache_dir}/snowflake-arctic-embed-l-v2.0-ko-1a2b3c4d5e6f7a8b/model.onnx
+
+    Parameters:
+        cache_dir(str): EMBEDDING_ONNX_DIR
+        source(str): 허브 모델 이름 또는 로컬 스냅샷 경로
+        revision(str): 커밋 해시 또는 로컬 가중치 지문
+    """
+    if Path(source).exists():
+        source = str(Path(source).resolve())
+    key = hashlib.sha256(f"{source}@{revision}".encode()).hexdigest()[:16]
+    name = re.sub(r"[^0-9A-Za-z._-]+", "-", Path(source).name or source)
+    return Path(cache_dir) / f"{name}-{key}" / "model.onnx"
+
+class _LastHiddenState(torch.nn.Module):
+    """
+    ONNX export용 래퍼. ModelOutput 대신 last_hidden_state 텐서만 반환한다.
+    """
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask)[0]
+
 class EmbeddingModel:
     """
     요약:
@@ -14,42 +72,212 @@ class EmbeddingModel:
 
     설명:
         모델은 HuggingFace의 'dragonkue/snowflake-arctic-embed-l-v2.0-ko'를 사용하였다.
+        입력 문장은 토큰 길이순으로 정렬한 뒤, 배치당 토큰 예산(패딩 포함) 안에서 길이가 비슷한 문장끼리 묶어 임베딩한다.
+        긴 문장 하나 때문에 모든 문장이 같은 길이로 패딩되는 것을 막기 위함이다.
+        model_path(EMBEDDING_MODEL_PATH)를 주면 허브 조회 없이 로컬 스냅샷에서 safetensors 가중치를 메모리 맵으로 불러온다.
 
     Attributes:
         __tokenizer: 문장을 형태소 단위로 분리하기 위한 객체
         __model: 임베딩을 생성하기 위한 객체
         __device: 임베딩에 GPU를 사용하기 위한 객체
+        __session: onnx 백엔드에서 사용하는 onnxruntime 세션 (그 외 백엔드는 None)
+        backend(str): 추론 백엔드 (EMBEDDING_BACKENDS 중 하나)
+        max_length(int): 문장당 최대 토큰 수(초과분은 잘라낸다)
+        token_budget(int): 한 배치의 (문장 수 x 패딩된 토큰 길이) 상한
+        startup_timings(dict[str, float]): 초기화 단계별 소요 시간(초) - tokenizer, weights, device, backend
     """
-    def __init__(self):
-        EMBEDDINGS_MODEL = "dragonkue/snowflake-arctic-embed-l-v2.0-ko"
+    def __init__(self, max_length: int = EMBEDDING_MAX_LENGTH, token_budget: int = EMBEDDING_TOKEN_BUDGET,
+                 backend: str = EMBEDDING_BACKEND, model_path: str | None = EMBEDDING_MODEL_PATH):
+        if backend not in EMBEDDING_BACKENDS:
+            raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend} (선택 가능: {', '.join(EMBEDDING_BACKENDS)})")
 
-        self.__tokenizer = AutoTokenizer.from_pretrained(EMBEDDINGS_MODEL)
-        self.__model = AutoModel.from_pretrained(EMBEDDINGS_MODEL, add_pooling_layer=False)
+        self.backend = backend
+        self.max_length = max_length
+        self.token_budget = max(token_budget, max_length) # 최소한 최장 문장 1개는 들어가야 한다.
+
+        self.startup_timings: dict[str, float] = {}
+
+        # 로컬 스냅샷이 있으면 허브 캐시 조회/네트워크 없이 로딩
+        source = model_path or EMBEDDINGS_MODEL
+        local_options = {"local_files_only": True} if model_path else {}
+
+        started = time.perf_counter()
+        self.__tokenizer = AutoTokenizer.from_pretrained(source, **local_options)
+        self.startup_timings["tokenizer"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if model_path:
+            # safetensors는 메모리 맵으로 열리므로, low_cpu_mem_usage와 함께 쓰면 가중치를 한 번 더 복사하지 않는다.
+            self.__model = AutoModel.from_pretrained(source, add_pooling_layer=False, use_safetensors=True,
+                                                     low_cpu_mem_usage=True, **local_options)
+        else:
+            self.__model = AutoModel.from_pretrained(source, add_pooling_layer=False)
         self.__model.eval()
-        self.__device = torch.device('cuda' if torch.cuda.is_available() else 'cpu') # GPU 사용 가능 시 연산을 GPU에서 하도록 변경
+        self.startup_timings["weights"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        # GPU 사용 가능 시 연산을 GPU에서 하도록 변경 (int8/onnx 백엔드는 CPU 전용)
+        self.__device = torch.device('cuda' if backend == "torch" and torch.cuda.is_available() else 'cpu')
         self.__model.to(self.__device)
+        self.__session = None
+        self.startup_timings["device"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if backend == "int8":
+            # Linear 가중치를 int8로 동적 양자화
+            self.__model = torch.ao.quantization.quantize_dynamic(self.__model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif backend == "onnx":
+            onnx_path = onnx_cache_path(EMBEDDING_ONNX_DIR, source, self._model_revision(source, model_path))
+            self.__session = self._load_onnx_session(str(onnx_path))
+            self.__model = None # 세션 생성 후 PyTorch 모델은 메모리에서 해제
+        self.startup_timings["backend"] = time.perf_counter() - started
+
+        # LOG. 초기화 단계별 소요 시간
+        report = ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in self.startup_timings.items())
+        log.info(msg=f"\n\n[EmbeddingModel] loaded from {source} ({backend}/{self.__device}) - {report}\n")
+
+    def _model_revision(self, source: str, model_path: str | None) -> str:
+        """
+        요약:
+            ONNX 캐시 키로 쓸 모델 리비전을 반환하는 함수
+
+        설명:
+            허브 모델은 불러온 커밋 해시(config._commit_hash)를 사용한다.
+            로컬 스냅샷은 커밋 해시가 없을 수 있으므로, 가중치(safetensors) 파일의 이름/크기/수정 시각으로 대신한다.
+        """
+        commit_hash = getattr(self.__model.config, "_commit_hash", None)
+        if commit_hash:
+            return commit_hash
+        if model_path:
+            stats = [(path.name, path.stat().st_size, path.stat().st_mtime_ns)
+                     for path in sorted(Path(model_path).glob("*.safetensors"))]
+            return hashlib.sha256(repr(stats).encode()).hexdigest()
+        return "unknown"
+
+    def _load_onnx_session(self, onnx_path: str):
+        """
+        요약:
+            ONNX 그래프를 불러와 onnxruntime 세션을 생성하는 함수
+
+        설명:
+            onnx_path에 그래프가 없으면 현재 PyTorch 모델을 내보낸 뒤 불러온다.
+            모델 가중치가 2GB를 넘으므로 가중치는 같은 폴더의 external data 파일로 저장된다.
+            내보내기는 같은 부모 폴더의 임시 폴더에서 진행하고, 끝난 뒤 os.replace로 폴더째 옮긴다.
+            (중간에 죽거나 여러 프로세스가 동시에 내보내도 반쯤 쓰인 그래프를 읽지 않는다)
+
+        Parameters:
+            onnx_path(str): ONNX 그래프 파일 경로 (onnx_cache_path)
+        """
+        import onnxruntime # 선택 의존성: onnx 백엔드를 사용할 때만 필요
+
+        path = Path(onnx_path)
+        if not path.exists():
+            path.parent.parent.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(prefix=f".{path.parent.name}-", dir=path.parent.parent))
+            try:
+                dummy = self.__tokenizer(["ONNX 내보내기용 문장"], return_tensors='pt')
+                with torch.no_grad():
+                    torch.onnx.export(
+                        _LastHiddenState(self.__model),
+                        (dummy["input_ids"], dummy["attention_mask"]),
+                        str(staging / path.name),
+                        input_names=["input_ids", "attention_mask"],
+                        output_names=["last_hidden_state"],
+                        dynamic_axes={
+                            "input_ids": {0: "batch", 1: "sequence"},
+                            "attention_mask": {0: "batch", 1: "sequence"},
+                            "last_hidden_state": {0: "batch", 1: "sequence"},
+                        },
+                        opset_version=17,
+                    )
+                os.replace(staging, path.parent)
+            except OSError:
+                # 다른 프로세스가 먼저 옮겼으면 그 결과를 사용
+                if not path.exists():
+                    raise
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        return onnxruntime.InferenceSession(str(path), sess_options=options, providers=["CPUExecutionProvider"])
+
+    def _forward(self, tokens: dict[str, torch.Tensor]) -> np.ndarray:
+        """
+        요약:
+            패딩된 토큰 배치를 정규화된 CLS 임베딩(float32)으로 변환하는 함수
+
+        Parameters:
+            tokens(dict[str, Tensor]): input_ids, attention_mask
+        """
+        if self.__session is not None:
+            outputs = self.__session.run(None, {key: val.numpy() for key, val in tokens.items()})[0][:, 0]  # CLS 토큰
+            return outputs / np.linalg.norm(outputs, axis=1, keepdims=True)
+
+        tokens = {key: val.to(self.__device) for key, val in tokens.items()}
+        with torch.no_grad():
+            outputs = self.__model(**tokens)[0][:, 0]  # CLS 토큰
+            embeddings = torch.nn.functional.normalize(outputs, p=2, dim=1)
+        return embeddings.cpu().numpy()
+
+    def _buckets(self, lengths: list[int]) -> list[list[int]]:
+        """
+        요약:
+            토큰 길이를 기준으로 입력 인덱스를 배치(bucket) 단위로 묶는 함수
+
+        설명:
+            길이 내림차순으로 정렬한 뒤, (버킷 크기 x 버킷 내 최장 길이)가 token_budget을 넘기 전까지 채운다.
+            내림차순이므로 버킷의 첫 원소가 곧 패딩 기준 길이이다.
+
+        Parameters:
+            lengths(list[int]): 각 입력 문장의 토큰 길이
+
+        Returns:
+            [[index, ...], [index, ...], ...]
+        """
+        order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+
+        buckets: list[list[int]] = []
+        bucket: list[int] = []
+        for index in order:
+            padded_length = lengths[bucket[0]] if bucket else lengths[index]
+            if bucket and (len(bucket) + 1) * padded_length > self.token_budget:
+                buckets.append(bucket)
+                bucket = []
+            bucket.append(index)
+        if bucket:
+            buckets.append(bucket)
+        return buckets
 
     def embedding(self, texts: list[str]) -> list[np.ndarray]:
         """
         요약:
             텍스트 리스트를 임베딩하는 함수
 
+        설명:
+            길이별 버킷으로 나누어 임베딩하지만, 반환 순서는 입력 순서와 같다.
+
         Parameters:
             texts: 임베딩할 텍스트 리스트
 
         Returns:
             [embedded_text1, embedded_text2, ...]
         """
-        # 토크나이징
-        tokens = self.__tokenizer(texts, padding=True, truncation=True, return_tensors='pt', max_length=8192)
-        tokens = {key: val.to(self.__device) for key, val in tokens.items()}
+        if not texts:
+            return []
 
-        # 임베딩 생성
-        with torch.no_grad():
-            outputs = self.__model(**tokens)[0][:, 0]  # CLS 토큰
-            embeddings = torch.nn.functional.normalize(outputs, p=2, dim=1)
+        # 토크나이징 (패딩 없이 길이만 측정)
+        encoded = self.__tokenizer(texts, truncation=True, max_length=self.max_length, return_attention_mask=False)
+        input_ids: list[list[int]] = encoded["input_ids"]
+
+        results: list[np.ndarray | None] = [None] * len(texts)
+        for bucket in self._buckets([len(ids) for ids in input_ids]):
+            # 버킷 내 최장 길이로만 패딩
+            tokens = self.__tokenizer.pad({"input_ids": [input_ids[i] for i in bucket]}, padding=True, return_tensors='pt')
 
-        # NumPy 배열로 반환
-        return [embedding.cpu().numpy().astype(np.float16) for embedding in embeddings]
+            # 임베딩 생성 후 원래 위치에 배치
+            embeddings = self._forward(dict(tokens))
+            for index, embedding in zip(bucket, embeddings.astype(np.float16)):
+                results[index] = embedding
 
-embedding_model = EmbeddingModel()
\ No newline at end of file
+        return results
@@ -0,0 +1,60 @@
+# config/models/embedding_projection.py
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+class EmbeddingProjection(ABC):
+    """
+    요약:
+        EmbeddingModel.embedding() 결과를 더 작은 차원으로 줄이는 투영(projection) 추상 클래스
+
+    설명:
+        투영 후에도 코사인 유사도를 그대로 쓸 수 있도록 결과 벡터는 다시 L2 정규화한다.
+        같은 콜렉션에 저장/검색하는 벡터는 반드시 같은 투영을 거쳐야 한다.
+        콜렉션에 적용되는 투영은 MilvusDatabase.projection()이 콜렉션 스키마(벡터 field의 dim)로 정한다.
+
+    Attributes:
+        dim(int): 투영 후 차원 수 (Milvus 콜렉션의 dimension)
+    """
+    KIND: str = ""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    @abstractmethod
+    def _project(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        (n, 원본 차원) float32 행렬을 (n, dim)으로 투영하는 함수
+        """
+        pass
+
+    def apply(self, vectors: list[np.ndarray]) -> list[np.ndarray]:
+        """
+        요약:
+            임베딩 벡터 리스트를 투영하는 함수
+
+        Parameters:
+            vectors(list[ndarray]): EmbeddingModel.embedding()의 반환값
+
+        Returns:
+            [projected_vector1, projected_vector2, ...]
+        """
+        if not len(vectors):
+            return []
+        projected = self._project(np.stack(vectors).astype(np.float32))
+        projected /= np.maximum(np.linalg.norm(projected, axis=1, keepdims=True), 1e-12)
+        return list(projected.astype(np.float16))
+
+class TruncateProjection(EmbeddingProjection):
+    """
+    요약:
+        앞쪽 dim개 성분만 남기는 Matryoshka 투영
+
+    설명:
+        snowflake-arctic-embed-l-v2.0 계열은 Matryoshka 학습이 되어 있어, 앞부분만 잘라 재정규화해도 검색 품질이 크게 떨어지지 않는다.
+        파라미터가 dim 하나뿐이라 콜렉션 스키마만으로 모든 호스트/워커가 같은 투영을 복원할 수 있다.
+    """
+    KIND = "truncate"
+
+    def _project(self, matrix: np.ndarray) -> np.ndarray:
+        return matrix[:, :self.dim].copy()
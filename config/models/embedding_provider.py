@@ -0,0 +1,25 @@
+# config/models/embedding_provider.py
+"""
+프로세스가 사용할 임베딩 모델(embedding_model)을 고르는 모듈
+
+torch/transformers를 import하지 않는다. 임베딩 서버에 접속하는 워커는 이 모듈만 불러오므로
+모델 라이브러리를 메모리에 올리지 않는다. (EmbeddingModel은 서버 주소가 없을 때만 import)
+"""
+from config.models.embedding_client import EMBEDDING_SERVER_ADDRESS, EmbeddingClient
+
+def _load_embedding_model():
+    """
+    요약:
+        프로세스가 사용할 임베딩 모델을 생성하는 함수
+
+    설명:
+        EMBEDDING_SERVER_ADDRESS가 설정되어 있으면 모델을 직접 올리지 않고, 임베딩 서버에 접속하는 클라이언트를 반환한다.
+        (uvicorn 워커가 여러 개여도 모델은 서버 프로세스에 하나만 존재)
+    """
+    if EMBEDDING_SERVER_ADDRESS:
+        return EmbeddingClient(EMBEDDING_SERVER_ADDRESS)
+
+    from config.models.embedding_model import EmbeddingModel # torch/transformers는 모델을 직접 올릴 때만 필요
+    return EmbeddingModel()
+
+embedding_model = _load_embedding_model()
@@ -0,0 +1,149 @@
+# config/models/embedding_server.py
+"""
+여러 uvicorn 워커가 공유하는 임베딩 서버 프로세스
+
+모델은 이 프로세스에만 한 번 올라가고, 워커는 EMBEDDING_SERVER_ADDRESS로 접속하는 EmbeddingClient를 사용한다.
+동시에 들어온 요청은 짧은 대기 시간(EMBEDDING_SERVER_BATCH_WAIT_MS) 동안 모아 하나의 배치로 임베딩한다.
+
+실행:
+    EMBEDDING_SERVER_ADDRESS=/tmp/runnable-embedding.sock EMBEDDING_SERVER_AUTHKEY={임의의 키} python -m config.models.embedding_server
+"""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from multiprocessing.connection import Listener
+from multiprocessing import AuthenticationError
+
+from dotenv import load_dotenv
+
+# NOTE. 환경 변수 로딩 (config.models 모듈보다 먼저)
+load_dotenv()
+
+from app.internal.log.log import log
+from config.models.embedding_client import EMBEDDING_SERVER_ADDRESS, EMBEDDING_SERVER_AUTHKEY, parse_address, require_authkey
+from config.models.embedding_model import EmbeddingModel
+
+EMBEDDING_SERVER_MAX_BATCH = int(os.getenv('EMBEDDING_SERVER_MAX_BATCH', '256'))
+EMBEDDING_SERVER_BATCH_WAIT_MS = float(os.getenv('EMBEDDING_SERVER_BATCH_WAIT_MS', '5'))
+
+@dataclass
+class _Request:
+    """
+    연결 스레드가 배치 스레드에 넘기는 임베딩 요청
+    """
+    texts: list[str]
+    future: Future = field(default_factory=Future)
+
+class EmbeddingServer:
+    """
+    요약:
+        하나의 EmbeddingModel을 소유하고, 소켓으로 들어온 임베딩 요청을 배치로 처리하는 서버
+
+    설명:
+        - 연결마다 스레드 하나가 요청을 읽어 큐에 넣고, 결과가 나올 때까지 기다렸다가 돌려준다.
+        - 배치 스레드 하나만 모델을 호출하므로 모델은 스레드 안전할 필요가 없다.
+
+    Attributes:
+        _model(EmbeddingModel): 임베딩 모델
+        _address: 바인딩할 주소 (유닉스 소켓 경로 또는 (host, port))
+        _authkey(bytes): 인증 키 (EMBEDDING_SERVER_AUTHKEY, 필수)
+        _queue(Queue): 처리 대기 중인 요청
+        _max_batch(int): 한 배치에 모을 최대 텍스트 수
+        _batch_wait(float): 배치를 모으기 위해 기다리는 최대 시간(초)
+    """
+    def __init__(self, model: EmbeddingModel, address: str = EMBEDDING_SERVER_ADDRESS,
+                 authkey: str | bytes | None = EMBEDDING_SERVER_AUTHKEY,
+                 max_batch: int = EMBEDDING_SERVER_MAX_BATCH, batch_wait_ms: float = EMBEDDING_SERVER_BATCH_WAIT_MS):
+        self._model = model
+        self._address = parse_address(address)
+        self._authkey = require_authkey(authkey)
+        self._queue: queue.Queue[_Request] = queue.Queue()
+        self._max_batch = max_batch
+        self._batch_wait = batch_wait_ms / 1000
+
+    def serve_forever(self):
+        """
+        요청 수신을 시작하는 함수 (종료 시까지 반환하지 않음)
+        """
+        # 이전 실행이 남긴 유닉스 소켓 파일 정리
+        if isinstance(self._address, str) and os.path.exists(self._address):
+            os.remove(self._address)
+
+        threading.Thread(target=self._batch_loop, name="embedding-batch", daemon=True).start()
+        with Listener(self._address, authkey=self._authkey) as listener:
+            log.info(msg=f"\n\n[EmbeddingServer] listening on {self._address}\n")
+            while True:
+                try:
+                    connection = listener.accept()
+                except (AuthenticationError, OSError, EOFError):
+                    log.exception(msg="\n\n[EmbeddingServer] 연결 수락 실패\n")
+                    continue
+                threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+
+    def _handle(self, connection):
+        """
+        하나의 클라이언트 연결을 처리하는 함수
+        """
+        with connection:
+            while True:
+                try:
+                    texts = connection.recv()
+                except (EOFError, OSError):
+                    return # 클라이언트 종료
+
+                request = _Request(texts=texts)
+                self._queue.put(request)
+                # 모델 오류(OSError 포함)는 클라이언트에 돌려주고, 연결 오류만 종료로 본다.
+                try:
+                    response = ("ok", request.future.result())
+                except Exception as e:
+                    response = ("error", str(e))
+
+                try:
+                    connection.send(response)
+                except (EOFError, OSError):
+                    return # 클라이언트 종료
+
+    def _batch_loop(self):
+        """
+        큐에 쌓인 요청을 모아 한 번에 임베딩하는 함수
+        """
+        while True:
+            batch = [self._queue.get()]
+            size = len(batch[0].texts)
+
+            # 첫 요청 이후 batch_wait 동안 다른 요청을 더 모은다.
+            deadline = time.monotonic() + self._batch_wait
+            while size < self._max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            try:
+                vectors = self._model.embedding([text for request in batch for text in request.texts])
+            except Exception as e:
+                log.exception(msg=f"\n\n[EmbeddingServer] 임베딩 실패 ({size}건)\n")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            offset = 0
+            for request in batch:
+                request.future.set_result(vectors[offset:offset + len(request.texts)])
+                offset += len(request.texts)
+
+if __name__ == "__main__":
+    if not EMBEDDING_SERVER_ADDRESS:
+        raise SystemExit("EMBEDDING_SERVER_ADDRESS가 설정되지 않았습니다.")
+    if not EMBEDDING_SERVER_AUTHKEY:
+        raise SystemExit("EMBEDDING_SERVER_AUTHKEY가 설정되지 않았습니다.")
+    EmbeddingServer(EmbeddingModel()).serve_forever()
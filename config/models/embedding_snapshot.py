@@ -0,0 +1,46 @@
+# config/models/embedding_snapshot.py
+"""
+임베딩 모델의 로컬 스냅샷을 만드는 스크립트
+
+허브에서 특정 revision의 tokenizer/config/safetensors 파일만 받아 폴더에 고정한다.
+만든 폴더를 EMBEDDING_MODEL_PATH로 지정하면, 컨테이너는 네트워크/허브 캐시 조회 없이 모델을 불러온다.
+
+실행:
+    python -m config.models.embedding_snapshot ./models/snowflake-arctic-embed-l-v2.0-ko --revision main
+"""
+import argparse
+
+from huggingface_hub import snapshot_download
+
+# config/models/embedding_model.py의 EMBEDDINGS_MODEL과 동일
+# (embedding_model을 import하면 모델이 바로 로딩되므로 상수를 따로 둔다)
+EMBEDDINGS_MODEL = "dragonkue/snowflake-arctic-embed-l-v2.0-ko"
+
+# 추론에 필요한 파일만 받는다 (pytorch_model.bin, onnx 등 제외)
+SNAPSHOT_PATTERNS = ["*.json", "*.safetensors", "*.model", "*.txt"]
+
+def create_snapshot(local_dir: str, revision: str | None = None) -> str:
+    """
+    요약:
+        임베딩 모델 스냅샷을 local_dir에 내려받는 함수
+
+    Parameters:
+        local_dir(str): 스냅샷을 저장할 폴더
+        revision(str): 고정할 커밋 해시/브랜치/태그 (None이면 기본 브랜치)
+
+    Returns:
+        스냅샷 폴더 경로
+    """
+    return snapshot_download(
+        repo_id=EMBEDDINGS_MODEL,
+        revision=revision,
+        local_dir=local_dir,
+        allow_patterns=SNAPSHOT_PATTERNS,
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("local_dir", help="스냅샷을 저장할 폴더")
+    parser.add_argument("--revision", default=None, help="고정할 커밋 해시/브랜치/태그")
+    args = parser.parse_args()
+    print(create_snapshot(args.local_dir, args.revision))
@@ -15,10 +15,23 @@ def _get_port() -> int:
 def _get_reload() -> bool:
     return os.getenv("RELOAD", "1") == "1"
 
+def _get_workers() -> int:
+    return int(os.getenv("WORKERS", "1"))
+
+def _get_embedding_server() -> bool:
+    # 임베딩 서버 주소가 있을 때만 서버 프로세스를 함께 띄운다.
+    return os.getenv("EMBEDDING_SERVER", "0") == "1" and bool(os.getenv("EMBEDDING_SERVER_ADDRESS"))
+
+def _start_embedding_server(workdir: str):
+    # 모든 워커가 공유할 임베딩 모델 프로세스 (config/models/embedding_server.py)
+    cmd = [sys.executable, "-m", "config.models.embedding_server"]
+    return subprocess.Popen(cmd, env=os.environ.copy(), cwd=workdir)
+
 def run_subprocess():
     host = _get_host()
     port = _get_port()
     reload_ = _get_reload()
+    workers = _get_workers()
 
     cmd = [
         sys.executable, "-m", "uvicorn", "app.main:app",
@@ -26,10 +39,14 @@ def run_subprocess():
     ]
     if reload_:
         cmd.append("--reload")
+    elif workers > 1:
+        # --reload와 --workers는 함께 쓸 수 없다.
+        cmd += ["--workers", str(workers)]
 
     # 실행 기준 디렉터리: 이 파일 위치
     workdir = str(Path(__file__).resolve().parent)
 
+    embedding_server = _start_embedding_server(workdir) if _get_embedding_server() else None
     try:
         proc = subprocess.Popen(cmd, env=os.environ.copy(), cwd=workdir)
         proc.wait()
@@ -40,6 +57,9 @@ def run_subprocess():
             proc.terminate()
         except Exception:
             pass
+    finally:
+        if embedding_server is not None:
+            embedding_server.terminate()
     sys.exit(code)
 
 def run_inproc():
@@ -50,7 +70,7 @@ def run_inproc():
     uvicorn.run("app.main:app", host=host, port=port, reload=reload_)
 
 def parse_overrides():
-    # 간단한 CLI 오버라이드: --host, --port, --reload/--no-reload
+    # 간단한 CLI 오버라이드: --host, --port, --workers, --reload/--no-reload, --embedding-server
     # (환경변수보다 우선)
     args = sys.argv[1:]
     for i, a in enumerate(list(args)):
@@ -62,6 +82,10 @@ def parse_overrides():
             os.environ["RELOAD"] = "1"
         if a == "--no-reload":
             os.environ["RELOAD"] = "0"
+        if a == "--workers" and i + 1 < len(args):
+            os.environ["WORKERS"] = args[i + 1]
+        if a == "--embedding-server":
+            os.environ["EMBEDDING_SERVER"] = "1"
 
 if __name__ == "__main__":
     parse_overrides()
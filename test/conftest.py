@@ -7,6 +7,9 @@ from sqlalchemy import create_engine, event, URL, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 
+# 테스트는 운영 Milvus 콜렉션(route_search, places 등)을 건드리지 않도록 test_ 접두사 콜렉션을 쓴다. (app import 전에 설정)
+os.environ.setdefault("MILVUS_COLLECTION_PREFIX", "test_")
+
 from app.main import app
 from config.database.postgres_database import Base
 from config.database.postgres_database import get_database
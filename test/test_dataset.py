@@ -0,0 +1,375 @@
+# test/test_dataset.py
+import json
+import os
+import re
+import subprocess
+import sys
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.routers.dataset.dataset_store import WktDataset
+from app.utils.radius_filter import haversine_m
+
+DATASET_API = "/api/v1/dataset"
+
+
+def test_drinking_fountains_radius(client):
+    # NOTE 1. 반경 안 레코드만, 하버사인 기준으로 반환
+    lat, lon, radius_m = 37.553682418, 126.983193531, 1000.0
+    res = client.get(f"{DATASET_API}/drinkingFountains", params={"lat": lat, "lon": lon, "radius_m": radius_m})
+    assert res.status_code == 200
+    body = res.json()
+    assert body["message"] == "음수대 조회 성공"
+    data = body["data"]
+    assert len(data) >= 1
+    assert all(haversine_m(lat, lon, float(o["lat"]), float(o["lng"])) <= radius_m for o in data)
+
+    # NOTE 2. 반경을 넓히면 결과는 줄어들지 않는다.
+    res = client.get(f"{DATASET_API}/drinkingFountains", params={"lat": lat, "lon": lon, "radius_m": radius_m * 5})
+    assert res.status_code == 200
+    assert len(res.json()["data"]) >= len(data)
+
+
+def test_drinking_fountains_far_away(client):
+    # 서울에서 먼 좌표(제주 앞바다)는 결과 없음
+    res = client.get(f"{DATASET_API}/drinkingFountains", params={"lat": 33.0, "lon": 126.0, "radius_m": 500})
+    assert res.status_code == 200
+    assert res.json()["data"] == []
+
+
+def test_crosswalks_radius(client):
+    # 파일이 배포되지 않은 환경에서도 빈 목록으로 응답한다.
+    res = client.get(f"{DATASET_API}/crosswalks", params={"lat": 37.566406, "lon": 126.977822, "radius_m": 500})
+    assert res.status_code == 200
+    assert res.json()["message"] == "횡단보도 조회 성공"
+    assert isinstance(res.json()["data"], list)
+
+
+def _crosswalk_records(center: tuple[float, float], axis_order: str, count: int = 200, seed: int = 0) -> list[dict]:
+    """
+    횡단보도 형식 레코드 (NODE: node_wkt POINT / LINK: lnkg_wkt LINESTRING·MULTILINESTRING).
+    center는 (위도, 경도), axis_order가 lonlat이면 WKT 좌표쌍을 (경도 위도)로, latlon이면 (위도 경도)로 쓴다.
+    """
+    rng = np.random.default_rng(seed)
+
+    def pair() -> str:
+        lat, lon = center[0] + rng.uniform(-0.01, 0.01), center[1] + rng.uniform(-0.01, 0.01)
+        x, y = (lon, lat) if axis_order == "lonlat" else (lat, lon)
+        return f"{x:.7f} {y:.7f}"
+
+    records = []
+    for index in range(count):
+        kind = index % 4
+        if kind == 0:
+            records.append({"node_type": "NODE", "node_wkt": f"POINT ({pair()})", "lnkg_wkt": ""})
+        elif kind == 1:
+            records.append({"node_type": "LINK", "lnkg_wkt": f"LINESTRING ({pair()}, {pair()}, {pair()})"})
+        elif kind == 2:
+            records.append({"node_type": "LINK", "lnkg_wkt": f"MULTILINESTRING (({pair()}, {pair()}), ({pair()}, {pair()}))"})
+        else:
+            # 좌표 없는 NODE → lnkg_wkt의 버텍스로 대체
+            records.append({"node_type": "node", "node_wkt": "POINT EMPTY", "lnkg_wkt": f"LINESTRING ({pair()}, {pair()})"})
+    return records
+
+
+def _within_radius_both_orders(record: dict, lat: float, lon: float, radius_m: float) -> bool:
+    # 사전 파싱 이전의 판정: 레코드마다 WKT를 파싱해 각 좌표쌍을 (lon,lat)/(lat,lon) 두 해석으로 모두 검사
+    def numbers(wkt):
+        return [float(n) for n in re.findall(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?", wkt or "")]
+
+    pairs = []
+    if str(record.get("node_type", "")).upper() == "NODE":
+        point = numbers(record.get("node_wkt"))
+        if len(point) >= 2:
+            pairs = [(point[0], point[1])]
+    if not pairs:
+        line = numbers(record.get("lnkg_wkt"))
+        pairs = [(line[i], line[i + 1]) for i in range(0, len(line) - 1, 2)]
+    return any(haversine_m(lat, lon, y, x) <= radius_m or haversine_m(lat, lon, x, y) <= radius_m for x, y in pairs)
+
+
+@pytest.mark.parametrize("axis_order, center, expected_order", [
+    ("lonlat", (37.566406, 126.977822), "lonlat"),
+    ("latlon", (37.566406, 126.977822), "latlon"),
+    ("lonlat", (37.5, 45.0), "both"),  # 두 값 모두 90 이하 → 축 순서 판별 불가
+])
+def test_wkt_dataset_matches_both_orders_check(axis_order, center, expected_order):
+    records = _crosswalk_records(center, axis_order)
+    dataset = WktDataset("crosswalks", records, cell_m=100.0)
+
+    # NOTE 1. 축 순서 판별, 레코드별 버텍스 구간 (NODE 1개 / LINESTRING 3개 / MULTILINESTRING 4개 / 빈 NODE → 선 2개)
+    assert dataset.axis_order == expected_order
+    assert dataset.offsets[:5].tolist() == [0, 1, 4, 8, 10]
+    assert len(dataset.offsets) == len(records) + 1
+
+    # NOTE 2. 반경 조회는 좌표쌍마다 두 해석을 모두 검사하던 기존 판정과 같은 레코드를 원본 순서로 반환
+    rng = np.random.default_rng(1)
+    centers = [(center[0] + dlat, center[1] + dlon) for dlat, dlon in rng.uniform(-0.012, 0.012, (15, 2))]
+    if expected_order == "both":
+        centers += [(lon, lat) for lat, lon in centers[:5]]  # 뒤집힌 해석 쪽에서도 찾는다
+    found = 0
+    for lat, lon in centers:
+        for radius_m in (50.0, 300.0, 1500.0):
+            expected = [record for record in records if _within_radius_both_orders(record, lat, lon, radius_m)]
+            assert dataset.query_radius(lat, lon, radius_m) == expected
+            found += len(expected)
+    assert found
+
+
+def test_drinking_fountains_projection_and_stream(client):
+    params = {"lat": 37.553682418, "lon": 126.983193531, "radius_m": 2000}
+
+    # NOTE 1. 기본 응답은 최소 필드만
+    res = client.get(f"{DATASET_API}/drinkingFountains", params=params)
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert len(data) >= 1
+    assert set(data[0]) == {"cot_conts_id", "cot_conts_name", "lat", "lng"}
+
+    # NOTE 2. fields 지정 / 전체(*)
+    res = client.get(f"{DATASET_API}/drinkingFountains", params={**params, "fields": "cot_conts_name,lat"})
+    assert set(res.json()["data"][0]) == {"cot_conts_name", "lat"}
+    res = client.get(f"{DATASET_API}/drinkingFountains", params={**params, "fields": "*"})
+    assert "cot_addr_full_new" in res.json()["data"][0]
+
+    # NOTE 3. 스트리밍 응답은 일반 응답과 같은 내용
+    res = client.get(f"{DATASET_API}/drinkingFountains", params={**params, "format": "stream"})
+    assert res.status_code == 200
+    assert res.json() == {"code": 200, "message": "음수대 조회 성공", "data": data}
+
+    res = client.get(f"{DATASET_API}/drinkingFountains", params={**params, "format": "ndjson"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    assert len(res.text.splitlines()) == len(data)
+
+
+def test_dataset_registry(client):
+    from app.routers.dataset.dataset_service import DatasetService
+
+    # NOTE 1. 레지스트리(datasets.json)에 등록된 데이터셋
+    service = DatasetService()
+    assert {"drinkingFountains", "crosswalks"} <= set(service.store.names())
+    assert service.resolve_fields("drinkingFountains", None) == list(service.store.config("drinkingFountains").default_fields)
+
+    # NOTE 2. 등록되지 않은 이름은 404 코드
+    res = client.get(f"{DATASET_API}/unknownDataset")
+    assert res.json()["code"] == 404
+
+
+def test_dataset_snapshot(tmp_path):
+    from app.routers.dataset.dataset_service import DatasetService
+    from app.routers.dataset.dataset_snapshot import SnapshotRecords, open_snapshot, write_snapshot
+    from app.routers.dataset.dataset_store import DatasetStore
+
+    # NOTE 1. 스냅샷으로 연 저장소는 JSON에서 만든 저장소와 같은 결과
+    config = DatasetService().store.config("drinkingFountains")
+    version = DatasetStore._version(config.path)
+    built = config.build(config.read())
+    write_snapshot(config, built, version, 250.0, tmp_path / "drinkingFountains.snapshot")
+    restored = open_snapshot(config, version, 250.0, tmp_path / "drinkingFountains.snapshot")
+    assert isinstance(restored.records, SnapshotRecords)
+    assert len(restored) == len(built)
+    for lat, lon in [(37.553682418, 126.983193531), (37.5, 127.03), (33.0, 126.0)]:
+        assert restored.query_radius(lat, lon, 1000) == built.query_radius(lat, lon, 1000)
+
+    # NOTE 2. 원본 버전이나 격자 크기가 다르면 사용하지 않는다.
+    assert open_snapshot(config, (0, 0), 250.0, tmp_path / "drinkingFountains.snapshot") is None
+    assert open_snapshot(config, version, 500.0, tmp_path / "drinkingFountains.snapshot") is None
+
+
+@pytest.fixture()
+def temp_store(tmp_path, monkeypatch):
+    """
+    임시 레지스트리(fountains: point, missing: 파일 없음)를 읽는 DatasetStore. 테스트가 끝나면 싱글턴을 되돌린다.
+    """
+    from app.routers.dataset import dataset_store
+    from app.routers.dataset.dataset_store import DatasetStore
+
+    monkeypatch.setattr(dataset_store, "DATASET_SNAPSHOT_DIR", "")
+    registry = tmp_path / "datasets.json"
+    registry.write_text(json.dumps({"DATASETS": [
+        {"name": "fountains", "path": "fountains.json", "geometry": "point"},
+        {"name": "missing", "path": "missing.json", "geometry": "point"},
+    ]}), encoding="utf-8")
+    _write_records(tmp_path / "fountains.json", 2)
+
+    DatasetStore.reset_instance()
+    yield DatasetStore(registry_path=registry)
+    DatasetStore.reset_instance()
+
+
+def _write_records(path, count: int) -> None:
+    records = [{"id": index, "lat": 37.55 + index * 1e-4, "lng": 126.98} for index in range(count)]
+    path.write_text(json.dumps({"DATA": records}), encoding="utf-8")
+
+
+def test_dataset_refresh_swaps_changed_files(temp_store, tmp_path):
+    # NOTE 1. 최초 로드: 파일이 없는 데이터셋만 빈 데이터셋으로 대체
+    assert len(temp_store.get("fountains")) == 2
+    assert len(temp_store.get("missing")) == 0
+
+    # NOTE 2. 파일이 바뀌면 새 저장소로 교체
+    _write_records(tmp_path / "fountains.json", 3)
+    temp_store.refresh()
+    assert len(temp_store.get("fountains")) == 3
+
+
+def test_dataset_refresh_keeps_data_when_file_is_broken_or_missing(temp_store, tmp_path):
+    path = tmp_path / "fountains.json"
+    previous = temp_store.get("fountains")
+
+    # NOTE 1. 쓰다 만(깨진) 파일 → 기존 저장소 유지, 실패 버전 기록
+    path.write_text('{"DATA": [', encoding="utf-8")
+    temp_store.refresh()
+    assert temp_store.get("fountains") is previous
+    assert "fountains" in temp_store._failed
+
+    # NOTE 2. 파일이 사라져도 빈 데이터셋으로 바꾸지 않는다.
+    path.unlink()
+    temp_store.refresh()
+    assert temp_store.get("fountains") is previous
+    assert temp_store._failed["fountains"] is None
+
+    # NOTE 3. 파일이 다시 생기면 교체하고 실패 기록을 지운다.
+    _write_records(path, 1)
+    temp_store.refresh()
+    assert len(temp_store.get("fountains")) == 1
+    assert "fountains" not in temp_store._failed
+
+
+def test_dataset_refresh_drops_removed_entries(temp_store, tmp_path):
+    temp_store.load_all()
+
+    # NOTE 1. 레지스트리에서 빠진 데이터셋은 제거
+    (tmp_path / "datasets.json").write_text(json.dumps({"DATASETS": [
+        {"name": "fountains", "path": "fountains.json", "geometry": "point"},
+    ]}), encoding="utf-8")
+    temp_store.refresh()
+    assert temp_store.names() == ["fountains"]
+    with pytest.raises(KeyError):
+        temp_store.get("missing")
+    assert len(temp_store.get("fountains")) == 2
+
+
+def test_dataset_tiles(client):
+    # 서울역 부근 z=14 타일
+    tile_api = f"{DATASET_API}/drinkingFountains/tiles/14/13971/6345"
+
+    # NOTE 1. 타일 안 레코드 + ETag / Cache-Control
+    res = client.get(tile_api)
+    assert res.status_code == 200
+    assert res.json()["message"] == "타일 조회 성공"
+    assert len(res.json()["data"]) >= 1
+    assert res.headers["etag"]
+    assert "max-age" in res.headers["cache-control"]
+
+    # NOTE 2. 같은 ETag로 다시 요청하면 304
+    res = client.get(tile_api, headers={"If-None-Match": res.headers["etag"]})
+    assert res.status_code == 304
+
+    # NOTE 3. 범위 밖 타일 좌표
+    res = client.get(f"{DATASET_API}/drinkingFountains/tiles/14/16384/0")
+    assert res.json()["code"] == 400
+
+
+def test_dataset_route_corridor(client):
+    # 선행: 남산 부근을 지나는 경로 + LINESTRING
+    res = client.post("/api/v1/routes", json={
+        "title": f"코리도-{uuid4().hex[:6]}", "description": "경로 주변 조회 테스트",
+        "distance": 3000, "high_height": 100.0, "low_height": 10.0,
+    })
+    route_id = res.json()["data"]["route_id"]
+    line = [[126.980, 37.553], [126.990, 37.548], [126.9979, 37.5416], [127.005, 37.538]]
+    geom = json.dumps({"type": "LineString", "coordinates": line})
+    assert client.post("/api/v1/route-geoms", json={"route_id": route_id, "geom": geom}).status_code == 201
+
+    # NOTE 1. 경로에서 buffer_m 안 레코드만, 경로 진행 순서대로
+    res = client.get(f"{DATASET_API}/drinkingFountains/corridor", params={"route_id": route_id, "buffer_m": 100})
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert len(data) >= 1
+    assert all(item["distance_m"] <= 100 for item in data)
+    assert [item["along_m"] for item in data] == sorted(item["along_m"] for item in data)
+
+    # NOTE 2. 지오메트리가 없는 경로
+    res = client.get(f"{DATASET_API}/drinkingFountains/corridor", params={"route_id": 0})
+    assert res.json()["code"] == 404
+
+    client.delete(f"/api/v1/routes/{route_id}")
+
+
+def test_dataset_nearest(client):
+    lat, lon = 37.553682418, 126.983193531
+
+    # NOTE 1. 가까운 순서로 k개
+    res = client.get(f"{DATASET_API}/drinkingFountains/nearest", params={"lat": lat, "lon": lon, "k": 5})
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert len(data) == 5
+    distances = [item["distance_m"] for item in data]
+    assert distances == sorted(distances)
+    assert abs(distances[0] - haversine_m(lat, lon, float(data[0]["record"]["lat"]), float(data[0]["record"]["lng"]))) < 1e-3
+
+    # NOTE 2. 최대 거리 안에 없으면 빈 목록
+    res = client.get(f"{DATASET_API}/drinkingFountains/nearest", params={"lat": 33.0, "lon": 126.0, "max_distance_m": 500})
+    assert res.json()["data"] == []
+
+
+def test_dataset_postgis_backend(db_session):
+    from app.routers.dataset.dataset_backend import MemoryDatasetBackend, PostgisDatasetBackend
+    from app.routers.dataset.dataset_features_import import feature_rows
+    from app.routers.dataset.dataset_features_repository import DatasetFeaturesRepository
+    from app.routers.dataset.dataset_store import DatasetStore
+
+    store = DatasetStore()
+    memory = MemoryDatasetBackend(store)
+    repository = DatasetFeaturesRepository(db_session)
+    postgis = PostgisDatasetBackend(repository)
+    lat, lon = 37.553682418, 126.983193531
+
+    # NOTE 1. 임포터와 같은 방식으로 적재하면 레코드 수가 같다.
+    dataset = store.get("drinkingFountains")
+    assert repository.replace("drinkingFountains", feature_rows(dataset)) == len(dataset)
+    assert repository.count("drinkingFountains") == len(dataset)
+
+    # NOTE 2. 반경 조회 결과가 메모리 백엔드와 같다. (구면/회전타원체 거리 차이로 경계는 1m 여유를 둔다)
+    def keys(records):
+        return {json.dumps(record, sort_keys=True) for record in records}
+
+    assert keys(memory.radius("drinkingFountains", lat, lon, 999.0)) <= keys(postgis.radius("drinkingFountains", lat, lon, 1000.0))
+    assert keys(postgis.radius("drinkingFountains", lat, lon, 999.0)) <= keys(memory.radius("drinkingFountains", lat, lon, 1000.0))
+
+    # NOTE 3. kNN 순서/거리가 메모리 백엔드와 같다.
+    expected = memory.nearest("drinkingFountains", lat, lon, 5)
+    actual = postgis.nearest("drinkingFountains", lat, lon, 5)
+    assert [record for _, record in actual] == [record for _, record in expected]
+    assert all(abs(a - e) < 5.0 for (a, _), (e, _) in zip(actual, expected))
+
+    # NOTE 4. 경로 주변 조회의 레코드/경로상 위치(m)가 메모리 백엔드와 같다. (두 선, 경계는 1m 여유)
+    lines = [[[lon - 0.006, lat - 0.002], [lon, lat], [lon + 0.004, lat + 0.003]],
+             [[lon + 0.004, lat + 0.003], [lon + 0.008, lat + 0.003]]]
+    assert keys(record for _, _, record in memory.corridor("drinkingFountains", lines, 199.0)) <= \
+           keys(record for _, _, record in postgis.corridor("drinkingFountains", lines, 200.0))
+    assert keys(record for _, _, record in postgis.corridor("drinkingFountains", lines, 199.0)) <= \
+           keys(record for _, _, record in memory.corridor("drinkingFountains", lines, 200.0))
+    expected = {json.dumps(record, sort_keys=True): along for along, _, record in memory.corridor("drinkingFountains", lines, 200.0)}
+    actual = {json.dumps(record, sort_keys=True): along for along, _, record in postgis.corridor("drinkingFountains", lines, 200.0)}
+    assert expected
+    assert all(abs(actual[key] - expected[key]) < 10.0 for key in expected.keys() & actual.keys())
+
+
+def test_memory_backend_does_not_need_postgres():
+    # memory 백엔드와 데이터셋 벤치마크는 POSTGRES_* 설정 없이 import된다. (PostGIS 모듈은 postgis 백엔드를 쓸 때만 import)
+    env = {key: value for key, value in os.environ.items() if not key.startswith("POSTGRES_")}
+    code = (
+        "import sys\n"
+        "import benchmark.dataset_query_benchmark\n"
+        "from app.routers.dataset.dataset_backend import create_dataset_backend\n"
+        "from app.routers.dataset.dataset_store import DatasetStore\n"
+        "assert type(create_dataset_backend(DatasetStore(), backend='memory')).__name__ == 'MemoryDatasetBackend'\n"
+        "assert 'config.database.postgres_database' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,89 @@
+# test/test_embedding_model.py
+import numpy as np
+import pytest
+
+from config.models.embedding_model import EMBEDDINGS_MODEL, EmbeddingModel, onnx_cache_path
+from config.models.embedding_provider import embedding_model
+from config.models.embedding_snapshot import SNAPSHOT_PATTERNS
+
+SAMPLE_TEXTS = [
+    "한강 러닝 코스",
+    "여의도 공원에서 출발해 마포대교를 건너는 평탄한 5km 강변 코스",
+    "남산 순환로 오르막 구간. 초반 2km는 경사가 심하므로 페이스를 낮춰 주세요.",
+    "음수대",
+    "잠실-뚝섬 구간 왕복 10km 코스, 자전거 도로와 분리된 보행로를 따라 달립니다. " * 8,
+]
+
+# fp32 대비 허용하는 최소 코사인 유사도(백엔드별)
+MIN_COSINE = {"int8": 0.98, "onnx": 0.999}
+
+
+def _reference_model() -> EmbeddingModel:
+    # 모듈 싱글턴이 fp32라면 재사용(모델 중복 로딩 방지)
+    return embedding_model if embedding_model.backend == "torch" else EmbeddingModel(backend="torch")
+
+
+def _cosines(a: list[np.ndarray], b: list[np.ndarray]) -> np.ndarray:
+    a = np.stack(a).astype(np.float32)
+    b = np.stack(b).astype(np.float32)
+    return np.sum(a * b, axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+
+
+def test_embedding_keeps_input_order():
+    # 길이별 버킷으로 나뉘어도 입력 순서대로 반환되어야 한다.
+    model = _reference_model()
+    batched = model.embedding(SAMPLE_TEXTS)
+    single = [model.embedding([text])[0] for text in SAMPLE_TEXTS]
+
+    assert len(batched) == len(SAMPLE_TEXTS)
+    assert np.all(_cosines(batched, single) > 0.999)
+
+
+def test_embedding_empty_input():
+    assert _reference_model().embedding([]) == []
+
+
+@pytest.mark.parametrize("backend", ["int8", "onnx"])
+def test_backend_parity(backend):
+    if backend == "onnx":
+        pytest.importorskip("onnxruntime")
+
+    reference = _reference_model().embedding(SAMPLE_TEXTS)
+    candidate = EmbeddingModel(backend=backend).embedding(SAMPLE_TEXTS)
+
+    assert len(candidate) == len(reference)
+    assert _cosines(reference, candidate).min() >= MIN_COSINE[backend]
+
+
+def test_load_from_local_snapshot():
+    from huggingface_hub import snapshot_download
+
+    # NOTE 1. 허브 캐시의 스냅샷 폴더(safetensors/tokenizer만)를 로컬 경로로 지정해 불러온다. (local_files_only라 네트워크 없음)
+    reference = _reference_model()
+    snapshot = snapshot_download(repo_id=EMBEDDINGS_MODEL, allow_patterns=SNAPSHOT_PATTERNS)
+    model = EmbeddingModel(backend="torch", model_path=snapshot)
+
+    # NOTE 2. 초기화 단계별 소요 시간이 모두 기록된다.
+    assert list(model.startup_timings) == ["tokenizer", "weights", "device", "backend"]
+    assert all(seconds >= 0 for seconds in model.startup_timings.values())
+
+    # NOTE 3. 허브에서 불러온 모델과 같은 임베딩
+    assert _cosines(reference.embedding(SAMPLE_TEXTS), model.embedding(SAMPLE_TEXTS)).min() > 0.999
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        EmbeddingModel(backend="tensorrt")
+
+
+def test_onnx_cache_path_is_keyed_by_source_and_revision(tmp_path):
+    path = onnx_cache_path(str(tmp_path), EMBEDDINGS_MODEL, "rev-a")
+
+    # NOTE 1. 같은 모델/리비전이면 같은 경로, 리비전이나 출처가 다르면 다른 폴더
+    assert path == onnx_cache_path(str(tmp_path), EMBEDDINGS_MODEL, "rev-a")
+    assert path.parent != onnx_cache_path(str(tmp_path), EMBEDDINGS_MODEL, "rev-b").parent
+    assert path.parent != onnx_cache_path(str(tmp_path), str(tmp_path / "snapshot"), "rev-a").parent
+
+    # NOTE 2. 폴더 이름은 모델 이름으로 시작하고, 그래프 파일명은 model.onnx
+    assert path.parent.name.startswith("snowflake-arctic-embed-l-v2.0-ko-")
+    assert path.name == "model.onnx"
@@ -0,0 +1,108 @@
+# test/test_embedding_server.py
+import os
+import subprocess
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+from config.models.embedding_client import EmbeddingClient
+from config.models.embedding_server import EmbeddingServer
+
+AUTHKEY = b"test-embedding-authkey"
+
+
+class FakeModel:
+    """
+    "클라이언트:순번" 문장을 [클라이언트, 순번] 벡터로 바꾸고, 호출(배치)마다 문장 수를 기록하는 모델
+    """
+    def __init__(self, error: Exception | None = None):
+        self.calls: list[int] = []
+        self.error = error
+
+    def embedding(self, texts: list[str]) -> list[np.ndarray]:
+        self.calls.append(len(texts))
+        if self.error is not None:
+            raise self.error
+        return [np.array([float(part) for part in text.split(":")]) for text in texts]
+
+
+def _start_server(tmp_path, model: FakeModel, batch_wait_ms: float = 200.0) -> str:
+    address = str(tmp_path / "embedding.sock")
+    server = EmbeddingServer(model, address=address, authkey=AUTHKEY, batch_wait_ms=batch_wait_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return address
+
+
+def test_requests_are_coalesced_and_results_keep_client_order(tmp_path):
+    model = FakeModel()
+    address = _start_server(tmp_path, model)
+    clients, per_client = 8, 5
+
+    # NOTE 1. 클라이언트마다 먼저 접속해 둔 뒤, 동시에 요청한다.
+    connections = [EmbeddingClient(address, authkey=AUTHKEY, connect_timeout=10) for _ in range(clients)]
+    for client in connections:
+        client.embedding(["0:0"])
+    model.calls.clear()
+
+    barrier = threading.Barrier(clients)
+    results: dict[int, list[np.ndarray]] = {}
+
+    def request(index: int):
+        texts = [f"{index}:{n}" for n in range(per_client)]
+        barrier.wait()
+        results[index] = connections[index].embedding(texts)
+
+    threads = [threading.Thread(target=request, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    # NOTE 2. 배치 대기 시간 안에 들어온 요청은 한 번의 모델 호출로 묶인다.
+    assert sum(model.calls) == clients * per_client
+    assert len(model.calls) < clients
+
+    # NOTE 3. 배치로 묶여도 클라이언트는 자기 요청의 결과를 입력 순서대로 받는다.
+    for index in range(clients):
+        assert [vector.tolist() for vector in results[index]] == [[index, n] for n in range(per_client)]
+    for client in connections:
+        client.close()
+
+
+def test_model_error_is_returned_without_dropping_connection(tmp_path):
+    # 모델이 OSError를 내도 연결 종료로 취급하지 않고, 오류 응답을 돌려준 뒤 연결을 유지한다.
+    model = FakeModel(error=OSError("device lost"))
+    address = _start_server(tmp_path, model, batch_wait_ms=1.0)
+    client = EmbeddingClient(address, authkey=AUTHKEY, connect_timeout=10)
+
+    with pytest.raises(RuntimeError, match="device lost"):
+        client.embedding(["1:1"])
+    connection = client._connection()
+
+    model.error = None
+    assert [vector.tolist() for vector in client.embedding(["2:3"])] == [[2, 3]]
+    assert client._connection() is connection
+    client.close()
+
+
+def test_authkey_is_required(tmp_path):
+    address = str(tmp_path / "embedding.sock")
+    with pytest.raises(ValueError):
+        EmbeddingClient(address, authkey=None)
+    with pytest.raises(ValueError):
+        EmbeddingServer(FakeModel(), address=address, authkey="")
+
+
+def test_client_mode_does_not_import_torch(tmp_path):
+    # 서버 주소가 있으면 embedding_provider는 EmbeddingClient만 만들고 torch/transformers를 불러오지 않는다.
+    env = {**os.environ, "EMBEDDING_SERVER_ADDRESS": str(tmp_path / "embedding.sock"), "EMBEDDING_SERVER_AUTHKEY": AUTHKEY.decode()}
+    code = (
+        "import sys\n"
+        "from config.models.embedding_provider import embedding_model\n"
+        "assert embedding_model.backend == 'server'\n"
+        "assert 'torch' not in sys.modules and 'transformers' not in sys.modules, 'model libraries imported'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,503 @@
+# test/test_milvus_database.py
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from pymilvus import MilvusException
+
+from config.database import async_milvus_database, milvus_database
+from config.database.async_milvus_database import AsyncMilvusDatabase
+from config.database.milvus_database import MilvusDatabase, embedding_dim
+from config.database.milvus_partition_residency import PartitionResidencyManager
+
+VECTOR_FIELD = "vector"
+
+
+class FakeMilvusClient:
+    """
+    MilvusClient 대신 호출 인자를 기록하는 클라이언트
+
+    search는 질의 벡터마다 [{"id": 질의 순번, "distance": 벡터 첫 성분}]을 돌려준다.
+    """
+    def __init__(self, dim: int = embedding_dim):
+        self.dim = dim
+        self.calls: list[tuple[str, dict]] = []
+        self.failing_ids: set[int] = set()  # 이 id가 든 insert는 실패한다
+        self.collections: set[str] = set()
+        self.aliases: dict[str, str] = {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def list_partitions(self, collection_name):
+        return ["_default"]
+
+    def get_load_state(self, collection_name, partition_name):
+        return {"state": "NotLoad"}
+
+    def get_partition_stats(self, collection_name, partition_name):
+        return {"row_count": 100}
+
+    def load_partitions(self, collection_name, partition_names):
+        self.calls.append(("load_partitions", {"collection_name": collection_name, "partition_names": partition_names}))
+
+    def release_partitions(self, collection_name, partition_names):
+        self.calls.append(("release_partitions", {"collection_name": collection_name, "partition_names": partition_names}))
+
+    def has_collection(self, collection_name):
+        return collection_name in self.collections or collection_name in self.aliases
+
+    def drop_collection(self, collection_name):
+        self.calls.append(("drop_collection", {"collection_name": collection_name}))
+        self.collections.discard(collection_name)
+
+    def describe_alias(self, alias):
+        if alias not in self.aliases:
+            raise MilvusException(message=f"alias {alias} not found")
+        return {"alias": alias, "collection_name": self.aliases[alias]}
+
+    def create_alias(self, collection_name, alias):
+        assert alias not in self.collections and alias not in self.aliases
+        self.aliases[alias] = collection_name
+
+    def alter_alias(self, collection_name, alias):
+        assert alias in self.aliases
+        self.aliases[alias] = collection_name
+
+    def describe_collection(self, collection_name):
+        self.calls.append(("describe_collection", {"collection_name": collection_name}))
+        return {"fields": [{"name": "id", "params": {}}, {"name": VECTOR_FIELD, "params": {"dim": self.dim}}]}
+
+    def search(self, **kwargs):
+        self.calls.append(("search", kwargs))
+        return [[{"id": index, "distance": float(vector[0]), "entity": {}}] for index, vector in enumerate(kwargs["data"])]
+
+    def search_iterator(self, **kwargs):
+        self.calls.append(("search_iterator", kwargs))
+        self.iterator = FakeSearchIterator(kwargs["batch_size"])
+        return self.iterator
+
+    def insert(self, **kwargs):
+        self.calls.append(("insert", kwargs))
+        if any(row["id"] in self.failing_ids for row in kwargs["data"]):
+            raise ConnectionError("insert rejected")
+        return {"insert_count": len(kwargs["data"])}
+
+    def upsert(self, **kwargs):
+        self.calls.append(("upsert", kwargs))
+        return {"upsert_count": len(kwargs["data"])}
+
+    def last(self, method: str) -> dict:
+        return [kwargs for name, kwargs in self.calls if name == method][-1]
+
+
+class FakeSearchIterator:
+    """
+    batch_size개씩 끝없이 페이지를 돌려주고, 몇 페이지를 읽었는지와 close 여부를 기록하는 iterator
+    """
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.pages = 0
+        self.closed = False
+
+    def next(self) -> list[dict]:
+        start = self.pages * self.batch_size
+        self.pages += 1
+        return [{"id": index, "distance": 1.0} for index in range(start, start + self.batch_size)]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def fake_client(monkeypatch):
+    """
+    MilvusDatabase 싱글턴이 FakeMilvusClient를 쓰도록 바꾸고, 테스트가 끝나면 되돌린다.
+    """
+    client = FakeMilvusClient()
+    monkeypatch.setattr(MilvusDatabase, "_instance", None)
+    monkeypatch.setattr(MilvusDatabase, "_MilvusDatabase__connection", None, raising=False)
+    monkeypatch.setattr(MilvusDatabase, "_init_connection", staticmethod(lambda: client))
+    return client
+
+
+class FakeEmbeddingModel:
+    """
+    "text-<n>" 문장을 n으로 채운 벡터로 바꾸는 모델 ("fail"이 든 배치는 실패)
+    """
+    def embedding(self, texts: list[str]) -> list[np.ndarray]:
+        if any("fail" in text for text in texts):
+            raise RuntimeError("embedding failed")
+        return [_vector(float(text.split("-")[1])) for text in texts]
+
+
+def _vector(value: float = 1.0) -> np.ndarray:
+    return np.full(embedding_dim, value, dtype=np.float32)
+
+
+def test_projection_follows_collection_schema(fake_client):
+    database = MilvusDatabase()
+
+    # NOTE 1. 스키마 dim이 임베딩 차원과 같으면 투영하지 않는다.
+    assert database.projection("full", VECTOR_FIELD) is None
+
+    # NOTE 2. 스키마 dim이 더 작으면 절단 투영을 쓰고, 스키마는 콜렉션별로 한 번만 조회한다.
+    fake_client.dim = 8
+    projection = database.projection("small", VECTOR_FIELD)
+    assert projection.dim == 8
+    database.projection("small", VECTOR_FIELD)
+    assert [kwargs["collection_name"] for name, kwargs in fake_client.calls if name == "describe_collection"] == ["full", "small"]
+
+
+def test_projection_is_applied_on_query_and_write_paths(fake_client):
+    fake_client.dim = 8
+    database = MilvusDatabase()
+
+    database.search("small", VECTOR_FIELD, _vector())
+    assert [len(vector) for vector in fake_client.last("search")["data"]] == [8]
+
+    database.search_batch("small", VECTOR_FIELD, [_vector(), _vector()], batch_size=1)
+    assert [len(vector) for vector in fake_client.last("search")["data"]] == [8]
+
+    database.upsert("small", "_default", {"id": 1, VECTOR_FIELD: _vector()})
+    assert len(fake_client.last("upsert")["data"][VECTOR_FIELD]) == 8
+
+    database.insert("small", "_default", [{"id": 1, VECTOR_FIELD: _vector()}, {"id": 2, VECTOR_FIELD: _vector()}])
+    rows = fake_client.last("insert")["data"]
+    assert [row["id"] for row in rows] == [1, 2]
+    assert all(len(row[VECTOR_FIELD]) == 8 for row in rows)
+    # 투영 후 다시 정규화되어 코사인 유사도를 그대로 쓸 수 있다.
+    assert np.linalg.norm(np.asarray(rows[0][VECTOR_FIELD], dtype=np.float32)) == pytest.approx(1.0, abs=1e-2)
+
+
+def test_switch_alias_replaces_legacy_collection_then_alters(fake_client):
+    fake_client.collections = {"route_search", "route_search_1", "route_search_2"}
+    database = MilvusDatabase()
+
+    # NOTE 1. 별칭 도입 전의 실제 콜렉션은 최초 1회 삭제하고 별칭을 만든다.
+    assert database.switch_alias("route_search", "route_search_1") is None
+    assert ("drop_collection", {"collection_name": "route_search"}) in fake_client.calls
+    assert database.alias_target("route_search") == "route_search_1"
+
+    # NOTE 2. 이후에는 별칭만 바꾸고, 이전 콜렉션 명을 돌려준다 (삭제는 호출자가 결정).
+    assert database.switch_alias("route_search", "route_search_2") == "route_search_1"
+    assert database.alias_target("route_search") == "route_search_2"
+    assert "route_search_1" in fake_client.collections
+
+
+def _records(count: int) -> list[dict]:
+    return [{"id": index, "text": f"text-{index}"} for index in range(count)]
+
+
+def test_bulk_insert_splits_chunks_and_keeps_order(fake_client, monkeypatch):
+    monkeypatch.setattr(milvus_database, "embedding_model", FakeEmbeddingModel())
+    database = MilvusDatabase()
+
+    # NOTE 1. 7건을 3건씩 → 3, 3, 1 (generator 입력)
+    reports = database.bulk_insert("docs", "_default", iter(_records(7)), "text", VECTOR_FIELD, chunk_size=3)
+
+    assert [(report.index, report.count, report.inserted, report.error) for report in reports] == \
+           [(0, 3, 3, None), (1, 3, 3, None), (2, 1, 1, None)]
+    inserts = [kwargs["data"] for name, kwargs in fake_client.calls if name == "insert"]
+    assert [[row["id"] for row in rows] for rows in inserts] == [[0, 1, 2], [3, 4, 5], [6]]
+    # 벡터가 자기 레코드에 붙는다.
+    assert all(float(row[VECTOR_FIELD][0]) == row["id"] for rows in inserts for row in rows)
+
+    # NOTE 2. 청크 크기로 나누어떨어지면 빈 청크를 만들지 않는다.
+    assert [report.count for report in database.bulk_insert("docs", "_default", _records(6), "text", VECTOR_FIELD, chunk_size=3)] == [3, 3]
+    assert database.bulk_insert("docs", "_default", [], "text", VECTOR_FIELD, chunk_size=3) == []
+
+
+def test_bulk_insert_reports_failed_chunks_and_continues(fake_client, monkeypatch):
+    monkeypatch.setattr(milvus_database, "embedding_model", FakeEmbeddingModel())
+    fake_client.failing_ids = {4}
+    records = _records(12)
+    records[7]["text"] = "fail-7"
+    database = MilvusDatabase()
+
+    reports = database.bulk_insert("docs", "_default", records, "text", VECTOR_FIELD, chunk_size=3)
+
+    # NOTE 1. 청크 1은 insert, 청크 2는 임베딩에서 실패하고, 나머지 청크는 그대로 저장된다.
+    assert [report.inserted for report in reports] == [3, 0, 0, 3]
+    assert reports[0].error is None and reports[3].error is None
+    assert reports[1].error.startswith("insert:")
+    assert reports[2].error.startswith("embedding:")
+    inserted = [row["id"] for name, kwargs in fake_client.calls if name == "insert" for row in kwargs["data"]]
+    assert inserted == [0, 1, 2, 3, 4, 5, 9, 10, 11]  # 임베딩에 실패한 청크는 insert를 시도하지 않는다.
+
+
+def test_search_limit_is_clamped(fake_client, monkeypatch):
+    monkeypatch.setattr(milvus_database, "MILVUS_SEARCH_MAX_LIMIT", 50)
+    database = MilvusDatabase()
+
+    database.search("docs", VECTOR_FIELD, _vector(), limit=10)
+    assert fake_client.last("search")["limit"] == 10
+
+    database.search("docs", VECTOR_FIELD, _vector(), limit=10_000)
+    assert fake_client.last("search")["limit"] == 50
+
+
+def test_partitioned_search_goes_through_residency(fake_client, monkeypatch):
+    monkeypatch.setattr(milvus_database, "MILVUS_PARTITION_RESIDENCY", True)
+    database = MilvusDatabase()
+
+    database.search("docs", VECTOR_FIELD, _vector(), partition_names=["a"])
+    database.search_batch("docs", VECTOR_FIELD, [_vector()] * 3, partition_names=["a"], batch_size=1)
+    database.search("docs", VECTOR_FIELD, _vector())
+
+    # NOTE 1. 파티션을 지정한 검색만 콜렉션의 PartitionResidencyManager를 거치며, 파티션은 한 번만 불러온다.
+    manager = database.residency("docs")
+    assert manager is database.residency("docs")
+    assert [kwargs["partition_names"] for name, kwargs in fake_client.calls if name == "load_partitions"] == [["a"]]
+
+    # NOTE 2. search_batch는 배치 수와 관계없이 한 번의 사용으로 기록된다.
+    assert manager.stats()["hits"] == {"a": 2}
+    assert len([name for name, _ in fake_client.calls if name == "search"]) == 5
+
+
+def test_search_batch_keeps_input_order(fake_client):
+    database = MilvusDatabase()
+    queries = [_vector(float(index)) for index in range(7)]
+
+    results = database.search_batch("docs", VECTOR_FIELD, queries, batch_size=3)
+
+    # NOTE 1. 3, 3, 1개씩 나누어 요청하고, 결과는 입력 순서대로 이어 붙인다.
+    assert [len(kwargs["data"]) for name, kwargs in fake_client.calls if name == "search"] == [3, 3, 1]
+    assert [hits[0]["distance"] for hits in results] == [float(index) for index in range(7)]
+
+
+def test_search_iterator_is_closed_on_early_exit(fake_client):
+    database = MilvusDatabase()
+
+    pages = []
+    for page in database.search_iterator("docs", VECTOR_FIELD, _vector(), batch_size=4):
+        pages.append(page)
+        if len(pages) == 2:
+            break
+
+    # NOTE 1. 필요한 2페이지만 조회하고, 루프를 빠져나오면 서버 측 iterator를 닫는다.
+    assert [[hit["id"] for hit in page] for page in pages] == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert fake_client.iterator.pages == 2
+    assert fake_client.iterator.closed
+
+
+class FakeAsyncMilvusClient:
+    """
+    AsyncMilvusClient 대신 FakeMilvusClient로 응답하면서, 동시에 진행 중인 요청 수의 최댓값을 기록하는 클라이언트
+    """
+    def __init__(self, client: FakeMilvusClient):
+        self.client = client
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __getattr__(self, method: str):
+        async def call(**kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return getattr(self.client, method)(**kwargs)
+        return call
+
+
+@pytest.fixture()
+def fake_async_client(fake_client, monkeypatch):
+    client = FakeAsyncMilvusClient(fake_client)
+    monkeypatch.setattr(AsyncMilvusDatabase, "_instance", None)
+    monkeypatch.setattr(AsyncMilvusDatabase, "_init_connection", staticmethod(lambda: client))
+    return client
+
+
+def test_async_semaphore_is_bound_to_each_event_loop(fake_async_client, monkeypatch):
+    monkeypatch.setattr(async_milvus_database, "MILVUS_MAX_CONCURRENCY", 2)
+    database = AsyncMilvusDatabase()
+    queries = [_vector(float(index)) for index in range(6)]
+
+    async def run():
+        semaphore = database._limit()
+        results = await database.search_batch("docs", VECTOR_FIELD, queries, batch_size=1)
+        return semaphore, results
+
+    # NOTE 1. 요청은 동시에 보내지만 MILVUS_MAX_CONCURRENCY개까지만 진행되고, 결과는 입력 순서를 지킨다.
+    first, results = asyncio.run(run())
+    assert fake_async_client.max_in_flight == 2
+    assert [hits[0]["distance"] for hits in results] == [float(index) for index in range(6)]
+
+    # NOTE 2. 다른 이벤트 루프에서는 새 세마포를 쓴다 (이전 루프의 세마포를 공유하지 않는다).
+    second, _ = asyncio.run(run())
+    assert second is not first
+
+
+def test_async_connection_of_closed_loop_is_closed(monkeypatch):
+    clients: list[FakeAsyncMilvusClient] = []
+
+    def connect():
+        clients.append(FakeAsyncMilvusClient(FakeMilvusClient()))
+        return clients[-1]
+
+    monkeypatch.setattr(AsyncMilvusDatabase, "_instance", None)
+    monkeypatch.setattr(AsyncMilvusDatabase, "_init_connection", staticmethod(connect))
+    database = AsyncMilvusDatabase()
+
+    # NOTE 1. 루프마다 Connection을 만들고, list_partitions도 코루틴으로 제공한다.
+    assert asyncio.run(database.list_partitions("docs")) == ["_default"]
+    assert asyncio.run(database.list_partitions("docs")) == ["_default"]
+    assert len(clients) == 2
+
+    # NOTE 2. 새 루프에서 Connection을 만들 때, 닫힌 이전 루프의 Connection은 버리지 않고 close한다.
+    assert clients[0].client.closed
+    assert not clients[1].client.closed
+
+
+def test_async_bulk_insert_and_upsert(fake_async_client, fake_client, monkeypatch):
+    monkeypatch.setattr(milvus_database, "embedding_model", FakeEmbeddingModel())
+    monkeypatch.setattr(async_milvus_database, "embedding_model", FakeEmbeddingModel())
+    fake_client.dim = 8
+    database = AsyncMilvusDatabase()
+
+    async def run():
+        reports = await database.bulk_insert("docs", "_default", iter(_records(5)), "text", VECTOR_FIELD, chunk_size=2)
+        await database.upsert("docs", "_default", {"id": 9, VECTOR_FIELD: _vector()})
+        return reports
+
+    reports = asyncio.run(run())
+
+    assert [(report.count, report.inserted, report.error) for report in reports] == [(2, 2, None), (2, 2, None), (1, 1, None)]
+    inserts = [kwargs["data"] for name, kwargs in fake_client.calls if name == "insert"]
+    assert [[row["id"] for row in rows] for rows in inserts] == [[0, 1], [2, 3], [4]]
+    assert all(len(row[VECTOR_FIELD]) == 8 for rows in inserts for row in rows)
+    assert len(fake_client.last("upsert")["data"][VECTOR_FIELD]) == 8
+
+
+def test_async_search_iterator_is_closed_on_early_exit(fake_async_client, fake_client):
+    database = AsyncMilvusDatabase()
+
+    async def run():
+        pages = []
+        iterator = database.search_iterator("docs", VECTOR_FIELD, _vector(), batch_size=4)
+        async for page in iterator:
+            pages.append(page)
+            if len(pages) == 2:
+                break
+        await iterator.aclose()
+        return pages
+
+    pages = asyncio.run(run())
+
+    assert [len(page) for page in pages] == [4, 4]
+    assert fake_client.iterator.pages == 2
+    assert fake_client.iterator.closed
+
+
+class FakePartitionDatabase:
+    """
+    파티션마다 100건이 있고, load/release 호출을 기록하는 MilvusDatabase 대역
+
+    blocked 파티션의 load는 unblock이 set될 때까지 멈춘다.
+    """
+    def __init__(self, loaded: list[str] | None = None):
+        self.loaded: set[str] = set(loaded or [])
+        self.calls: list[tuple[str, list[str]]] = []
+        self.blocked: set[str] = set()
+        self.unblock = threading.Event()
+
+    def list_partitions(self, collection_name):
+        return ["_default", "a", "b", "c", "d"]
+
+    def get_load_state(self, collection_name, partition_name):
+        return {"state": "Loaded" if partition_name in self.loaded else "NotLoad"}
+
+    def get_partition_stats(self, collection_name, partition_name):
+        return {"row_count": 100}
+
+    def load_partitions(self, collection_name, partition_names):
+        self.calls.append(("load", list(partition_names)))
+        if self.blocked & set(partition_names):
+            self.unblock.wait(timeout=5)
+        self.loaded.update(partition_names)
+
+    def release_partitions(self, collection_name, partition_names):
+        self.calls.append(("release", list(partition_names)))
+        self.loaded.difference_update(partition_names)
+
+
+def _residency(database: FakePartitionDatabase, budget: int) -> PartitionResidencyManager:
+    return PartitionResidencyManager("docs", memory_budget=budget, bytes_per_row=1, database=database)
+
+
+def test_residency_evicts_least_recently_used_within_budget():
+    database = FakePartitionDatabase()
+    manager = _residency(database, budget=250)  # 파티션 2개(200 bytes)까지
+
+    for partition_names in (["a"], ["b"], ["a"], ["c"]):
+        with manager.use(partition_names):
+            pass
+
+    # NOTE 1. a를 다시 썼으므로 가장 오래 안 쓴 b가 해제된다.
+    assert manager.stats()["resident"] == ["a", "c"]
+    assert manager.stats()["used"] == 200
+    assert database.calls == [("load", ["a"]), ("load", ["b"]), ("load", ["c"]), ("release", ["b"])]
+    assert database.loaded == {"a", "c"}
+
+
+def test_residency_never_evicts_pinned_partitions():
+    database = FakePartitionDatabase()
+    manager = _residency(database, budget=150)  # 파티션 1개(100 bytes)까지
+
+    with manager.use(["a"]):
+        with manager.use(["b"]):
+            # NOTE 1. a, b 모두 사용 중이면 예산을 넘어도 해제하지 않는다.
+            assert database.loaded == {"a", "b"}
+        with manager.use(["c"]):
+            # NOTE 2. b는 사용이 끝났으므로 해제되고, 사용 중인 a는 남는다.
+            assert database.loaded == {"a", "c"}
+
+    # NOTE 3. c의 사용이 끝나면 사용 중인 a 대신 c를 해제한다. a는 한 번도 해제되지 않는다.
+    assert database.loaded == {"a"}
+    assert [call for call in database.calls if call[0] == "release"] == [("release", ["b"]), ("release", ["c"])]
+
+
+def test_residency_seeds_already_loaded_partitions():
+    database = FakePartitionDatabase(loaded=["_default", "a", "b"])
+
+    manager = _residency(database, budget=250)
+
+    # NOTE 1. 생성 시 이미 불러와진 파티션을 반영하고, 예산을 넘는 몫은 해제한다.
+    assert manager.stats()["resident"] == ["a", "b"]
+    assert database.calls == [("release", ["_default"])]
+
+    with manager.use(["a"]):
+        pass
+    assert ("load", ["a"]) not in database.calls
+
+
+def test_residency_loads_outside_the_lock():
+    database = FakePartitionDatabase()
+    database.blocked = {"a"}
+    manager = _residency(database, budget=1000)
+    waiter_done = threading.Event()
+
+    def use(partition_names, done=None):
+        with manager.use(partition_names):
+            pass
+        if done:
+            done.set()
+
+    slow = threading.Thread(target=use, args=(["a"],))
+    slow.start()
+    waiter = threading.Thread(target=use, args=(["a"], waiter_done))
+    waiter.start()
+
+    # NOTE 1. a를 불러오는 동안에도 다른 파티션 검색은 진행된다.
+    use(["b"])
+    assert manager.stats()["resident"] == ["b"]
+
+    # NOTE 2. 같은 파티션을 쓰려는 검색은 불러오기가 끝날 때까지 기다리고, 다시 불러오지 않는다.
+    assert not waiter_done.wait(timeout=0.1)
+    database.unblock.set()
+    slow.join(timeout=5)
+    waiter.join(timeout=5)
+    assert waiter_done.is_set()
+    assert [call for call in database.calls if call == ("load", ["a"])] == [("load", ["a"])]
@@ -0,0 +1,104 @@
+# test/test_places.py
+import pytest
+
+from app.internal.exception.controlled_exception import ControlledException
+from app.internal.exception.errorcode import dataset_error_code
+from app.routers.dataset.places_repository import PlacesRepository
+from app.routers.dataset.places_service import PlacesService
+from app.utils.radius_filter import haversine_m
+
+DATASET_API = "/api/v1/dataset"
+LAT, LON = 37.553682418, 126.983193531
+
+
+class FakeMilvusDatabase:
+    """
+    places 콜렉션 대신 후보 장소를 유사도 순으로 들고 있는 MilvusDatabase 대역
+
+    search는 필터를 무시하고 앞에서부터 limit건을 돌려주며, 요청한 limit/filter를 기록한다.
+    """
+    def __init__(self, places: list[tuple[float, float]]):
+        self.places = places
+        self.requests: list[dict] = []
+
+    def search(self, **kwargs):
+        self.requests.append(kwargs)
+        return [[
+            {"id": index, "distance": 1.0 - index / 1000, "entity": {"lat": lat, "lng": lng, "kind": "drinkingFountains", "payload": {}}}
+            for index, (lat, lng) in enumerate(self.places[:kwargs["limit"]])
+        ]]
+
+
+def _places(inside: int, outside: int, outside_first: bool = True) -> list[tuple[float, float]]:
+    # 반경(1000m) 안: 기준점 근처 / 밖: 사각형 모서리 근처(약 1.2km)
+    near = [(LAT + 0.001, LON)] * inside
+    corner = [(LAT + 0.008, LON + 0.01)] * outside
+    return corner + near if outside_first else near + corner
+
+
+def test_repository_search_refetches_until_limit_is_met():
+    database = FakeMilvusDatabase(_places(inside=10, outside=30))
+    repository = PlacesRepository(database)
+
+    hits = repository.search([0.0], LAT, LON, 1000.0, limit=5, kind="drinkingFountains")
+
+    # NOTE 1. 상위 후보가 모두 모서리(반경 밖)라 조회 건수를 늘려가며 limit건을 채운다.
+    assert len(hits) == 5
+    assert all(hit["distance_m"] <= 1000.0 for hit in hits)
+    assert [request["limit"] for request in database.requests] == [10, 20, 40]
+
+    # NOTE 2. 필터는 kind와 위경도 사각형
+    assert database.requests[0]["filter"].startswith('kind == "drinkingFountains" and lat >= ')
+    assert {"lat", "lng"} <= set(database.requests[0]["output_fields"])
+
+
+def test_repository_search_stops_when_candidates_run_out():
+    database = FakeMilvusDatabase(_places(inside=3, outside=4))
+    repository = PlacesRepository(database)
+
+    hits = repository.search([0.0], LAT, LON, 1000.0, limit=5)
+
+    # NOTE 1. 사각형 안 후보(7건)가 요청 수(10건)보다 적으면 다시 조회하지 않는다.
+    assert len(hits) == 3
+    assert [request["limit"] for request in database.requests] == [10]
+    assert not database.requests[0]["filter"].startswith("kind")
+
+
+def test_service_rejects_unknown_kind():
+    class UnusedRepository:
+        def embedding(self, texts):
+            raise AssertionError("kind 검증 전에 Milvus/임베딩을 호출하면 안 된다.")
+
+    service = PlacesService(dataset_service=None, places_repository=UnusedRepository())
+
+    with pytest.raises(ControlledException) as e:
+        service.search("음수대", LAT, LON, kind='drinkingFountains" or kind != "')
+    assert e.value.error_code == dataset_error_code.UNKNOWN_PLACE_KIND
+
+
+def test_search_places_unknown_kind(client):
+    res = client.get(f"{DATASET_API}/places/search", params={"query": "음수대", "kind": "notAKind"})
+    assert res.status_code == 400
+    assert res.json()["code"] == 400
+    assert res.json()["message"] == dataset_error_code.UNKNOWN_PLACE_KIND.message
+
+
+def test_index_and_search_places(client):
+    # NOTE 1. 데이터셋 색인
+    res = client.post(f"{DATASET_API}/places/index")
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert data["indexed"] >= 1
+    assert data["failed_chunks"] == []
+    assert data["published"] is True
+
+    # NOTE 2. 반경 안의 장소만, 유사도 내림차순으로 최대 limit건
+    params = {"query": "음수대", "lat": LAT, "lon": LON, "radius_m": 1000, "limit": 5, "kind": "drinkingFountains"}
+    res = client.get(f"{DATASET_API}/places/search", params=params)
+    assert res.status_code == 200
+    assert res.json()["message"] == "장소 검색 성공"
+    hits = res.json()["data"]
+    assert 1 <= len(hits) <= 5
+    assert all(hit["kind"] == "drinkingFountains" for hit in hits)
+    assert all(haversine_m(LAT, LON, float(hit["lat"]), float(hit["lng"])) <= 1000 for hit in hits)
+    assert [hit["score"] for hit in hits] == sorted((hit["score"] for hit in hits), reverse=True)
@@ -0,0 +1,88 @@
+# test/test_radius_filter.py
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.utils.radius_filter import coordinates, radius_filter, radius_indices
+from benchmark.radius_filter_benchmark import make_objects, radius_filter_loop
+
+
+def _around(lat: float, lon: float, count: int, spread: float, seed: int) -> list[tuple[float, float]]:
+    # 기준점 주변 무작위 좌표 (경도는 -180~180으로 정규화, 위도는 ±90 안으로 자름)
+    rng = np.random.default_rng(seed)
+    lats = np.clip(lat + rng.uniform(-spread, spread, count), -90.0, 90.0)
+    lons = (lon + rng.uniform(-spread, spread, count) + 180.0) % 360.0 - 180.0
+    return list(zip(lats.tolist(), lons.tolist()))
+
+
+def _mixed_objects(points: list[tuple[float, float]]) -> list:
+    # 같은 좌표를 dict(문자열/숫자), 속성 객체, 좌표 없음/변환 불가 값으로 섞는다.
+    objects = []
+    for index, (lat, lon) in enumerate(points):
+        kind = index % 6
+        if kind == 0:
+            objects.append({"lat": f"{lat:.9f}", "lng": f"{lon:.9f}"})
+        elif kind == 1:
+            objects.append({"lat": lat, "lng": lon})
+        elif kind == 2:
+            objects.append(SimpleNamespace(lat=lat, lng=lon))
+        elif kind == 3:
+            objects.append({"lat": None, "lng": lon})
+        elif kind == 4:
+            objects.append({"lat": "not-a-number", "lng": lon})
+        else:
+            objects.append(SimpleNamespace(lat=lat))  # lng 속성 없음
+    return objects + [None, {}]
+
+
+# (기준 위도, 기준 경도, 반경, 좌표 분포 폭)
+CASES = {
+    "seoul": (37.55, 126.98, 500.0, 0.02),
+    "antimeridian": (10.0, 179.999, 2000.0, 0.05),
+    "near_pole": (89.995, 45.0, 1500.0, 0.02),
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_radius_filter_matches_loop_on_mixed_inputs(case):
+    lat, lon, radius, spread = CASES[case]
+    objects = _mixed_objects(_around(lat, lon, 600, spread, seed=len(case)))
+
+    expected = radius_filter_loop(objects, lat, lon, radius)
+
+    # NOTE 1. 문자열/None/변환 불가 값/속성 객체가 섞여도 기존 반복문과 같은 객체를 같은 순서로 반환한다.
+    assert expected
+    assert [id(obj) for obj in radius_filter(objects, lat, lon, radius)] == [id(obj) for obj in expected]
+
+    # NOTE 2. coordinates + radius_indices를 직접 써도 결과가 같다.
+    indices, lats, lons = coordinates(objects)
+    assert [id(objects[i]) for i in indices[radius_indices(lats, lons, lat, lon, radius)]] == [id(obj) for obj in expected]
+
+
+def test_antimeridian_points_on_both_sides_are_found():
+    objects = [{"lat": 0.0, "lng": 179.999}, {"lat": 0.0, "lng": -179.999}, {"lat": 0.0, "lng": 0.0}]
+
+    # NOTE 1. 날짜변경선 너머(약 222m)의 점도 반경 안으로 판정한다.
+    assert radius_filter(objects, 0.0, 179.9995, 500.0) == objects[:2]
+    assert radius_filter(objects, 0.0, -179.9995, 500.0) == objects[:2]
+
+
+def test_near_pole_points_at_any_longitude_are_found():
+    objects = [{"lat": 89.999, "lng": lon} for lon in (-170.0, -60.0, 0.0, 90.0, 179.0)]
+
+    # NOTE 1. 극 근처에서는 경도가 달라도 가까우므로 모두 반경(약 111m x 2) 안이다.
+    assert radius_filter(objects, 89.999, 10.0, 250.0) == objects
+    assert radius_filter(objects, 89.999, 10.0, 250.0) == radius_filter_loop(objects, 89.999, 10.0, 250.0)
+
+
+def test_coordinates_fast_path_matches_object_path():
+    objects = make_objects(200)
+    indices, lats, lons = coordinates(objects)
+
+    # NOTE 1. 전부 dict인 빠른 경로와 객체별 경로(속성 객체 섞임)의 좌표가 같다.
+    slow_indices, slow_lats, slow_lons = coordinates(objects + [SimpleNamespace(lat="1.0", lng="2.0")])
+    np.testing.assert_array_equal(slow_indices[:-1], indices)
+    np.testing.assert_array_equal(slow_lats[:-1], lats)
+    np.testing.assert_array_equal(slow_lons[:-1], lons)
+    assert (slow_lats[-1], slow_lons[-1]) == (1.0, 2.0)
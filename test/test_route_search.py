@@ -0,0 +1,82 @@
+# test/test_route_search.py
+from uuid import uuid4
+
+import pytest
+
+from app.internal.exception.controlled_exception import ControlledException
+from app.internal.exception.errorcode import route_search_error_code
+from app.routers.route_search.route_search_dto import RouteSearchQuery
+from app.routers.route_search.route_search_service import RouteSearchService
+
+ROUTES_API = "/api/v1/routes"
+ROUTE_SEARCH_API = "/api/v1/route-search"
+
+
+def _mk_route_payload(title: str, distance: int):
+    return {
+        "title": title,
+        "description": f"테스트 경로 설명-{uuid4().hex[:6]}",
+        "distance": distance,
+        "high_height": 30.0,
+        "low_height": 5.0,
+    }
+
+
+def test_index_and_search_route(client):
+    # NOTE 1. 경로 생성 후 색인
+    salt = uuid4().hex[:6]
+    res = client.post(ROUTES_API, json=_mk_route_payload(f"여의도 한강공원 강변 코스-{salt}", 5000))
+    assert res.status_code == 201
+    route_id = res.json()["data"]["route_id"]
+
+    res = client.post(f"{ROUTE_SEARCH_API}/index")
+    assert res.status_code == 200
+    assert res.json()["data"]["indexed"] >= 1
+    assert res.json()["data"]["failed_chunks"] == []
+    assert res.json()["data"]["published"] is True
+
+    # NOTE 2. 검색 (거리 필터 포함)
+    res = client.get(ROUTE_SEARCH_API, params={"query": f"여의도 강변 코스-{salt}", "min_distance": 4000, "max_distance": 6000})
+    assert res.status_code == 200
+    body = res.json()
+    assert body["message"] == "경로 검색 성공"
+    hits = body["data"]
+    assert any(hit["route_id"] == route_id for hit in hits)
+    assert all(4000 <= hit["distance"] <= 6000 for hit in hits)
+    assert [hit["score"] for hit in hits] == sorted((hit["score"] for hit in hits), reverse=True)
+
+    # NOTE 3. 필터에 걸리면 결과에서 제외
+    res = client.get(ROUTE_SEARCH_API, params={"query": f"여의도 강변 코스-{salt}", "min_distance": 6000})
+    if res.status_code == 200:
+        assert all(hit["route_id"] != route_id for hit in res.json()["data"])
+
+    # NOTE 4. 재색인은 새 콜렉션으로 교체하므로, 다시 색인해도 검색 결과가 유지된다.
+    res = client.post(f"{ROUTE_SEARCH_API}/index")
+    assert res.status_code == 200
+    res = client.get(ROUTE_SEARCH_API, params={"query": f"여의도 강변 코스-{salt}", "min_distance": 4000, "max_distance": 6000})
+    assert any(hit["route_id"] == route_id for hit in res.json()["data"])
+
+
+def test_search_invalid_range(client):
+    res = client.get(ROUTE_SEARCH_API, params={"query": "강변", "min_distance": 6000, "max_distance": 1000})
+    assert res.status_code == 400
+    body = res.json()
+    assert body["code"] == 404
+    assert body["message"] == "검색 범위의 최솟값이 최댓값보다 큽니다."
+
+
+def test_search_before_first_index():
+    class UnindexedRepository:
+        def is_indexed(self):
+            return False
+
+        def embedding(self, texts):
+            raise AssertionError("색인이 없으면 임베딩/검색을 호출하면 안 된다.")
+
+    service = RouteSearchService(database=None, routes_repository=None, sections_repository=None,
+                                 route_search_repository=UnindexedRepository())
+
+    # NOTE 1. 별칭이 아직 없으면 Milvus 오류 대신 색인이 없다는 ControlledException
+    with pytest.raises(ControlledException) as e:
+        service.search(RouteSearchQuery(query="강변"))
+    assert e.value.error_code == route_search_error_code.ROUTE_SEARCH_INDEX_NOT_BUILT
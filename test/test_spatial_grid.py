@@ -0,0 +1,96 @@
+# test/test_spatial_grid.py
+import numpy as np
+import pytest
+
+from app.utils.radius_filter import haversine_m_array
+from app.utils.spatial_grid import SpatialGrid
+
+CELL_M = 250.0
+
+
+def _points(count: int = 3000, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    # 서울 일대 무작위 점 + 격자 경계(격자 크기의 정수배)에 정확히 놓인 점
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(37.50, 37.60, count)
+    lng = rng.uniform(126.95, 127.05, count)
+
+    grid = SpatialGrid(lat, lng, CELL_M)
+    rows = np.arange(np.ceil(37.50 / grid._cell_lat), np.floor(37.60 / grid._cell_lat))[:20] * grid._cell_lat
+    cols = np.arange(np.ceil(126.95 / grid._cell_lng), np.floor(127.05 / grid._cell_lng))[:20] * grid._cell_lng
+    edge_lat, edge_lng = np.meshgrid(rows, cols)
+    return np.concatenate([lat, edge_lat.ravel()]), np.concatenate([lng, edge_lng.ravel()])
+
+
+def _brute_radius(lat: np.ndarray, lng: np.ndarray, center_lat: float, center_lon: float, radius_m: float) -> np.ndarray:
+    return np.flatnonzero(haversine_m_array(center_lat, center_lon, lat, lng) <= radius_m)
+
+
+def _brute_box(lat: np.ndarray, lng: np.ndarray, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> np.ndarray:
+    return np.flatnonzero((lat >= min_lat) & (lat < max_lat) & (lng >= min_lon) & (lng < max_lon))
+
+
+@pytest.mark.parametrize("radius_m", [30.0, 120.0, CELL_M, 800.0, 5000.0])
+def test_query_matches_brute_force(radius_m):
+    lat, lng = _points()
+    grid = SpatialGrid(lat, lng, CELL_M)
+
+    # NOTE 1. 무작위 중심 + 격자 경계 위의 점을 중심으로 조회 (격자보다 작은 반경 포함)
+    rng = np.random.default_rng(1)
+    centers = list(zip(rng.uniform(37.50, 37.60, 30), rng.uniform(126.95, 127.05, 30)))
+    centers += list(zip(lat[-40:], lng[-40:]))
+
+    for center_lat, center_lon in centers:
+        expected = _brute_radius(lat, lng, center_lat, center_lon, radius_m)
+        np.testing.assert_array_equal(grid.query(center_lat, center_lon, radius_m), expected)
+
+
+def test_query_box_is_half_open():
+    lat, lng = _points()
+    grid = SpatialGrid(lat, lng, CELL_M)
+
+    # NOTE 1. 경계에 점이 놓인 사각형: min 쪽은 포함, max 쪽은 제외
+    edge_lat, edge_lng = float(lat[-1]), float(lng[-1])
+    box = (edge_lat - 0.01, edge_lat, edge_lng - 0.01, edge_lng)
+    result = grid.query_box(*box)
+    np.testing.assert_array_equal(result, _brute_box(lat, lng, *box))
+    assert len(lat) - 1 not in result
+    assert len(lat) - 1 in grid.query_box(edge_lat, edge_lat + 0.01, edge_lng, edge_lng + 0.01)
+
+    # NOTE 2. 맞닿은 사각형들로 영역을 나누면 모든 점이 정확히 한 번씩 나온다.
+    lat_edges = np.linspace(37.50, 37.60 + 1e-9, 7)
+    lng_edges = np.linspace(126.95, 127.05 + 1e-9, 5)
+    boxes = [(lat_edges[i], lat_edges[i + 1], lng_edges[j], lng_edges[j + 1])
+             for i in range(len(lat_edges) - 1) for j in range(len(lng_edges) - 1)]
+    tiles = [grid.query_box(*box) for box in boxes]
+    for box, tile in zip(boxes, tiles):
+        np.testing.assert_array_equal(tile, _brute_box(lat, lng, *box))
+    np.testing.assert_array_equal(np.sort(np.concatenate(tiles)), np.arange(len(lat)))
+
+
+def test_query_outside_the_grid():
+    lat, lng = _points(count=100)
+    grid = SpatialGrid(lat, lng, CELL_M)
+
+    # NOTE 1. 점이 하나도 없는 먼 곳은 빈 결과
+    assert len(grid.query(35.1, 129.0, 1000.0)) == 0
+    assert len(grid.query_box(35.0, 35.2, 128.9, 129.1)) == 0
+
+
+def test_empty_grid():
+    grid = SpatialGrid(np.empty(0), np.empty(0), CELL_M)
+
+    assert len(grid) == 0
+    assert len(grid.query(37.55, 127.0, 1000.0)) == 0
+    assert len(grid.query_box(37.5, 37.6, 126.9, 127.1)) == 0
+
+
+def test_restored_grid_returns_same_results():
+    lat, lng = _points(count=1000)
+    grid = SpatialGrid(lat, lng, CELL_M)
+
+    # NOTE 1. to_arrays → from_arrays로 복원한 인덱스는 원본과 같은 결과를 낸다.
+    restored = SpatialGrid.from_arrays(lat, lng, grid.to_arrays())
+    assert restored.cell_m == grid.cell_m
+    for center_lat, center_lon, radius_m in [(37.55, 127.0, 100.0), (37.52, 126.97, 900.0), (float(lat[-1]), float(lng[-1]), 250.0)]:
+        np.testing.assert_array_equal(restored.query(center_lat, center_lon, radius_m), grid.query(center_lat, center_lon, radius_m))
+    np.testing.assert_array_equal(restored.query_box(37.51, 37.58, 126.96, 127.02), grid.query_box(37.51, 37.58, 126.96, 127.02))
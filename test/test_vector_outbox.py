@@ -0,0 +1,113 @@
+# test/test_vector_outbox.py
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.internal.outbox.vector_outbox import VectorOutbox
+from app.internal.outbox.vector_outbox_worker import VectorOutboxWorker
+
+ROUTES_API = "/api/v1/routes"
+SECTIONS_API = "/api/v1/sections"
+
+
+def _mk_route_payload():
+    return {
+        "title": f"테스트루트-{uuid4().hex[:6]}",
+        "description": "테스트용 경로",
+        "distance": 5000,
+        "high_height": 123.4,
+        "low_height": 12.3,
+    }
+
+
+def _outbox_operations(db_session, route_id: int):
+    stmt = (
+        select(VectorOutbox.operation)
+        .where(VectorOutbox.entity_type == "route", VectorOutbox.entity_id == route_id)
+        .order_by(VectorOutbox.outbox_id.asc())
+    )
+    return list(db_session.execute(stmt).scalars().all())
+
+
+def test_route_changes_are_recorded_in_outbox(client, db_session):
+    # NOTE 1. 생성 → upsert
+    res = client.post(ROUTES_API, json=_mk_route_payload())
+    assert res.status_code == 201
+    route_id = res.json()["data"]["route_id"]
+    assert _outbox_operations(db_session, route_id) == ["upsert"]
+
+    # NOTE 2. 섹션 생성 → 소속 경로 upsert
+    res = client.post(SECTIONS_API, json={"route_id": route_id, "distance": 100, "slope": 3})
+    assert res.status_code == 201
+    assert _outbox_operations(db_session, route_id) == ["upsert", "upsert"]
+
+    # NOTE 3. 삭제 → delete
+    res = client.delete(f"{ROUTES_API}/{route_id}")
+    assert res.status_code == 200
+    assert _outbox_operations(db_session, route_id)[-1] == "delete"
+
+
+def test_outbox_not_recorded_on_failure(client, db_session):
+    # 존재하지 않는 경로 삭제는 outbox에 남지 않는다.
+    res = client.delete(f"{ROUTES_API}/999999999")
+    assert res.status_code == 400
+    assert _outbox_operations(db_session, 999999999) == []
+
+
+def test_worker_records_failure_when_handler_raises_db_error(db_session):
+    # NOTE 1. 실패하는 entity_type과 성공하는 entity_type을 한 배치에 넣는다.
+    failing = VectorOutbox(entity_type="test_failing", entity_id=1, operation="upsert")
+    passing = VectorOutbox(entity_type="test_passing", entity_id=2, operation="upsert")
+    db_session.add_all([failing, passing])
+    db_session.commit()
+
+    def broken_handler(database, upsert_ids, delete_ids):
+        database.execute(text("SELECT * FROM no_such_table"))  # 트랜잭션을 aborted 상태로 만드는 DB 오류
+
+    synced = []
+    handlers = {
+        "test_failing": broken_handler,
+        "test_passing": lambda database, upsert_ids, delete_ids: synced.extend(upsert_ids),
+    }
+    # 워커 세션도 테스트 트랜잭션 안(savepoint)에서 동작하도록 같은 connection에 묶는다.
+    session_factory = sessionmaker(bind=db_session.connection(), join_transaction_mode="create_savepoint",
+                                   expire_on_commit=False)
+    worker = VectorOutboxWorker(session_factory=session_factory, handlers=handlers, max_attempts=2)
+
+    # NOTE 2. 실패는 attempts/last_error로 기록되고, 같은 배치의 다른 entity_type은 처리된다.
+    assert worker.run_once() >= 2
+    db_session.expire_all()
+    assert (failing.attempts, failing.processed_at) == (1, None)
+    assert "no_such_table" in failing.last_error
+    assert passing.processed_at is not None
+    assert synced == [2]
+
+    # NOTE 3. max_attempts에 도달하면 더 이상 꺼내지 않는다.
+    worker.run_once()
+    db_session.expire_all()
+    assert failing.attempts == 2
+    worker.run_once()
+    db_session.expire_all()
+    assert failing.attempts == 2
+
+
+def test_worker_purges_processed_rows_after_retention(db_session):
+    now = datetime.now(timezone.utc)
+    expired = VectorOutbox(entity_type="test_purge", entity_id=1, operation="upsert", processed_at=now - timedelta(days=2))
+    recent = VectorOutbox(entity_type="test_purge", entity_id=2, operation="upsert", processed_at=now)
+    pending = VectorOutbox(entity_type="test_purge", entity_id=3, operation="upsert")
+    db_session.add_all([expired, recent, pending])
+    db_session.commit()
+    ids = [expired.outbox_id, recent.outbox_id, pending.outbox_id]
+
+    session_factory = sessionmaker(bind=db_session.connection(), join_transaction_mode="create_savepoint",
+                                   expire_on_commit=False)
+    worker = VectorOutboxWorker(session_factory=session_factory, handlers={}, batch_size=1, retention_seconds=3600)
+
+    # NOTE 1. 보관 기간이 지난 처리 완료 행만 지우고, 최근 처리 행과 미처리 행은 남긴다.
+    assert worker.purge_processed() >= 1
+    db_session.expire_all()
+    remaining = db_session.execute(select(VectorOutbox.outbox_id).where(VectorOutbox.outbox_id.in_(ids))).scalars().all()
+    assert sorted(remaining) == [recent.outbox_id, pending.outbox_id]